@@ -1,22 +1,40 @@
 import os
+import atexit
+import copy
+import cProfile
+import hashlib
+import hmac
 import json
+import random
 import re
+import shutil
 import sqlite3
+import threading
 import time
-from math import ceil
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from math import ceil, log, log2, sqrt
 from html import unescape
 from urllib.error import URLError
-from urllib.parse import urlencode, urljoin
+from urllib.parse import urlencode, urljoin, urlsplit
 from urllib.request import Request, urlopen
 
-from flask import Flask, flash, jsonify, redirect, render_template, request, url_for
+from flask import Flask, flash, g, jsonify, redirect, render_template, request, session, url_for
+from markupsafe import Markup
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the similar-laptops rebuild falls back to a Python loop.
+    np = None
 
 app = Flask(__name__)
 app.config["SECRET_KEY"] = os.getenv("FLASK_SECRET_KEY", "dev-secret-key-change-me")
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
-HP_DB_PATH = os.path.join(DATA_DIR, "hp_laptops_india.db")
+HP_DB_PATH = os.getenv("HP_DB_PATH", os.path.join(DATA_DIR, "hp_laptops_india.db"))
 HP_SCHEMA_PATH = os.path.join(DATA_DIR, "hp_laptops_schema.sql")
 HP_SNAPSHOT_PATH = os.path.join(DATA_DIR, "hp_gaming_catalog_snapshot.json")
 HP_LEGACY_SNAPSHOT_PATHS = [os.path.join(DATA_DIR, "hp_omen_catalog_snapshot.json")]
@@ -24,9 +42,45 @@ LENOVO_CUSTOMIZATION_CACHE_PATH = os.path.join(DATA_DIR, "lenovo_customization_c
 LENOVO_CUSTOMIZATION_CACHE_TTL_SECONDS = 60 * 60 * 24
 LENOVO_CUSTOMIZATION_CACHE_VERSION = 2
 HP_REGION = "India"
+CATALOG_INIT_ON_IMPORT = os.getenv("CATALOG_INIT_ON_IMPORT", "1").strip().lower() in {"1", "true", "yes", "on"}
+SCRAPER_ORIGIN_OVERRIDE = os.getenv("SCRAPER_ORIGIN_OVERRIDE", "").strip().rstrip("/")
+STAGE_TIMING_ENABLED = os.getenv("STAGE_TIMING", "0").strip().lower() in {"1", "true", "yes", "on"}
+STAGE_TIMING_WINDOW = 2048
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(DATA_DIR, "profiles"))
+PROFILE_HEADER_TOKEN = os.getenv("PROFILE_HEADER_TOKEN", "").strip()
+try:
+    PROFILE_SAMPLE_RATE = min(1.0, max(0.0, float(os.getenv("PROFILE_SAMPLE_RATE", "0"))))
+except ValueError:
+    PROFILE_SAMPLE_RATE = 0.0
+try:
+    PAGE_CACHE_MAX_BYTES = max(0, int(os.getenv("PAGE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))))
+except ValueError:
+    PAGE_CACHE_MAX_BYTES = 0
+PAGE_CACHE_DIR = os.getenv("PAGE_CACHE_DIR", "").strip()
+try:
+    PAGE_CACHE_DIR_MAX_BYTES = max(0, int(os.getenv("PAGE_CACHE_DIR_MAX_BYTES", str(256 * 1024 * 1024))))
+except ValueError:
+    PAGE_CACHE_DIR_MAX_BYTES = 0
+# The disk store is swept back under its budget once every this many writes.
+PAGE_CACHE_DIR_SWEEP_EVERY = 256
+PAGE_CACHE_ENDPOINTS = {"home", "benchmarks", "laptops", "product_detail"}
+# Catalog and review-stats versions are re-read at most this often; this process's own writes apply at once.
+CATALOG_META_TTL_SECONDS = 1.0
+METRICS_DIR = os.getenv("METRICS_DIR", os.path.join(DATA_DIR, "metrics"))
+METRICS_FLUSH_SECONDS = 5
+# Scripts that import the app (refresh, benchmarks) set METRICS_FLUSH=0 so their counters stay out of /metrics.
+METRICS_FLUSH_ENABLED = os.getenv("METRICS_FLUSH", "1").strip().lower() in {"1", "true", "yes", "on"}
 DEFAULT_REVIEW_STATUS = os.getenv("DEFAULT_REVIEW_STATUS", "approved").strip().lower() or "approved"
 if DEFAULT_REVIEW_STATUS not in {"approved", "pending"}:
     DEFAULT_REVIEW_STATUS = "approved"
+REVIEW_QUEUE_ENABLED = os.getenv("REVIEW_QUEUE", "1").strip().lower() in {"1", "true", "yes", "on"}
+REVIEW_QUEUE_PATH = os.getenv("REVIEW_QUEUE_PATH", os.path.join(DATA_DIR, "review_queue.db"))
+REVIEW_QUEUE_FLUSH_SECONDS = 1.0
+MODERATION_TOKEN = os.getenv("MODERATION_TOKEN", "").strip()
+REVIEW_STATUSES = ("approved", "pending", "rejected")
+MODERATION_MAX_IDS = 100000
+MODERATION_PAGE_SIZE = 200
+REVIEW_QUEUE_BATCH_SIZE = 500
 HP_OMEN_LISTING_URL = "https://www.hp.com/in-en/shop/laptops/personal-laptops/omen-laptops.html"
 HP_VICTUS_LISTING_URL = "https://www.hp.com/in-en/shop/laptops/personal-laptops/victus-laptops.html"
 HP_GAMING_LISTING_SOURCES = [
@@ -1581,18 +1635,98 @@ FINDER_EXTRA_OPTIONS = [
     ("extra_ssd_slot", "Extra SSD slot"),
     ("backlit_keyboard", "Backlit keyboard"),
 ]
+# Configurator category labels (mostly Dell) that _normalize_lenovo_category does not know.
+CONFIGURATION_CATEGORY_ALIASES = {
+    "Solid State Drive": "Storage",
+    "Support Services": "Warranty & Protection",
+    "Microsoft Productivity Software": "Software",
+}
 FINDER_SORT_OPTIONS = [
     ("recommended", "Recommended"),
     ("price_asc", "Price: Low to High"),
     ("price_desc", "Price: High to Low"),
     ("rating_desc", "Rating"),
+    ("community_desc", "Community rating"),
     ("battery_desc", "Battery life"),
     ("weight_asc", "Weight: Lightest"),
 ]
+# ORDER BY terms of the finder sorts. recommended has no use-case match key: with a use case selected every
+# match has it, and without one none does.
+FINDER_SQL_ORDER_BY = {
+    "recommended": "rating DESC, battery_hours DESC, price_inr ASC",
+    "price_asc": "price_inr ASC, rating DESC",
+    "price_desc": "price_inr DESC, rating DESC",
+    "rating_desc": "rating DESC, price_inr ASC",
+    "community_desc": "COALESCE(community_rating, 0) DESC, COALESCE(community_review_count, 0) DESC, rating DESC",
+    "battery_desc": "battery_hours DESC, rating DESC",
+    "weight_asc": "weight_kg ASC, rating DESC",
+}
 FINDER_PER_PAGE_OPTIONS = [12, 24, 48, 60, 120]
 FINDER_DEFAULT_PER_PAGE = 120
+CONFIGURE_CACHE_SIZE = 4096
+FINDER_COUNT_CACHE_SIZE = 1024
+COMPARE_CACHE_SIZE = 1024
+REVIEWS_PAGE_SIZE = 10
+REVIEWS_MAX_PAGE_SIZE = 50
+COMPARE_FIELDS = [
+    ("price", "Price (INR)", "lower"),
+    ("rating", "Rating", "higher"),
+    ("cpu_model", "CPU", None),
+    ("cpu_tier", "CPU tier", None),
+    ("gpu_model", "GPU", None),
+    ("ram_gb", "RAM (GB)", "higher"),
+    ("storage_gb", "Storage (GB)", "higher"),
+    ("screen_size", "Screen (in)", None),
+    ("resolution", "Resolution", None),
+    ("refresh_hz", "Refresh (Hz)", "higher"),
+    ("panel", "Panel", None),
+    ("weight_kg", "Weight (kg)", "lower"),
+    ("battery_hours", "Battery (h)", "higher"),
+    ("battery_capacity_wh", "Battery (Wh)", "higher"),
+    ("ports", "Ports", None),
+]
+SIMILAR_TOP_K = 8
+# Neighbours are searched among the products closest in price on either side, one block of rows at a time.
+SIMILAR_CANDIDATE_WINDOW = 512
+SIMILAR_BLOCK_SIZE = 256
+# Product count from which the numpy distance blocks beat the Python loop: 0.5x at 3 rows, 1.0x at 5,
+# 1.5-2.3x at 8 and over 6x from 30 (top-k over random feature vectors, best of 30 runs).
+SIMILAR_VECTOR_MIN_ITEMS = 8
+SIMILAR_CPU_TIER_RANKS = {"i5": 0, "Ryzen 5": 0, "i7": 1, "Ryzen 7": 1, "Ultra 7": 1.5, "i9": 2, "Ryzen 9": 2, "Ultra 9": 2.5}
+SIMILAR_FEATURE_WEIGHTS = [
+    ("price", 3.0),
+    ("cpu_tier", 1.5),
+    ("gpu", 3.0),
+    ("ram_gb", 1.0),
+    ("storage_gb", 0.75),
+    ("screen_size", 1.0),
+    ("refresh_hz", 0.75),
+    ("weight_kg", 1.0),
+    ("battery_hours", 0.75),
+] + [(key, 0.25) for key, _ in FINDER_EXTRA_OPTIONS]
+FINDER_CARD_TEMPLATE = "_finder_card.html"
+FINDER_CARD_CACHE_SIZE = max(0, int(os.getenv("FINDER_CARD_CACHE_SIZE", "4096") or 0))
+SUGGEST_DEFAULT_LIMIT = 8
+SUGGEST_MAX_LIMIT = 20
+SUGGEST_KIND_ORDER = ["series", "gpu", "cpu", "model"]
 FINDER_CPU_TIER_SET = {tier for tiers in FINDER_CPU_TIERS.values() for tier in tiers}
 FINDER_SORT_LABELS = {key: label for key, label in FINDER_SORT_OPTIONS}
+PRODUCT_EXTRA_KEYS = tuple(key for key, _ in FINDER_EXTRA_OPTIONS)
+FINDER_OPTION_COLUMNS = (
+    "brand",
+    "series",
+    "series_flags",
+    "use_cases_json",
+    "cpu_brand",
+    "cpu_tier",
+    "ram_gb",
+    "storage_type",
+    "gpu_type",
+    "screen_bucket",
+    "weight_bucket",
+    "battery_bucket",
+    "ports_json",
+) + PRODUCT_EXTRA_KEYS
 FINDER_TEMPLATE_OPTIONS = {
     "use_cases": [(value, value.title()) for value in FINDER_USE_CASES],
     "brands": FINDER_BRANDS,
@@ -2164,6 +2298,24 @@ def _series_matches_filter(series_name, selected_values):
     return False
 
 
+def _product_facet_columns(item):
+    # Derived once at ingest; panel and series keep one bit per finder choice the product matches.
+    return {
+        "screen_bucket": _screen_bucket(float(item["screen_size"] or 0)),
+        "weight_bucket": _weight_bucket(float(item["weight_kg"] or 0)),
+        "battery_bucket": _battery_bucket(float(item["battery_hours"] or 0)),
+        "refresh_bucket": _refresh_bucket(int(item["refresh_hz"] or 0)),
+        "resolution_class": _normalize_resolution(item["resolution"]),
+        "panel_flags": _flag_bits([panel for panel in FINDER_PANELS if _panel_matches_filter(item["panel"], [panel])], FINDER_PANELS),
+        "series_flags": _flag_bits(
+            [series for series in FINDER_SERIES_OPTIONS if _series_matches_filter(item["series"], [series])],
+            FINDER_SERIES_OPTIONS,
+        ),
+        "use_case_flags": _flag_bits(item.get("use_cases") or [], FINDER_USE_CASES),
+        "port_flags": _flag_bits(item.get("ports") or [], FINDER_PORT_OPTIONS),
+    }
+
+
 def _ordered_options(values, preferred_order):
     value_set = {value for value in values if value not in (None, "")}
     preferred = list(preferred_order or [])
@@ -2185,7 +2337,8 @@ def _build_finder_options(catalog, filters):
 
     scoped_catalog = list(brand_scoped)
     if selected_series:
-        narrowed = [item for item in scoped_catalog if _series_matches_filter(item["series"], selected_series)]
+        series_bits = _flag_bits(selected_series, FINDER_SERIES_OPTIONS)
+        narrowed = [item for item in scoped_catalog if item["series_flags"] & series_bits]
         if narrowed:
             scoped_catalog = narrowed
 
@@ -2250,18 +2403,18 @@ def _build_finder_options(catalog, filters):
     )
     gpu_models = list(FINDER_GPU_MODELS)
     screen_buckets = _ordered_options(
-        {_screen_bucket(item["screen_size"]) for item in scoped_catalog}.union(set(filters.get("screen_bucket", []))),
+        {item["screen_bucket"] for item in scoped_catalog}.union(set(filters.get("screen_bucket", []))),
         FINDER_SCREEN_BUCKETS,
     )
     resolutions = list(FINDER_RESOLUTIONS)
     refresh_options = list(FINDER_REFRESH_OPTIONS)
     panels = list(FINDER_PANELS)
     weight_buckets = _ordered_options(
-        {_weight_bucket(item["weight_kg"]) for item in scoped_catalog}.union(set(filters.get("weight_bucket", []))),
+        {item["weight_bucket"] for item in scoped_catalog}.union(set(filters.get("weight_bucket", []))),
         FINDER_WEIGHT_BUCKETS,
     )
     battery_buckets = _ordered_options(
-        {_battery_bucket(item["battery_hours"]) for item in scoped_catalog}.union(set(filters.get("battery_bucket", []))),
+        {item["battery_bucket"] for item in scoped_catalog}.union(set(filters.get("battery_bucket", []))),
         FINDER_BATTERY_BUCKETS,
     )
     ports = _ordered_options(
@@ -2269,7 +2422,13 @@ def _build_finder_options(catalog, filters):
         FINDER_PORT_OPTIONS,
     )
 
-    catalog_prices = [int(item.get("price") or 0) for item in all_catalog if int(item.get("price") or 0) > 0]
+    # Entries of the finder option summary stand for several products and span price..price_max.
+    catalog_prices = [
+        int(price or 0)
+        for item in all_catalog
+        for price in (item.get("price"), item.get("price_max"))
+        if int(price or 0) > 0
+    ]
     if catalog_prices:
         price_min_bound = (min(catalog_prices) // 1000) * 1000
         price_max_bound = int(ceil(max(catalog_prices) / 1000.0) * 1000)
@@ -2310,6 +2469,8 @@ def _build_finder_options(catalog, filters):
         "weight_buckets": weight_buckets or list(FINDER_WEIGHT_BUCKETS),
         "battery_buckets": battery_buckets or list(FINDER_BATTERY_BUCKETS),
         "ports": ports or list(FINDER_PORT_OPTIONS),
+        "config_ram_options": list(FINDER_RAM_OPTIONS),
+        "config_gpu_models": list(FINDER_GPU_MODELS),
         "price_bounds": {
             "min": price_min_bound,
             "max": price_max_bound,
@@ -2363,6 +2524,10 @@ def _finder_query_map_from_filters(filters, include_page=True):
         params["battery_bucket"] = filters["battery_bucket"]
     if filters["port"]:
         params["port"] = filters["port"]
+    if filters["config_ram"]:
+        params["config_ram"] = [str(value) for value in filters["config_ram"]]
+    if filters["config_gpu"]:
+        params["config_gpu"] = filters["config_gpu"]
 
     for extra_key, _ in FINDER_EXTRA_OPTIONS:
         if filters[extra_key]:
@@ -2453,6 +2618,8 @@ def _parse_finder_filters(args):
         "weight_bucket": _normalize_choices(args.getlist("weight_bucket"), FINDER_WEIGHT_BUCKETS),
         "battery_bucket": _normalize_choices(args.getlist("battery_bucket"), FINDER_BATTERY_BUCKETS),
         "port": _normalize_choices(args.getlist("port"), FINDER_PORT_OPTIONS),
+        "config_ram": _normalize_int_choices(args.getlist("config_ram"), FINDER_RAM_OPTIONS),
+        "config_gpu": _normalize_choices(args.getlist("config_gpu"), FINDER_GPU_MODELS),
     }
 
     if filters["storage_min"] not in FINDER_STORAGE_MIN_OPTIONS:
@@ -2471,81 +2638,320 @@ def _parse_finder_filters(args):
     return filters
 
 
-def _matches_finder_filters(laptop, filters):
+def _flag_bits(values, options):
+    bit_by_value = {value: 1 << index for index, value in enumerate(options)}
+    bits = 0
+    for value in values:
+        bits |= bit_by_value.get(value, 0)
+    return bits
+
+
+_CATALOG_CACHES = {}
+
+
+def _catalog_cached(name, catalog_version, build):
+    # One derived structure per name, rebuilt whenever the seeded catalog version changes.
+    cached = _CATALOG_CACHES.get(name)
+    if cached is None or cached[0] != catalog_version:
+        cached = (catalog_version, build())
+        _CATALOG_CACHES[name] = cached
+    return cached[1]
+
+
+_FINDER_CARD_CACHE = {"generation": None, "cards": OrderedDict()}
+_FINDER_CARD_TEMPLATE_HASHES = {}
+_FINDER_CARD_LOCK = threading.Lock()
+
+
+def _finder_card_template():
+    template = app.jinja_env.get_template(FINDER_CARD_TEMPLATE)
+    template_hash = _FINDER_CARD_TEMPLATE_HASHES.get(template)
+    if template_hash is None:
+        source, _, _ = app.jinja_env.loader.get_source(app.jinja_env, FINDER_CARD_TEMPLATE)
+        template_hash = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+        _FINDER_CARD_TEMPLATE_HASHES.clear()
+        _FINDER_CARD_TEMPLATE_HASHES[template] = template_hash
+    return template, template_hash
+
+
+def _render_finder_cards(laptops, catalog_version):
+    template, template_hash = _finder_card_template()
+    if not FINDER_CARD_CACHE_SIZE:
+        return [Markup(template.render(laptop=laptop)) for laptop in laptops]
+
+    # Card markup depends only on the product row and the card template, so entries live for one
+    # (catalog version, template hash) generation; a reseed or template edit drops them all.
+    generation = (catalog_version, template_hash)
+    with _FINDER_CARD_LOCK:
+        cards = _FINDER_CARD_CACHE["cards"]
+        if _FINDER_CARD_CACHE["generation"] != generation:
+            _FINDER_CARD_CACHE["generation"] = generation
+            cards.clear()
+        rendered = []
+        for laptop in laptops:
+            card = cards.get(laptop["id"])
+            if card is not None:
+                cards.move_to_end(laptop["id"])
+            rendered.append(card)
+
+    missing = [index for index, card in enumerate(rendered) if card is None]
+    for index in missing:
+        rendered[index] = Markup(template.render(laptop=laptops[index]))
+    _metric_inc("laptop_finder_card_cache_total", (("result", "hit"),), len(rendered) - len(missing))
+    _metric_inc("laptop_finder_card_cache_total", (("result", "miss"),), len(missing))
+
+    if missing:
+        with _FINDER_CARD_LOCK:
+            if _FINDER_CARD_CACHE["generation"] == generation:
+                cards = _FINDER_CARD_CACHE["cards"]
+                for index in missing:
+                    cards[laptops[index]["id"]] = rendered[index]
+                while len(cards) > FINDER_CARD_CACHE_SIZE:
+                    cards.popitem(last=False)
+    return rendered
+
+
+def _finder_sql_query(filters, rank_search=False):
+    # The finder filters as FROM/WHERE over the products table, with their parameters.
+    source = "products"
+    clauses = []
+    params = []
+
+    def any_of(column, values):
+        values = list(values)
+        if len(values) == 1:
+            # A bound equality lets the planner search the column's index directly.
+            clauses.append(f"{column} = ?")
+            params.append(values[0])
+            return
+        clauses.append(f"{column} IN (SELECT value FROM json_each(?))")
+        params.append(_json_dumps(values))
+
+    def any_flag(column, values, options):
+        clauses.append(f"({column} & ?) != 0")
+        params.append(_flag_bits(values, options))
+
     if filters["q"]:
-        needle = filters["q"].lower()
-        haystack = f"{laptop['brand']} {laptop['model']}".lower()
-        if needle not in haystack:
-            return False
+        match_expression = _finder_search_expression(filters["q"])
+        if rank_search and _finder_relevance_ranked(filters):
+            # bm25 is lower-is-better; rounding lets near-identical matches fall back to the finder ordering.
+            # SQLite keeps only the requested page while it ranks, so no rank map reaches Python.
+            source = (
+                "products JOIN (SELECT rowid AS product_id, "
+                "round(bm25(products_search, 2.0, 3.0, 4.0, 2.0, 1.0, 1.5, 1.0), 3) AS search_rank "
+                "FROM products_search WHERE products_search MATCH ?) AS search ON search.product_id = products.id"
+            )
+            params.append(match_expression)
+        elif match_expression:
+            # Only the relevance order needs ranks; counts and other sorts let FTS5 filter in place.
+            clauses.append("products.id IN (SELECT rowid FROM products_search WHERE products_search MATCH ?)")
+            params.append(match_expression)
+        else:
+            clauses.append("instr(lower(brand || ' ' || model), ?) > 0")
+            params.append(filters["q"].lower())
+    if filters["use_case"]:
+        any_flag("use_case_flags", [filters["use_case"]], FINDER_USE_CASES)
+    if filters["brand"]:
+        any_of("brand", filters["brand"])
+    if filters["series"]:
+        any_flag("series_flags", filters["series"], FINDER_SERIES_OPTIONS)
+    if filters["min_price"] is not None:
+        clauses.append("price_inr >= ?")
+        params.append(filters["min_price"])
+    if filters["max_price"] is not None:
+        clauses.append("price_inr <= ?")
+        params.append(filters["max_price"])
+    if filters["cpu_brand"]:
+        clauses.append("cpu_brand = ?")
+        params.append(filters["cpu_brand"])
+    if filters["cpu_tier"]:
+        any_of("cpu_tier", filters["cpu_tier"])
+    if filters["ram"]:
+        any_of("ram_gb", filters["ram"])
+    if filters["storage_type"]:
+        any_of("storage_type", filters["storage_type"])
+    if filters["storage_min"] is not None:
+        clauses.append("storage_gb >= ?")
+        params.append(filters["storage_min"])
+    if filters["gpu_type"]:
+        clauses.append("gpu_type = ?")
+        params.append(filters["gpu_type"])
+    if filters["gpu_model"]:
+        any_of("gpu_model", filters["gpu_model"])
+    if filters["screen_bucket"]:
+        any_of("screen_bucket", filters["screen_bucket"])
+    if filters["resolution"]:
+        any_of("resolution_class", sorted({_normalize_resolution(value) for value in filters["resolution"]}))
+    if filters["refresh"]:
+        any_of("refresh_bucket", filters["refresh"])
+    if filters["panel"]:
+        any_flag("panel_flags", filters["panel"], FINDER_PANELS)
+    if filters["weight_bucket"]:
+        any_of("weight_bucket", filters["weight_bucket"])
+    if filters["battery_bucket"]:
+        any_of("battery_bucket", filters["battery_bucket"])
+    if filters["port"]:
+        required_ports = _flag_bits(filters["port"], FINDER_PORT_OPTIONS)
+        clauses.append("(port_flags & ?) = ?")
+        params.extend([required_ports, required_ports])
+    configurable_query = _configurable_product_query(filters)
+    if configurable_query is not None:
+        clauses.append(f"products.id IN ({configurable_query[0]})")
+        params.extend(configurable_query[1])
+    for extra_key in PRODUCT_EXTRA_KEYS:
+        if filters[extra_key]:
+            clauses.append(f"{extra_key} != 0")
 
-    if filters["use_case"] and filters["use_case"] not in laptop["use_cases"]:
-        return False
-    if filters["brand"] and laptop["brand"] not in filters["brand"]:
-        return False
-    if filters["series"] and not _series_matches_filter(laptop["series"], filters["series"]):
-        return False
-    if filters["min_price"] is not None and laptop["price"] < filters["min_price"]:
-        return False
-    if filters["max_price"] is not None and laptop["price"] > filters["max_price"]:
-        return False
-    if filters["cpu_brand"] and laptop["cpu_brand"] != filters["cpu_brand"]:
-        return False
-    if filters["cpu_tier"] and laptop["cpu_tier"] not in filters["cpu_tier"]:
-        return False
-    if filters["ram"] and laptop["ram_gb"] not in filters["ram"]:
-        return False
-    if filters["storage_type"] and laptop["storage_type"] not in filters["storage_type"]:
-        return False
-    if filters["storage_min"] is not None and laptop["storage_gb"] < filters["storage_min"]:
-        return False
-    if filters["gpu_type"] and laptop["gpu_type"] != filters["gpu_type"]:
-        return False
-    if filters["gpu_model"] and laptop["gpu_model"] not in filters["gpu_model"]:
-        return False
-    if filters["screen_bucket"] and _screen_bucket(laptop["screen_size"]) not in filters["screen_bucket"]:
-        return False
-    if filters["resolution"] and not _resolution_matches_filter(laptop["resolution"], filters["resolution"]):
-        return False
-    if filters["refresh"] and _refresh_bucket(laptop["refresh_hz"]) not in filters["refresh"]:
-        return False
-    if filters["panel"] and not _panel_matches_filter(laptop["panel"], filters["panel"]):
-        return False
-    if filters["weight_bucket"] and _weight_bucket(laptop["weight_kg"]) not in filters["weight_bucket"]:
-        return False
-    if filters["battery_bucket"] and _battery_bucket(laptop["battery_hours"]) not in filters["battery_bucket"]:
-        return False
-    if filters["port"] and not all(port in laptop["ports"] for port in filters["port"]):
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return source, where, params
+
+
+def _finder_relevance_ranked(filters):
+    # Text searches under the recommended sort rank by relevance first, when the FTS5 index can score them.
+    if not filters["q"] or filters["sort"] in FINDER_SQL_ORDER_BY.keys() - {"recommended"}:
         return False
+    return _finder_search_expression(filters["q"]) is not None
+
+
+def _finder_sql_order(filters, rank_search=False):
+    # The ORDER BY for a finder sort, closed by the rowid so that every sort but
+    # community_desc matches one of the idx_products_order_* indexes column for column.
+    sort_key = filters["sort"] if filters["sort"] in FINDER_SQL_ORDER_BY else "recommended"
+    order_by = f"{FINDER_SQL_ORDER_BY[sort_key]}, products.id ASC"
+    if rank_search and _finder_relevance_ranked(filters):
+        # The recommended order breaks relevance ties.
+        order_by = f"search.search_rank ASC, {order_by}"
+    return order_by
+
+
+_FINDER_COUNT_CACHE = OrderedDict()
+_FINDER_COUNT_CACHE_LOCK = threading.Lock()
+
+
+def _count_finder_matches(query, finder_version):
+    # The count depends only on the filters, so paging through or re-sorting a result set reuses it.
+    # Searches key on their match expression, never on a rank map, so entries stay small.
+    source, where, params = query
+    key = (finder_version, source, where, tuple(params))
+    with _FINDER_COUNT_CACHE_LOCK:
+        total = _FINDER_COUNT_CACHE.get(key)
+        if total is not None:
+            _FINDER_COUNT_CACHE.move_to_end(key)
+            return total
+    with _db_connect() as connection:
+        total = connection.execute(f"SELECT COUNT(*) FROM {source}{where}", params).fetchone()[0]
+    with _FINDER_COUNT_CACHE_LOCK:
+        _FINDER_COUNT_CACHE[key] = total
+        while len(_FINDER_COUNT_CACHE) > FINDER_COUNT_CACHE_SIZE:
+            _FINDER_COUNT_CACHE.popitem(last=False)
+    return total
 
-    for extra_key, _ in FINDER_EXTRA_OPTIONS:
-        if filters[extra_key] and not laptop.get(extra_key, False):
-            return False
 
-    return True
+def _fetch_finder_matches(query, order_by, limit=-1, offset=0):
+    source, where, params = query
+    with _db_connect() as connection:
+        rows = connection.execute(
+            f"SELECT {PRODUCT_LIST_COLUMNS} FROM {source}{where} ORDER BY {order_by} LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        ).fetchall()
+    return [_row_to_product(row) for row in rows]
 
 
-def _sort_finder_laptops(laptops, sort_key, use_case):
-    if sort_key == "price_asc":
-        return sorted(laptops, key=lambda item: (item["price"], -item["rating"]))
-    if sort_key == "price_desc":
-        return sorted(laptops, key=lambda item: (item["price"], item["rating"]), reverse=True)
-    if sort_key == "rating_desc":
-        return sorted(laptops, key=lambda item: (item["rating"], -item["price"]), reverse=True)
-    if sort_key == "battery_desc":
-        return sorted(laptops, key=lambda item: (item["battery_hours"], item["rating"]), reverse=True)
-    if sort_key == "weight_asc":
-        return sorted(laptops, key=lambda item: (item["weight_kg"], -item["rating"]))
-
-    return sorted(
-        laptops,
-        key=lambda item: (
-            1 if use_case and use_case in item["use_cases"] else 0,
-            item["rating"],
-            item["battery_hours"],
-            -item["price"],
-        ),
-        reverse=True,
-    )
+def _query_finder_page(filters, finder_version=""):
+    # Filters, counts and pages in SQL, so only the rows of the requested page are decoded.
+    # Pages past the end clamp to the last one; returns (total, page, products).
+    per_page = filters["per_page"]
+    total = _count_finder_matches(_finder_sql_query(filters), finder_version)
+    page = min(filters["page"], max(1, ceil(total / per_page)))
+    query = _finder_sql_query(filters, rank_search=True)
+    products = _fetch_finder_matches(query, _finder_sql_order(filters, rank_search=True), per_page, (page - 1) * per_page)
+    return total, page, products
+
+
+def _fetch_finder_option_summary():
+    # _build_finder_options reads only these columns, so it gets one entry per distinct combination of
+    # them, carrying the price range it covers, instead of the decoded catalog.
+    columns = ", ".join(FINDER_OPTION_COLUMNS)
+    with _db_connect() as connection:
+        rows = connection.execute(
+            f"""
+            SELECT {columns},
+                MIN(CASE WHEN price_inr > 0 THEN price_inr END) AS price,
+                MAX(price_inr) AS price_max
+            FROM products
+            GROUP BY {columns}
+            """
+        ).fetchall()
+    summary = []
+    for row in rows:
+        entry = dict(row)
+        entry["use_cases"] = _json_loads(row["use_cases_json"], [])
+        entry["ports"] = _json_loads(row["ports_json"], [])
+        summary.append(entry)
+    return summary
+
+
+def _suggestion_keys(label):
+    lowered = re.sub(r"\s+", " ", label.lower()).strip()
+    word_starts = [match.start() for match in re.finditer(r"[a-z0-9]+", lowered) if match.start() > 0]
+    return lowered, [lowered[start:] for start in word_starts]
+
+
+def _build_suggestion_index():
+    entries = []
+    for brand, series_list in FINDER_SERIES_BY_BRAND.items():
+        for series in series_list:
+            entries.append({"label": series, "kind": "series", "url": _finder_url({"brand": [brand], "series": [series]})})
+    for gpu_model in FINDER_GPU_MODELS:
+        entries.append({"label": gpu_model, "kind": "gpu", "url": _finder_url({"gpu_model": [gpu_model]})})
+
+    with _db_connect() as connection:
+        rows = connection.execute("SELECT id, brand, model, cpu_model FROM products ORDER BY id").fetchall()
+    for cpu_model in sorted({row["cpu_model"] for row in rows if row["cpu_model"]}):
+        entries.append({"label": cpu_model, "kind": "cpu", "url": _finder_url({"q": [cpu_model]})})
+    seen_models = set()
+    for row in rows:
+        label = f"{row['brand']} {row['model']}"
+        if label in seen_models:
+            continue
+        seen_models.add(label)
+        entries.append({"label": label, "kind": "model", "url": url_for("product_detail", product_id=row["id"])})
+
+    # Sorted key arrays searched with bisect: whole-label prefixes rank above word prefixes, then by kind.
+    buckets = {(word_match, kind): [] for word_match in (False, True) for kind in SUGGEST_KIND_ORDER}
+    for entry_index, entry in enumerate(entries):
+        label_key, word_keys = _suggestion_keys(entry["label"])
+        buckets[(False, entry["kind"])].append((label_key, entry_index))
+        for word_key in word_keys:
+            buckets[(True, entry["kind"])].append((word_key, entry_index))
+
+    ordered_buckets = []
+    for word_match in (False, True):
+        for kind in SUGGEST_KIND_ORDER:
+            pairs = sorted(buckets[(word_match, kind)])
+            ordered_buckets.append(([key for key, _ in pairs], [entry_index for _, entry_index in pairs]))
+    return {"entries": entries, "buckets": ordered_buckets}
+
+
+def _suggest_from_index(index, query, limit):
+    prefix = re.sub(r"\s+", " ", str(query or "").lower()).strip()
+    if not prefix:
+        return []
+
+    suggestions = []
+    seen = set()
+    for keys, entry_indexes in index["buckets"]:
+        position = bisect_left(keys, prefix)
+        while position < len(keys) and keys[position].startswith(prefix):
+            entry_index = entry_indexes[position]
+            position += 1
+            if entry_index in seen:
+                continue
+            seen.add(entry_index)
+            suggestions.append(index["entries"][entry_index])
+            if len(suggestions) >= limit:
+                return suggestions
+    return suggestions
 
 
 def _build_active_chips(filters, query_map):
@@ -2600,6 +3006,10 @@ def _build_active_chips(filters, query_map):
         add_chip(f"Battery: {value}", "battery_bucket", value)
     for value in filters["port"]:
         add_chip(f"Port: {value}", "port", value)
+    for value in filters["config_ram"]:
+        add_chip(f"Configurable to: {value}GB RAM", "config_ram", value)
+    for value in filters["config_gpu"]:
+        add_chip(f"Configurable to: {value}", "config_gpu", value)
     for extra_key, extra_label in FINDER_EXTRA_OPTIONS:
         if filters[extra_key]:
             add_chip(extra_label, extra_key)
@@ -2628,6 +3038,220 @@ def _parse_compare_ids(args):
     return parsed[:4]
 
 
+def _compare_row(key, label, better, values, display):
+    numeric = [value for value in values if isinstance(value, (int, float))]
+    winner_indexes = []
+    deltas = []
+    if better and numeric:
+        best = min(numeric) if better == "lower" else max(numeric)
+        deltas = [round(value - best, 2) if isinstance(value, (int, float)) else None for value in values]
+        if len(set(numeric)) > 1:
+            winner_indexes = [index for index, value in enumerate(values) if value == best]
+    return {
+        "key": key,
+        "label": label,
+        "better": better,
+        "values": values,
+        "display": display,
+        "differs": len(set(display)) > 1,
+        "winner_indexes": winner_indexes,
+        "deltas": deltas,
+    }
+
+
+def _benchmark_score(value):
+    if isinstance(value, (int, float)):
+        return value
+    return _to_int(str(value or "").replace(",", ""))
+
+
+def _compare_benchmark_rows(products):
+    games = {}
+    synthetic = {}
+    for index, product in enumerate(products):
+        benchmarks = product["benchmarks"] if isinstance(product["benchmarks"], dict) else {}
+        for game in benchmarks.get("games") or []:
+            if isinstance(game, dict) and game.get("title"):
+                games.setdefault(game["title"], [None] * len(products))[index] = game
+        for test in benchmarks.get("synthetic") or []:
+            if isinstance(test, dict) and test.get("name"):
+                synthetic.setdefault(test["name"], [None] * len(products))[index] = test
+
+    rows = []
+    for title, entries in games.items():
+        for resolution in ("1080p", "1440p"):
+            values = [_benchmark_score(entry.get(f"fps_{resolution}")) if entry else None for entry in entries]
+            display = [f"{value} fps ({entry.get('preset', '')})" if value is not None else "NA" for value, entry in zip(values, entries)]
+            rows.append(_compare_row(f"{title} {resolution}", f"{title} {resolution}", "higher", values, display))
+    for name, entries in synthetic.items():
+        values = [_benchmark_score(entry.get("score")) if entry else None for entry in entries]
+        display = [str(entry.get("score")) if entry else "NA" for entry in entries]
+        rows.append(_compare_row(name, name, "higher", values, display))
+    return rows
+
+
+@lru_cache(maxsize=COMPARE_CACHE_SIZE)
+def _build_compare_matrix(product_ids, catalog_version):
+    # Built once per sorted id tuple and catalog version; popular pairs are served from the memo.
+    placeholders = ",".join("?" for _ in product_ids)
+    with _db_connect() as connection:
+        rows = connection.execute(f"SELECT * FROM products WHERE id IN ({placeholders}) ORDER BY id", product_ids).fetchall()
+    products = [_row_to_product(row) for row in rows]
+
+    spec_rows = []
+    for key, label, better in COMPARE_FIELDS:
+        values = [product[key] for product in products]
+        if key == "ports":
+            display = [", ".join(value or []) for value in values]
+            values = display
+        else:
+            display = ["NA" if value in (None, "") else str(value) for value in values]
+        spec_rows.append(_compare_row(key, label, better, values, display))
+    for key, label in FINDER_EXTRA_OPTIONS:
+        values = [int(bool(product[key])) for product in products]
+        spec_rows.append(_compare_row(key, label, "higher", values, ["Yes" if value else "No" for value in values]))
+
+    found_ids = [product["id"] for product in products]
+    return {
+        "ids": found_ids,
+        "missing_ids": [product_id for product_id in product_ids if product_id not in found_ids],
+        "catalog_version": catalog_version,
+        "products": [
+            {
+                "id": product["id"],
+                "name": f"{product['brand']} {product['model']}",
+                "brand": product["brand"],
+                "series": product["series"],
+                "sku": product["sku"],
+                "image_url": product["image_url"],
+                "product_url": product["product_url"],
+            }
+            for product in products
+        ],
+        "specs": spec_rows,
+        "benchmarks": _compare_benchmark_rows(products) if products else [],
+    }
+
+
+def _compare_matrix_for(product_ids):
+    return _build_compare_matrix(tuple(sorted(product_ids)), _fetch_catalog_version())
+
+
+@lru_cache(maxsize=None)
+def _similar_gpu_score(gpu_model):
+    for bench in _build_placeholder_benchmarks(gpu_model)["synthetic"]:
+        if "Time Spy" in bench["name"]:
+            return _benchmark_score(bench["score"]) or 0
+    return 0
+
+
+def _similar_raw_features(row):
+    features = {
+        "price": log(max(int(row["price_inr"] or 0), 1)),
+        "cpu_tier": SIMILAR_CPU_TIER_RANKS.get(row["cpu_tier"], 1),
+        "gpu": _similar_gpu_score(row["gpu_model"]),
+        "ram_gb": log2(max(int(row["ram_gb"] or 0), 1)),
+        "storage_gb": log2(max(int(row["storage_gb"] or 0), 1)),
+        "screen_size": float(row["screen_size"] or 0),
+        "refresh_hz": float(row["refresh_hz"] or 0),
+        "weight_kg": float(row["weight_kg"] or 0),
+        "battery_hours": float(row["battery_hours"] or 0),
+    }
+    for key, _ in FINDER_EXTRA_OPTIONS:
+        features[key] = int(bool(row[key]))
+    return [features[key] for key, _ in SIMILAR_FEATURE_WEIGHTS]
+
+
+def _similar_feature_vectors(rows):
+    # Min-max scale every feature to [0, 1], then by sqrt(weight) so squared distances apply the weights.
+    raw = [_similar_raw_features(row) for row in rows]
+    columns = list(zip(*raw)) if raw else []
+    scales = []
+    for (_, weight), column in zip(SIMILAR_FEATURE_WEIGHTS, columns):
+        low, high = min(column), max(column)
+        scales.append((low, sqrt(weight) / (high - low) if high > low else 0.0))
+    return [[(value - low) * scale for value, (low, scale) in zip(vector, scales)] for vector in raw]
+
+
+def _similar_windows(count):
+    for start in range(0, count, SIMILAR_BLOCK_SIZE):
+        stop = min(count, start + SIMILAR_BLOCK_SIZE)
+        yield start, stop, max(0, start - SIMILAR_CANDIDATE_WINDOW), min(count, stop + SIMILAR_CANDIDATE_WINDOW)
+
+
+def _similar_top_k(ids, vectors, k):
+    # ids and vectors are in price order (the first feature); distances are rounded so ties break by id
+    # the same way with and without numpy.
+    count = len(ids)
+    neighbours = []
+    if np is not None and count >= SIMILAR_VECTOR_MIN_ITEMS:
+        id_array = np.asarray(ids, dtype=np.int64)
+        matrix = np.asarray(vectors, dtype=np.float64)
+        norms = (matrix**2).sum(axis=1)
+        for start, stop, low, high in _similar_windows(count):
+            distances = norms[start:stop, None] + norms[None, low:high] - 2.0 * (matrix[start:stop] @ matrix[low:high].T)
+            distances = np.round(np.maximum(distances, 0.0), 6)
+            distances[np.arange(stop - start), np.arange(start - low, stop - low)] = np.inf
+            depth = min(k, high - low) - 1
+            kth = np.partition(distances, depth, axis=1)[:, depth]
+            for row_distances, limit in zip(distances, kth):
+                hits = np.flatnonzero(row_distances <= limit)
+                scored = sorted(zip(row_distances[hits].tolist(), id_array[low + hits].tolist()))
+                neighbours.append([(similar_id, distance) for distance, similar_id in scored[:k] if np.isfinite(distance)])
+        return neighbours
+
+    for start, stop, low, high in _similar_windows(count):
+        for position in range(start, stop):
+            vector = vectors[position]
+            scored = [
+                (round(sum((a - b) ** 2 for a, b in zip(vector, vectors[other])), 6), ids[other])
+                for other in range(low, high)
+                if other != position
+            ]
+            scored.sort()
+            neighbours.append([(similar_id, distance) for distance, similar_id in scored[:k]])
+    return neighbours
+
+
+def _rebuild_similar_products(connection):
+    extra_columns = ", ".join(key for key, _ in FINDER_EXTRA_OPTIONS)
+    rows = connection.execute(
+        f"""
+        SELECT id, price_inr, cpu_tier, gpu_model, ram_gb, storage_gb, screen_size, refresh_hz,
+            weight_kg, battery_hours, {extra_columns}
+        FROM products
+        ORDER BY price_inr, id
+        """
+    ).fetchall()
+    ids = [row["id"] for row in rows]
+    neighbours = _similar_top_k(ids, _similar_feature_vectors(rows), SIMILAR_TOP_K)
+    connection.execute("DELETE FROM product_similar")
+    connection.executemany(
+        "INSERT INTO product_similar (product_id, rank, similar_id, distance) VALUES (?, ?, ?, ?)",
+        (
+            (product_id, rank, similar_id, distance)
+            for product_id, product_neighbours in zip(ids, neighbours)
+            for rank, (similar_id, distance) in enumerate(product_neighbours, start=1)
+        ),
+    )
+
+
+def _fetch_similar_products(product_id, limit=SIMILAR_TOP_K):
+    with _db_connect() as connection:
+        rows = connection.execute(
+            f"""
+            SELECT {PRODUCT_LIST_COLUMNS}, product_similar.distance AS similar_distance
+            FROM product_similar
+            JOIN products ON products.id = product_similar.similar_id
+            WHERE product_similar.product_id = ?
+            ORDER BY product_similar.rank
+            LIMIT ?
+            """,
+            (product_id, limit),
+        ).fetchall()
+    return [(_row_to_product(row), row["similar_distance"]) for row in rows]
+
+
 def _json_dumps(value):
     return json.dumps(value, ensure_ascii=True, separators=(",", ":"))
 
@@ -2651,8 +3275,206 @@ def _has_native_configuration(specs):
     return isinstance(categories, list) and any(isinstance(category, dict) for category in categories)
 
 
+METRIC_DEFINITIONS = {
+    "laptop_http_requests_total": ("counter", "HTTP requests handled, by Flask endpoint, method and status."),
+    "laptop_http_request_duration_seconds": ("histogram", "HTTP request latency by Flask endpoint."),
+    "laptop_db_connections_total": ("counter", "SQLite connections opened by _db_connect."),
+    "laptop_db_query_duration_seconds": ("histogram", "SQLite statement time by statement verb and phase (execute/fetch)."),
+    "laptop_scraper_fetches_total": ("counter", "Outbound catalog page fetches by host."),
+    "laptop_scraper_bytes_total": ("counter", "Bytes downloaded by catalog page fetches, by host."),
+    "laptop_scraper_errors_total": ("counter", "Failed catalog page fetches by host."),
+    "laptop_lenovo_customization_cache_total": ("counter", "Lenovo customization cache lookups by result (hit/miss/stale)."),
+    "laptop_finder_card_cache_total": ("counter", "Finder card fragment cache lookups by result (hit/miss)."),
+    "laptop_page_cache_total": ("counter", "Full-page output cache lookups by result (hit/miss/bypass)."),
+    "laptop_review_queue_total": ("counter", "Review queue events (queued/flushed/duplicate/dropped/error)."),
+}
+METRIC_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+METRICS = {"counters": {}, "histograms": {}}
+_METRICS_STATE = {"last_flush": 0.0, "file_name": f"metrics-{os.getpid()}-{int(time.time() * 1000)}.json"}
+# Request threads, gthread workers and the review writer all count; the flush copies under the same lock.
+_METRICS_LOCK = threading.Lock()
+
+
+def _metric_labels(labels):
+    parts = []
+    for key, value in labels:
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{escaped}"')
+    return ",".join(parts)
+
+
+def _metric_inc(name, labels=(), amount=1):
+    key = f"{name}|{_metric_labels(labels)}"
+    with _METRICS_LOCK:
+        counters = METRICS["counters"]
+        counters[key] = counters.get(key, 0) + amount
+
+
+def _metric_observe(name, seconds, labels=()):
+    key = f"{name}|{_metric_labels(labels)}"
+    bucket_index = bisect_left(METRIC_BUCKETS, seconds)
+    with _METRICS_LOCK:
+        histogram = METRICS["histograms"].get(key)
+        if histogram is None:
+            histogram = METRICS["histograms"][key] = {"buckets": [0] * len(METRIC_BUCKETS), "sum": 0.0, "count": 0}
+        if bucket_index < len(METRIC_BUCKETS):
+            histogram["buckets"][bucket_index] += 1
+        histogram["sum"] += seconds
+        histogram["count"] += 1
+
+
+def _reset_metrics():
+    global _METRICS_LOCK
+    # The parent may have held the lock while forking.
+    _METRICS_LOCK = threading.Lock()
+    METRICS["counters"] = {}
+    METRICS["histograms"] = {}
+    _METRICS_STATE["last_flush"] = 0.0
+    _METRICS_STATE["file_name"] = f"metrics-{os.getpid()}-{int(time.time() * 1000)}.json"
+
+
+# A forked gunicorn worker starts from zero; whatever the parent counted stays in the parent's file.
+# Files are named by pid and start time, so a worker that reuses a dead worker's pid never overwrites
+# its totals and the summed counters never go down.
+os.register_at_fork(after_in_child=_reset_metrics)
+
+
+def _flush_metrics(force=False):
+    if not METRICS_FLUSH_ENABLED:
+        return
+    now = time.time()
+    if not force and now - _METRICS_STATE["last_flush"] < METRICS_FLUSH_SECONDS:
+        return
+    _METRICS_STATE["last_flush"] = now
+    with _METRICS_LOCK:
+        if not METRICS["counters"] and not METRICS["histograms"]:
+            return
+        snapshot = json.dumps(METRICS)
+    target_path = os.path.join(METRICS_DIR, _METRICS_STATE["file_name"])
+    try:
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        # Per-thread temp files: two threads may flush at once.
+        temp_path = f"{target_path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(snapshot)
+        os.replace(temp_path, target_path)
+    except OSError:
+        return
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _prune_metrics_files():
+    # Snapshots of processes that are gone (earlier server runs, recycled workers) would otherwise pile up
+    # and be summed by every scrape.
+    try:
+        file_names = os.listdir(METRICS_DIR)
+    except OSError:
+        return
+    for file_name in file_names:
+        match = re.match(r"metrics-(\d+)-\d+\.json", file_name)
+        if not match:
+            continue
+        pid = int(match.group(1))
+        if pid == os.getpid() or _pid_alive(pid):
+            continue
+        try:
+            os.remove(os.path.join(METRICS_DIR, file_name))
+        except OSError:
+            continue
+
+
+def _collect_metrics():
+    counters = {}
+    histograms = {}
+    try:
+        file_names = sorted(name for name in os.listdir(METRICS_DIR) if name.startswith("metrics-") and name.endswith(".json"))
+    except OSError:
+        file_names = []
+    for file_name in file_names:
+        try:
+            with open(os.path.join(METRICS_DIR, file_name), "r", encoding="utf-8") as metrics_file:
+                snapshot = json.load(metrics_file)
+        except (OSError, ValueError):
+            continue
+        for key, value in snapshot.get("counters", {}).items():
+            counters[key] = counters.get(key, 0) + value
+        for key, histogram in snapshot.get("histograms", {}).items():
+            merged = histograms.setdefault(key, {"buckets": [0] * len(METRIC_BUCKETS), "sum": 0.0, "count": 0})
+            merged["buckets"] = [left + right for left, right in zip(merged["buckets"], histogram.get("buckets", []))]
+            merged["sum"] += histogram.get("sum", 0.0)
+            merged["count"] += histogram.get("count", 0)
+    return counters, histograms
+
+
+def _render_metrics(counters, histograms):
+    lines = []
+    for name, (metric_type, help_text) in METRIC_DEFINITIONS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        if metric_type == "counter":
+            for key in sorted(key for key in counters if key.split("|", 1)[0] == name):
+                label_text = key.split("|", 1)[1]
+                lines.append(f"{name}{{{label_text}}} {counters[key]}" if label_text else f"{name} {counters[key]}")
+            continue
+
+        for key in sorted(key for key in histograms if key.split("|", 1)[0] == name):
+            label_text = key.split("|", 1)[1]
+            histogram = histograms[key]
+            prefix = f"{label_text}," if label_text else ""
+            cumulative = 0
+            for bound, count in zip(METRIC_BUCKETS, histogram["buckets"]):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {histogram["count"]}')
+            suffix = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{name}_sum{suffix} {histogram['sum']:.6f}")
+            lines.append(f"{name}_count{suffix} {histogram['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def _statement_verb(sql):
+    match = re.match(r"\s*([A-Za-z]+)", sql or "")
+    return match.group(1).lower() if match else "unknown"
+
+
+class _InstrumentedCursor(sqlite3.Cursor):
+    def execute(self, sql, parameters=()):
+        self._statement = _statement_verb(sql)
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            _metric_observe("laptop_db_query_duration_seconds", time.perf_counter() - started, (("statement", self._statement), ("phase", "execute")))
+
+    def fetchall(self):
+        started = time.perf_counter()
+        try:
+            return super().fetchall()
+        finally:
+            _metric_observe(
+                "laptop_db_query_duration_seconds",
+                time.perf_counter() - started,
+                (("statement", getattr(self, "_statement", "unknown")), ("phase", "fetch")),
+            )
+
+
+class _InstrumentedConnection(sqlite3.Connection):
+    def execute(self, sql, parameters=()):
+        return self.cursor(_InstrumentedCursor).execute(sql, parameters)
+
+
 def _db_connect():
-    connection = sqlite3.connect(HP_DB_PATH)
+    _metric_inc("laptop_db_connections_total")
+    connection = sqlite3.connect(HP_DB_PATH, factory=_InstrumentedConnection)
     connection.row_factory = sqlite3.Row
     connection.execute("PRAGMA foreign_keys = ON")
     return connection
@@ -2709,6 +3531,12 @@ def _parse_price_inr(raw_value):
 
 
 def _fetch_html(url, timeout=12):
+    parts = urlsplit(str(url))
+    host = (("host", parts.hostname or "unknown"),)
+    _metric_inc("laptop_scraper_fetches_total", host)
+    if SCRAPER_ORIGIN_OVERRIDE:
+        # Send scraper traffic to a local stand-in (benchmarks/standin.py) that serves pages by original host and path.
+        url = f"{SCRAPER_ORIGIN_OVERRIDE}/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else "")
     request = Request(
         url,
         headers={
@@ -2718,8 +3546,14 @@ def _fetch_html(url, timeout=12):
             )
         },
     )
-    with urlopen(request, timeout=timeout) as response:
-        return response.read().decode("utf-8", errors="ignore")
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            body = response.read()
+    except Exception:
+        _metric_inc("laptop_scraper_errors_total", host)
+        raise
+    _metric_inc("laptop_scraper_bytes_total", host, len(body))
+    return body.decode("utf-8", errors="ignore")
 
 
 def _discover_last_listing_page(listing_html, listing_url):
@@ -2894,164 +3728,167 @@ def _extract_screen_size_from_title_or_features(title, feature_rows):
     return 16.0
 
 
+PLACEHOLDER_BENCHMARK_PROFILES = {
+    "RTX 5090": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 148, "fps_1440p": 109},
+            {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 196, "fps_1440p": 146},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 415, "fps_1440p": 352},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,920"},
+            {"name": "3DMark Time Spy Graphics", "score": "23,900"},
+        ],
+    },
+    "RTX 5080": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 136, "fps_1440p": 97},
+            {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 182, "fps_1440p": 134},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 380, "fps_1440p": 320},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,820"},
+            {"name": "3DMark Time Spy Graphics", "score": "21,400"},
+        ],
+    },
+    "RTX 4090": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 132, "fps_1440p": 95},
+            {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 178, "fps_1440p": 130},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 365, "fps_1440p": 307},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,780"},
+            {"name": "3DMark Time Spy Graphics", "score": "20,700"},
+        ],
+    },
+    "RTX 4080": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 124, "fps_1440p": 88},
+            {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 171, "fps_1440p": 126},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 349, "fps_1440p": 292},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,700"},
+            {"name": "3DMark Time Spy Graphics", "score": "19,800"},
+        ],
+    },
+    "RTX 5070 Ti": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 120, "fps_1440p": 84},
+            {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 170, "fps_1440p": 124},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 340, "fps_1440p": 285},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,650"},
+            {"name": "3DMark Time Spy Graphics", "score": "19,300"},
+        ],
+    },
+    "RTX 5070": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 110, "fps_1440p": 77},
+            {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 157, "fps_1440p": 114},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 315, "fps_1440p": 262},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,580"},
+            {"name": "3DMark Time Spy Graphics", "score": "17,900"},
+        ],
+    },
+    "RTX 5060": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "High", "fps_1080p": 96, "fps_1440p": 66},
+            {"title": "Forza Horizon 5", "preset": "Ultra", "fps_1080p": 141, "fps_1440p": 101},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 288, "fps_1440p": 233},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,500"},
+            {"name": "3DMark Time Spy Graphics", "score": "15,200"},
+        ],
+    },
+    "RTX 4060": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "High", "fps_1080p": 90, "fps_1440p": 63},
+            {"title": "Forza Horizon 5", "preset": "Ultra", "fps_1080p": 134, "fps_1440p": 97},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 274, "fps_1440p": 224},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,460"},
+            {"name": "3DMark Time Spy Graphics", "score": "13,800"},
+        ],
+    },
+    "RTX 4070": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 104, "fps_1440p": 72},
+            {"title": "Forza Horizon 5", "preset": "Ultra", "fps_1080p": 149, "fps_1440p": 107},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 302, "fps_1440p": 248},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,540"},
+            {"name": "3DMark Time Spy Graphics", "score": "16,100"},
+        ],
+    },
+    "RTX 5050": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "High", "fps_1080p": 88, "fps_1440p": 58},
+            {"title": "Forza Horizon 5", "preset": "High", "fps_1080p": 129, "fps_1440p": 90},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 271, "fps_1440p": 214},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,420"},
+            {"name": "3DMark Time Spy Graphics", "score": "13,100"},
+        ],
+    },
+    "RTX 4050": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "High", "fps_1080p": 78, "fps_1440p": 53},
+            {"title": "Forza Horizon 5", "preset": "High", "fps_1080p": 118, "fps_1440p": 82},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 245, "fps_1440p": 195},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,360"},
+            {"name": "3DMark Time Spy Graphics", "score": "10,900"},
+        ],
+    },
+    "RTX 3050": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "Medium", "fps_1080p": 56, "fps_1440p": 38},
+            {"title": "Forza Horizon 5", "preset": "Medium", "fps_1080p": 96, "fps_1440p": 66},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 201, "fps_1440p": 158},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,220"},
+            {"name": "3DMark Time Spy Graphics", "score": "7,500"},
+        ],
+    },
+    "RTX 2050": {
+        "games": [
+            {"title": "Cyberpunk 2077", "preset": "Low", "fps_1080p": 44, "fps_1440p": 29},
+            {"title": "Forza Horizon 5", "preset": "Medium", "fps_1080p": 72, "fps_1440p": 51},
+            {"title": "Valorant", "preset": "High", "fps_1080p": 176, "fps_1440p": 137},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "1,050"},
+            {"name": "3DMark Time Spy Graphics", "score": "5,200"},
+        ],
+    },
+    "Integrated Graphics": {
+        "games": [
+            {"title": "Valorant", "preset": "Low", "fps_1080p": 92, "fps_1440p": 58},
+            {"title": "CS2", "preset": "Low", "fps_1080p": 76, "fps_1440p": 48},
+            {"title": "Forza Horizon 5", "preset": "Low", "fps_1080p": 38, "fps_1440p": 25},
+        ],
+        "synthetic": [
+            {"name": "Cinebench 2024 Multi", "score": "980"},
+            {"name": "3DMark Time Spy Graphics", "score": "2,200"},
+        ],
+    },
+}
+
+
 def _build_placeholder_benchmarks(gpu_model):
-    profiles = {
-        "RTX 5090": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 148, "fps_1440p": 109},
-                {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 196, "fps_1440p": 146},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 415, "fps_1440p": 352},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,920"},
-                {"name": "3DMark Time Spy Graphics", "score": "23,900"},
-            ],
-        },
-        "RTX 5080": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 136, "fps_1440p": 97},
-                {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 182, "fps_1440p": 134},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 380, "fps_1440p": 320},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,820"},
-                {"name": "3DMark Time Spy Graphics", "score": "21,400"},
-            ],
-        },
-        "RTX 4090": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 132, "fps_1440p": 95},
-                {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 178, "fps_1440p": 130},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 365, "fps_1440p": 307},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,780"},
-                {"name": "3DMark Time Spy Graphics", "score": "20,700"},
-            ],
-        },
-        "RTX 4080": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 124, "fps_1440p": 88},
-                {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 171, "fps_1440p": 126},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 349, "fps_1440p": 292},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,700"},
-                {"name": "3DMark Time Spy Graphics", "score": "19,800"},
-            ],
-        },
-        "RTX 5070 Ti": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 120, "fps_1440p": 84},
-                {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 170, "fps_1440p": 124},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 340, "fps_1440p": 285},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,650"},
-                {"name": "3DMark Time Spy Graphics", "score": "19,300"},
-            ],
-        },
-        "RTX 5070": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 110, "fps_1440p": 77},
-                {"title": "Forza Horizon 5", "preset": "Extreme", "fps_1080p": 157, "fps_1440p": 114},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 315, "fps_1440p": 262},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,580"},
-                {"name": "3DMark Time Spy Graphics", "score": "17,900"},
-            ],
-        },
-        "RTX 5060": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "High", "fps_1080p": 96, "fps_1440p": 66},
-                {"title": "Forza Horizon 5", "preset": "Ultra", "fps_1080p": 141, "fps_1440p": 101},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 288, "fps_1440p": 233},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,500"},
-                {"name": "3DMark Time Spy Graphics", "score": "15,200"},
-            ],
-        },
-        "RTX 4060": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "High", "fps_1080p": 90, "fps_1440p": 63},
-                {"title": "Forza Horizon 5", "preset": "Ultra", "fps_1080p": 134, "fps_1440p": 97},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 274, "fps_1440p": 224},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,460"},
-                {"name": "3DMark Time Spy Graphics", "score": "13,800"},
-            ],
-        },
-        "RTX 4070": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "Ultra", "fps_1080p": 104, "fps_1440p": 72},
-                {"title": "Forza Horizon 5", "preset": "Ultra", "fps_1080p": 149, "fps_1440p": 107},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 302, "fps_1440p": 248},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,540"},
-                {"name": "3DMark Time Spy Graphics", "score": "16,100"},
-            ],
-        },
-        "RTX 5050": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "High", "fps_1080p": 88, "fps_1440p": 58},
-                {"title": "Forza Horizon 5", "preset": "High", "fps_1080p": 129, "fps_1440p": 90},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 271, "fps_1440p": 214},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,420"},
-                {"name": "3DMark Time Spy Graphics", "score": "13,100"},
-            ],
-        },
-        "RTX 4050": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "High", "fps_1080p": 78, "fps_1440p": 53},
-                {"title": "Forza Horizon 5", "preset": "High", "fps_1080p": 118, "fps_1440p": 82},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 245, "fps_1440p": 195},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,360"},
-                {"name": "3DMark Time Spy Graphics", "score": "10,900"},
-            ],
-        },
-        "RTX 3050": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "Medium", "fps_1080p": 56, "fps_1440p": 38},
-                {"title": "Forza Horizon 5", "preset": "Medium", "fps_1080p": 96, "fps_1440p": 66},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 201, "fps_1440p": 158},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,220"},
-                {"name": "3DMark Time Spy Graphics", "score": "7,500"},
-            ],
-        },
-        "RTX 2050": {
-            "games": [
-                {"title": "Cyberpunk 2077", "preset": "Low", "fps_1080p": 44, "fps_1440p": 29},
-                {"title": "Forza Horizon 5", "preset": "Medium", "fps_1080p": 72, "fps_1440p": 51},
-                {"title": "Valorant", "preset": "High", "fps_1080p": 176, "fps_1440p": 137},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "1,050"},
-                {"name": "3DMark Time Spy Graphics", "score": "5,200"},
-            ],
-        },
-        "Integrated Graphics": {
-            "games": [
-                {"title": "Valorant", "preset": "Low", "fps_1080p": 92, "fps_1440p": 58},
-                {"title": "CS2", "preset": "Low", "fps_1080p": 76, "fps_1440p": 48},
-                {"title": "Forza Horizon 5", "preset": "Low", "fps_1080p": 38, "fps_1440p": 25},
-            ],
-            "synthetic": [
-                {"name": "Cinebench 2024 Multi", "score": "980"},
-                {"name": "3DMark Time Spy Graphics", "score": "2,200"},
-            ],
-        },
-    }
-    return profiles.get(gpu_model, profiles["RTX 4050"])
+    # A copy per item: seed and snapshot items are free to edit their benchmarks in place.
+    return copy.deepcopy(PLACEHOLDER_BENCHMARK_PROFILES.get(gpu_model, PLACEHOLDER_BENCHMARK_PROFILES["RTX 4050"]))
 
 
 def _mark_included(options, selected_value):
@@ -3357,6 +4194,8 @@ def _load_lenovo_customization_cache():
 
 
 def _save_lenovo_customization_cache(cache):
+    if SCRAPER_ORIGIN_OVERRIDE:
+        return
     try:
         with open(LENOVO_CUSTOMIZATION_CACHE_PATH, "w", encoding="utf-8") as cache_file:
             json.dump(cache, cache_file, ensure_ascii=True, indent=2)
@@ -3589,7 +4428,7 @@ def _fetch_lenovo_official_customization(product_url, fallback_price=0):
     }
 
 
-def _apply_lenovo_official_customization(products):
+def _apply_lenovo_official_customization(products, save_cache=True):
     lenovo_products = [item for item in products if item.get("brand") == "Lenovo"]
     if not lenovo_products:
         return products
@@ -3608,8 +4447,10 @@ def _apply_lenovo_official_customization(products):
         cache_item = cache.get(product_url)
         customization_data = None
         if _is_fresh_lenovo_customization_cache_item(cache_item):
+            _metric_inc("laptop_lenovo_customization_cache_total", (("result", "hit"),))
             customization_data = cache_item.get("data")
         else:
+            _metric_inc("laptop_lenovo_customization_cache_total", (("result", "miss"),))
             customization_data = _fetch_lenovo_official_customization(
                 product_url,
                 fallback_price=product.get("price_inr", 0),
@@ -3622,12 +4463,13 @@ def _apply_lenovo_official_customization(products):
                 }
                 cache_updated = True
             elif isinstance(cache_item, dict):
+                _metric_inc("laptop_lenovo_customization_cache_total", (("result", "stale"),))
                 customization_data = cache_item.get("data")
 
         if isinstance(customization_data, dict):
             url_to_data[product_url] = customization_data
 
-    if cache_updated:
+    if cache_updated and save_cache:
         _save_lenovo_customization_cache(cache)
 
     for product in lenovo_products:
@@ -4234,7 +5076,7 @@ def _build_lenovo_catalog_variants():
             }
         )
 
-    return _apply_lenovo_official_customization(products)
+    return products
 
 
 def _build_msi_catalog_variants():
@@ -5222,9 +6064,8 @@ def _build_dell_catalog_variants():
     return products
 
 
-def _build_curated_multibrand_products():
-    products = []
-    curated_items = _merge_catalog_items(
+def _build_curated_catalog_items():
+    return _merge_catalog_items(
         [item for item in CURATED_MULTI_BRAND_BASE_PRODUCTS if item.get("brand") not in {"Lenovo", "MSI", "Acer", "ASUS", "Dell"}],
         _build_dell_catalog_variants(),
         _build_lenovo_catalog_variants(),
@@ -5232,6 +6073,15 @@ def _build_curated_multibrand_products():
         _build_acer_catalog_variants(),
         _build_asus_catalog_variants(),
     )
+
+
+def _build_curated_multibrand_products(curated_items=None, enrich_lenovo=True):
+    # Lenovo items are enriched from the official configurator (through its cache) before normalizing.
+    products = []
+    if curated_items is None:
+        curated_items = _build_curated_catalog_items()
+    if enrich_lenovo:
+        curated_items = _apply_lenovo_official_customization(curated_items)
     for item in curated_items:
         cpu_brand, cpu_tier = _infer_cpu_brand_tier(item["cpu_model"])
         gpu_model = _normalize_gpu_model(item["gpu_model"])
@@ -5629,52 +6479,139 @@ def _load_snapshot_catalog():
                 data = json.load(snapshot_file)
                 if isinstance(data, list):
                     return data
+                if isinstance(data, dict) and isinstance(data.get("items"), list):
+                    return _expand_snapshot_items(data["items"], data.get("configuration_trees") or {})
         except (OSError, ValueError):
             continue
     return []
 
 
+def _expand_snapshot_items(items, configuration_trees):
+    expanded = []
+    for item in items:
+        if isinstance(item, dict) and isinstance(item.get("specs"), dict):
+            item = dict(item, specs=_expand_configuration_reference(item["specs"], configuration_trees.get))
+        expanded.append(item)
+    return expanded
+
+
 def _save_snapshot_catalog(catalog):
+    # Pages from a stand-in origin are test data and must not replace the saved snapshot.
+    if SCRAPER_ORIGIN_OVERRIDE:
+        return
+    # Configuration trees are written once each, like in the database; plain-list snapshots still load.
+    configuration_trees = {}
+    items = []
+    for item in catalog:
+        if isinstance(item, dict) and isinstance(item.get("specs"), dict):
+            item = dict(item, specs=_compact_configuration(item["specs"], configuration_trees))
+        items.append(item)
+    snapshot = {"configuration_trees": configuration_trees, "items": items}
     target_paths = list(dict.fromkeys([HP_SNAPSHOT_PATH] + HP_LEGACY_SNAPSHOT_PATHS))
     for target_path in target_paths:
         try:
             with open(target_path, "w", encoding="utf-8") as snapshot_file:
-                json.dump(catalog, snapshot_file, ensure_ascii=True, indent=2)
+                json.dump(snapshot, snapshot_file, ensure_ascii=True, indent=2)
         except OSError:
             continue
 
 
-def _seed_hp_products(connection):
-    curated_catalog = _build_curated_multibrand_products()
-    snapshot_catalog = _load_snapshot_catalog()
-    snapshot_by_sku = {item.get("sku"): item for item in snapshot_catalog if isinstance(item, dict) and item.get("sku")}
+def _collect_hp_listing_items(crawl=True):
+    # Without a live listing (crawl skipped or unreachable) the last saved snapshot stands in for it.
+    # The snapshot also holds the curated items it was saved with; only its HP part stands in, so the
+    # freshly built curated items win the merge. Returns (items, source): live, snapshot or seed.
+    snapshot_catalog = [item for item in _load_snapshot_catalog() if isinstance(item, dict) and item.get("sku")]
+    snapshot_by_sku = {item["sku"]: item for item in snapshot_catalog}
 
-    catalog = _fetch_live_hp_catalog(cached_by_sku=snapshot_by_sku)
+    catalog = _fetch_live_hp_catalog(cached_by_sku=snapshot_by_sku) if crawl else []
     if catalog:
-        seed_items = _merge_catalog_items(catalog, curated_catalog)
-    else:
-        base_catalog = snapshot_catalog or HP_PRODUCTS_SEED
-        seed_items = _merge_catalog_items(base_catalog, curated_catalog)
-    _save_snapshot_catalog(seed_items)
+        return catalog, "live"
+    hp_snapshot = [item for item in snapshot_catalog if item.get("brand") == "HP"]
+    if hp_snapshot:
+        return hp_snapshot, "snapshot"
+    return HP_PRODUCTS_SEED, "seed"
+
+
+def _collect_seed_items():
+    curated_catalog = _build_curated_multibrand_products()
+    hp_items, _ = _collect_hp_listing_items()
+    return _merge_catalog_items(hp_items, curated_catalog)
+
+
+def _seed_product_row(item, configuration_trees=None):
+    specs = _precompute_native_configuration(item.get("specs", {}), item["price_inr"])
+    # The shared configuration tree goes to configuration_trees; specs_json keeps the reference.
+    stored_specs = _compact_configuration(specs, {} if configuration_trees is None else configuration_trees)
+    default_source_label = "HP India OMEN Series"
+    default_source_url = HP_OMEN_LISTING_URL
+    if str(item.get("series", "")).lower().startswith("victus"):
+        default_source_label = "HP India Victus Series"
+        default_source_url = HP_VICTUS_LISTING_URL
+    buy_links = item.get(
+        "buy_links",
+        [
+            {"label": "Buy on HP India", "url": item["product_url"]},
+            {
+                "label": default_source_label,
+                "url": default_source_url,
+            },
+        ],
+    )
+    return {
+        "brand": item["brand"],
+        "series": item["series"],
+        "model": item["model"],
+        "sku": item["sku"],
+        "price_inr": item["price_inr"],
+        "currency": item.get("currency", "INR"),
+        "region": item.get("region", HP_REGION),
+        "product_url": item["product_url"],
+        "image_url": _normalize_image_url(item.get("image_url", "")),
+        "cpu_brand": item["cpu_brand"],
+        "cpu_tier": item["cpu_tier"],
+        "cpu_model": item["cpu_model"],
+        "ram_gb": item["ram_gb"],
+        "storage_type": item["storage_type"],
+        "storage_gb": item["storage_gb"],
+        "gpu_type": item["gpu_type"],
+        "gpu_model": item["gpu_model"],
+        "screen_size": item["screen_size"],
+        "resolution": item["resolution"],
+        "refresh_hz": item["refresh_hz"],
+        "panel": item["panel"],
+        "weight_kg": item["weight_kg"],
+        "battery_hours": item["battery_hours"],
+        "battery_capacity_wh": int(item.get("battery_capacity_wh") or _infer_battery_capacity_wh(item["screen_size"], item["series"])),
+        "battery_type": _normalize_battery_type_text(item.get("battery_type", "")),
+        "rating": item["rating"],
+        "use_cases_json": _json_dumps(item.get("use_cases", [])),
+        "ports_json": _json_dumps(item.get("ports", [])),
+        "specs_json": _json_dumps(stored_specs),
+        "benchmarks_json": _json_dumps(item.get("benchmarks", {})),
+        "buy_links_json": _json_dumps(buy_links),
+        "srgb_100": int(bool(item.get("srgb_100"))),
+        "dci_p3": int(bool(item.get("dci_p3"))),
+        "good_cooling": int(bool(item.get("good_cooling"))),
+        "ram_upgradable": int(bool(item.get("ram_upgradable"))),
+        "extra_ssd_slot": int(bool(item.get("extra_ssd_slot"))),
+        "backlit_keyboard": int(bool(item.get("backlit_keyboard"))),
+        "customization_available": int(_has_native_configuration(specs)),
+        **_product_facet_columns(item),
+    }
+
+
+def _seed_hp_products(connection, seed_items=None):
+    if seed_items is None:
+        seed_items = _collect_seed_items()
+        _save_snapshot_catalog(seed_items)
 
     seed_skus = [item["sku"] for item in seed_items]
+    catalog_digest = hashlib.sha1()
+    configuration_trees = {}
 
     for item in seed_items:
-        default_source_label = "HP India OMEN Series"
-        default_source_url = HP_OMEN_LISTING_URL
-        if str(item.get("series", "")).lower().startswith("victus"):
-            default_source_label = "HP India Victus Series"
-            default_source_url = HP_VICTUS_LISTING_URL
-        buy_links = item.get(
-            "buy_links",
-            [
-                {"label": "Buy on HP India", "url": item["product_url"]},
-                {
-                    "label": default_source_label,
-                    "url": default_source_url,
-                },
-            ],
-        )
+        product_row = _seed_product_row(item, configuration_trees)
+        catalog_digest.update(_json_dumps(product_row).encode("utf-8"))
         connection.execute(
             """
             INSERT INTO products (
@@ -5683,14 +6620,18 @@ def _seed_hp_products(connection):
                 gpu_type, gpu_model, screen_size, resolution, refresh_hz, panel,
                 weight_kg, battery_hours, battery_capacity_wh, battery_type, rating,
                 use_cases_json, ports_json, specs_json, benchmarks_json, buy_links_json,
-                srgb_100, dci_p3, good_cooling, ram_upgradable, extra_ssd_slot, backlit_keyboard
+                srgb_100, dci_p3, good_cooling, ram_upgradable, extra_ssd_slot, backlit_keyboard,
+                customization_available, screen_bucket, weight_bucket, battery_bucket, refresh_bucket,
+                resolution_class, panel_flags, series_flags, use_case_flags, port_flags
             ) VALUES (
                 :brand, :series, :model, :sku, :price_inr, :currency, :region, :product_url, :image_url,
                 :cpu_brand, :cpu_tier, :cpu_model, :ram_gb, :storage_type, :storage_gb,
                 :gpu_type, :gpu_model, :screen_size, :resolution, :refresh_hz, :panel,
                 :weight_kg, :battery_hours, :battery_capacity_wh, :battery_type, :rating,
                 :use_cases_json, :ports_json, :specs_json, :benchmarks_json, :buy_links_json,
-                :srgb_100, :dci_p3, :good_cooling, :ram_upgradable, :extra_ssd_slot, :backlit_keyboard
+                :srgb_100, :dci_p3, :good_cooling, :ram_upgradable, :extra_ssd_slot, :backlit_keyboard,
+                :customization_available, :screen_bucket, :weight_bucket, :battery_bucket, :refresh_bucket,
+                :resolution_class, :panel_flags, :series_flags, :use_case_flags, :port_flags
             )
             ON CONFLICT(sku) DO UPDATE SET
                 brand = excluded.brand,
@@ -5729,54 +6670,51 @@ def _seed_hp_products(connection):
                 ram_upgradable = excluded.ram_upgradable,
                 extra_ssd_slot = excluded.extra_ssd_slot,
                 backlit_keyboard = excluded.backlit_keyboard,
+                customization_available = excluded.customization_available,
+                screen_bucket = excluded.screen_bucket,
+                weight_bucket = excluded.weight_bucket,
+                battery_bucket = excluded.battery_bucket,
+                refresh_bucket = excluded.refresh_bucket,
+                resolution_class = excluded.resolution_class,
+                panel_flags = excluded.panel_flags,
+                series_flags = excluded.series_flags,
+                use_case_flags = excluded.use_case_flags,
+                port_flags = excluded.port_flags,
                 updated_at = CURRENT_TIMESTAMP
             """,
-            {
-                "brand": item["brand"],
-                "series": item["series"],
-                "model": item["model"],
-                "sku": item["sku"],
-                "price_inr": item["price_inr"],
-                "currency": item.get("currency", "INR"),
-                "region": item.get("region", HP_REGION),
-                "product_url": item["product_url"],
-                "image_url": _normalize_image_url(item.get("image_url", "")),
-                "cpu_brand": item["cpu_brand"],
-                "cpu_tier": item["cpu_tier"],
-                "cpu_model": item["cpu_model"],
-                "ram_gb": item["ram_gb"],
-                "storage_type": item["storage_type"],
-                "storage_gb": item["storage_gb"],
-                "gpu_type": item["gpu_type"],
-                "gpu_model": item["gpu_model"],
-                "screen_size": item["screen_size"],
-                "resolution": item["resolution"],
-                "refresh_hz": item["refresh_hz"],
-                "panel": item["panel"],
-                "weight_kg": item["weight_kg"],
-                "battery_hours": item["battery_hours"],
-                "battery_capacity_wh": int(item.get("battery_capacity_wh") or _infer_battery_capacity_wh(item["screen_size"], item["series"])),
-                "battery_type": _normalize_battery_type_text(item.get("battery_type", "")),
-                "rating": item["rating"],
-                "use_cases_json": _json_dumps(item.get("use_cases", [])),
-                "ports_json": _json_dumps(item.get("ports", [])),
-                "specs_json": _json_dumps(item.get("specs", {})),
-                "benchmarks_json": _json_dumps(item.get("benchmarks", {})),
-                "buy_links_json": _json_dumps(buy_links),
-                "srgb_100": int(bool(item.get("srgb_100"))),
-                "dci_p3": int(bool(item.get("dci_p3"))),
-                "good_cooling": int(bool(item.get("good_cooling"))),
-                "ram_upgradable": int(bool(item.get("ram_upgradable"))),
-                "extra_ssd_slot": int(bool(item.get("extra_ssd_slot"))),
-                "backlit_keyboard": int(bool(item.get("backlit_keyboard"))),
-            },
+            product_row,
         )
 
-    placeholders = ",".join("?" for _ in seed_skus)
+    # One JSON parameter instead of a placeholder per SKU, which overflows SQLite's variable limit on large catalogs.
+    connection.execute(
+        "DELETE FROM products WHERE sku NOT IN (SELECT value FROM json_each(?))",
+        (_json_dumps(seed_skus),),
+    )
+    connection.executemany(
+        "INSERT OR IGNORE INTO configuration_trees (tree_hash, tree_json) VALUES (?, ?)",
+        [(tree_hash, _json_dumps(tree)) for tree_hash, tree in configuration_trees.items()],
+    )
     connection.execute(
-        f"DELETE FROM products WHERE sku NOT IN ({placeholders})",
-        seed_skus,
+        "DELETE FROM configuration_trees WHERE tree_hash NOT IN (SELECT value FROM json_each(?))",
+        (_json_dumps(list(configuration_trees)),),
     )
+    _rebuild_products_search_index(connection)
+    _rebuild_similar_products(connection)
+    _rebuild_configuration_index(connection)
+    _set_catalog_version(connection, catalog_digest.hexdigest()[:16])
+
+
+def _set_catalog_version(connection, version):
+    connection.execute(
+        """
+        INSERT INTO catalog_meta (key, value) VALUES ('catalog_version', ?)
+        ON CONFLICT(key) DO UPDATE SET
+            value = excluded.value,
+            updated_at = CASE WHEN catalog_meta.value = excluded.value THEN catalog_meta.updated_at ELSE CURRENT_TIMESTAMP END
+        """,
+        (version,),
+    )
+    _forget_catalog_meta()
 
 
 def _init_hp_database():
@@ -5788,8 +6726,16 @@ def _init_hp_database():
     with _db_connect() as connection:
         connection.executescript(schema_sql)
         _ensure_products_schema(connection)
+        _ensure_products_search_index(connection)
+        _ensure_reviews_schema(connection)
+        _ensure_review_stats(connection)
         _seed_hp_products(connection)
         connection.commit()
+    _forget_catalog_meta()
+
+    # Reviews queued before a restart are written before the first request.
+    if os.path.exists(REVIEW_QUEUE_PATH):
+        _drain_review_queue()
 
 
 def _ensure_products_schema(connection):
@@ -5800,69 +6746,336 @@ def _ensure_products_schema(connection):
         connection.execute("ALTER TABLE products ADD COLUMN battery_type TEXT")
     if "image_url" not in columns:
         connection.execute("ALTER TABLE products ADD COLUMN image_url TEXT")
+    if "customization_available" not in columns:
+        connection.execute("ALTER TABLE products ADD COLUMN customization_available INTEGER NOT NULL DEFAULT 0")
+    for column, column_type in PRODUCT_FACET_COLUMN_TYPES.items():
+        if column not in columns:
+            connection.execute(f"ALTER TABLE products ADD COLUMN {column} {column_type}")
+
+
+PRODUCT_FACET_COLUMN_TYPES = {
+    "screen_bucket": "TEXT",
+    "weight_bucket": "TEXT",
+    "battery_bucket": "TEXT",
+    "refresh_bucket": "TEXT",
+    "resolution_class": "TEXT",
+    "panel_flags": "INTEGER NOT NULL DEFAULT 0",
+    "series_flags": "INTEGER NOT NULL DEFAULT 0",
+    "use_case_flags": "INTEGER NOT NULL DEFAULT 0",
+    "port_flags": "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+PRODUCT_LIST_COLUMNS = """
+    id, brand, series, model, sku, price_inr, currency, region, product_url, image_url,
+    cpu_brand, cpu_tier, cpu_model, ram_gb, storage_type, storage_gb,
+    gpu_type, gpu_model, screen_size, resolution, refresh_hz, panel,
+    weight_kg, battery_hours, battery_capacity_wh, battery_type, rating,
+    use_cases_json, ports_json,
+    srgb_100, dci_p3, good_cooling, ram_upgradable, extra_ssd_slot, backlit_keyboard,
+    customization_available,
+    screen_bucket, weight_bucket, battery_bucket, refresh_bucket, resolution_class, panel_flags, series_flags,
+    use_case_flags, port_flags,
+    json_extract(specs_json, '$.customization_options') AS customization_options_json,
+    (SELECT avg_rating FROM review_stats WHERE review_stats.product_id = products.id) AS community_rating,
+    (SELECT review_count FROM review_stats WHERE review_stats.product_id = products.id) AS community_review_count
+"""
+
+
+PRODUCT_CATALOG_ORDER = "CASE WHEN gpu_model LIKE '%5080%' THEN 0 ELSE 1 END, price_inr DESC, id ASC"
+
+
+PRODUCT_RECORD_FIELDS = (
+    "id",
+    "brand",
+    "series",
+    "model",
+    "sku",
+    "price",
+    "currency",
+    "region",
+    "product_url",
+    "image_url",
+    "cpu_brand",
+    "cpu_tier",
+    "cpu_model",
+    "ram_gb",
+    "storage_type",
+    "storage_gb",
+    "gpu_type",
+    "gpu_model",
+    "screen_size",
+    "resolution",
+    "refresh_hz",
+    "panel",
+    "weight_kg",
+    "battery_hours",
+    "battery_capacity_wh",
+    "ports",
+    "use_cases",
+    "rating",
+    "customization_available",
+) + tuple(PRODUCT_FACET_COLUMN_TYPES)
+PRODUCT_LAZY_FIELDS = (
+    "specs",
+    "benchmarks",
+    "buy_links",
+    "customization_options",
+    "battery_type",
+    "battery_type_display",
+    "community_rating",
+    "community_review_count",
+)
+
+
+def _extra_flag_property(key):
+    mask = 1 << PRODUCT_EXTRA_KEYS.index(key)
+    return property(lambda record: bool(record.extra_flags & mask))
+
+
+def _lazy_field_property(name, loader):
+    slot = f"_{name}"
+
+    def getter(record):
+        try:
+            return object.__getattribute__(record, slot)
+        except AttributeError:
+            value = loader(record)
+            object.__setattr__(record, slot, value)
+            return value
+
+    return property(getter)
+
+
+def _raw_product_value(record, key):
+    raw = record._raw
+    if raw is None or key not in raw.keys():
+        return None
+    return raw[key]
+
+
+def _load_record_specs(record):
+    specs = _json_loads(_raw_product_value(record, "specs_json"), {})
+    return _expand_configuration_reference(specs, _configuration_tree)
+
+
+def _load_record_customization_options(record):
+    if _raw_product_value(record, "specs_json") is not None:
+        return list(record.specs.get("customization_options") or [])
+    return _json_loads(_raw_product_value(record, "customization_options_json"), [])
+
+
+class _ProductRecord:
+    # Immutable, slotted product row. The six boolean extras share one bitfield and the heavy
+    # JSON fields are decoded from the raw row on first access, then cached in their slot.
+    __slots__ = PRODUCT_RECORD_FIELDS + ("extra_flags", "_raw") + tuple(f"_{name}" for name in PRODUCT_LAZY_FIELDS)
+
+    def __init__(self, fields, raw=None):
+        for name in PRODUCT_RECORD_FIELDS:
+            object.__setattr__(self, name, fields.get(name))
+        extra_flags = _flag_bits([key for key in PRODUCT_EXTRA_KEYS if fields.get(key)], PRODUCT_EXTRA_KEYS)
+        object.__setattr__(self, "extra_flags", extra_flags)
+        object.__setattr__(self, "_raw", raw)
+        for name in PRODUCT_LAZY_FIELDS:
+            if name in fields:
+                object.__setattr__(self, f"_{name}", fields[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        return f"<{type(self).__name__} id={self.id} sku={self.sku}>"
+
+    # Mapping-style access keeps the existing item["price"] / item.get(...) call sites working.
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return hasattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def replace(self, **changes):
+        fields = {name: getattr(self, name) for name in PRODUCT_RECORD_FIELDS + PRODUCT_EXTRA_KEYS}
+        for name in PRODUCT_LAZY_FIELDS:
+            try:
+                fields[name] = object.__getattribute__(self, f"_{name}")
+            except AttributeError:
+                continue
+        fields.update(changes)
+        return _ProductRecord(fields, raw=self._raw)
+
+    srgb_100 = _extra_flag_property("srgb_100")
+    dci_p3 = _extra_flag_property("dci_p3")
+    good_cooling = _extra_flag_property("good_cooling")
+    ram_upgradable = _extra_flag_property("ram_upgradable")
+    extra_ssd_slot = _extra_flag_property("extra_ssd_slot")
+    backlit_keyboard = _extra_flag_property("backlit_keyboard")
+
+    specs = _lazy_field_property("specs", _load_record_specs)
+    benchmarks = _lazy_field_property("benchmarks", lambda record: _json_loads(_raw_product_value(record, "benchmarks_json"), {}))
+    buy_links = _lazy_field_property("buy_links", lambda record: _json_loads(_raw_product_value(record, "buy_links_json"), []))
+    customization_options = _lazy_field_property("customization_options", _load_record_customization_options)
+    battery_type = _lazy_field_property(
+        "battery_type",
+        lambda record: _normalize_battery_type_text(_raw_product_value(record, "battery_type") or ""),
+    )
+    battery_type_display = _lazy_field_property(
+        "battery_type_display",
+        lambda record: _battery_type_display(record.battery_type, record.battery_capacity_wh),
+    )
+    # Only list-column rows carry the review_stats lookups; full rows read as unrated.
+    community_rating = _lazy_field_property("community_rating", lambda record: _raw_product_value(record, "community_rating"))
+    community_review_count = _lazy_field_property(
+        "community_review_count",
+        lambda record: _raw_product_value(record, "community_review_count") or 0,
+    )
+
+
+def _ensure_products_search_index(connection):
+    # FTS5 is optional in some SQLite builds; without it the finder keeps its substring scan.
+    try:
+        connection.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS products_search USING fts5(
+                brand, series, model, sku, cpu_model, gpu_model, panel,
+                content = 'products', content_rowid = 'id'
+            )
+            """
+        )
+    except sqlite3.OperationalError:
+        _SEARCH_INDEX_STATE[HP_DB_PATH] = False
+        return False
+    _SEARCH_INDEX_STATE[HP_DB_PATH] = True
+    return True
+
+
+def _rebuild_products_search_index(connection):
+    try:
+        connection.execute("INSERT INTO products_search (products_search) VALUES ('rebuild')")
+    except sqlite3.OperationalError:
+        return
+
+
+def _search_match_expression(query):
+    tokens = re.findall(r"\w+", str(query or "").lower())
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+_SEARCH_INDEX_STATE = {}
+
+
+def _products_search_available():
+    available = _SEARCH_INDEX_STATE.get(HP_DB_PATH)
+    if available is None:
+        with _db_connect() as connection:
+            available = connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'products_search'").fetchone() is not None
+        _SEARCH_INDEX_STATE[HP_DB_PATH] = available
+    return available
+
+
+def _finder_search_expression(query):
+    # The FTS5 match for a finder search, or None when the substring scan has to stand in.
+    match_expression = _search_match_expression(query)
+    if not match_expression or not _products_search_available():
+        return None
+    return match_expression
 
 
 def _row_to_product(row):
-    battery_type = _normalize_battery_type_text(row["battery_type"] or "")
-    battery_capacity_wh = row["battery_capacity_wh"]
-    specs = _json_loads(row["specs_json"], {})
-    return {
-        "id": row["id"],
-        "brand": row["brand"],
-        "series": row["series"],
-        "model": row["model"],
-        "sku": row["sku"],
-        "price": row["price_inr"],
-        "currency": row["currency"],
-        "region": row["region"],
-        "product_url": row["product_url"],
-        "image_url": _normalize_image_url(row["image_url"] or ""),
-        "cpu_brand": row["cpu_brand"],
-        "cpu_tier": row["cpu_tier"],
-        "cpu_model": row["cpu_model"],
-        "ram_gb": row["ram_gb"],
-        "storage_type": row["storage_type"],
-        "storage_gb": row["storage_gb"],
-        "gpu_type": row["gpu_type"],
-        "gpu_model": row["gpu_model"],
-        "screen_size": row["screen_size"],
-        "resolution": row["resolution"],
-        "refresh_hz": row["refresh_hz"],
-        "panel": row["panel"],
-        "weight_kg": row["weight_kg"],
-        "battery_hours": row["battery_hours"],
-        "battery_capacity_wh": battery_capacity_wh,
-        "battery_type": battery_type,
-        "battery_type_display": _battery_type_display(battery_type, battery_capacity_wh),
-        "ports": _json_loads(row["ports_json"], []),
-        "use_cases": _json_loads(row["use_cases_json"], []),
-        "specs": specs,
-        "benchmarks": _json_loads(row["benchmarks_json"], {}),
-        "buy_links": _json_loads(row["buy_links_json"], []),
-        "srgb_100": bool(row["srgb_100"]),
-        "dci_p3": bool(row["dci_p3"]),
-        "good_cooling": bool(row["good_cooling"]),
-        "ram_upgradable": bool(row["ram_upgradable"]),
-        "extra_ssd_slot": bool(row["extra_ssd_slot"]),
-        "backlit_keyboard": bool(row["backlit_keyboard"]),
-        "rating": float(row["rating"] or 0),
-        "customization_available": _has_native_configuration(specs),
-    }
+    return _ProductRecord(
+        {
+            "id": row["id"],
+            "brand": row["brand"],
+            "series": row["series"],
+            "model": row["model"],
+            "sku": row["sku"],
+            "price": row["price_inr"],
+            "currency": row["currency"],
+            "region": row["region"],
+            "product_url": row["product_url"],
+            "image_url": _normalize_image_url(row["image_url"] or ""),
+            "cpu_brand": row["cpu_brand"],
+            "cpu_tier": row["cpu_tier"],
+            "cpu_model": row["cpu_model"],
+            "ram_gb": row["ram_gb"],
+            "storage_type": row["storage_type"],
+            "storage_gb": row["storage_gb"],
+            "gpu_type": row["gpu_type"],
+            "gpu_model": row["gpu_model"],
+            "screen_size": row["screen_size"],
+            "resolution": row["resolution"],
+            "refresh_hz": row["refresh_hz"],
+            "panel": row["panel"],
+            "weight_kg": row["weight_kg"],
+            "battery_hours": row["battery_hours"],
+            "battery_capacity_wh": row["battery_capacity_wh"],
+            "ports": _json_loads(row["ports_json"], []),
+            "use_cases": _json_loads(row["use_cases_json"], []),
+            "srgb_100": row["srgb_100"],
+            "dci_p3": row["dci_p3"],
+            "good_cooling": row["good_cooling"],
+            "ram_upgradable": row["ram_upgradable"],
+            "extra_ssd_slot": row["extra_ssd_slot"],
+            "backlit_keyboard": row["backlit_keyboard"],
+            "rating": float(row["rating"] or 0),
+            "customization_available": bool(row["customization_available"]),
+            "screen_bucket": row["screen_bucket"],
+            "weight_bucket": row["weight_bucket"],
+            "battery_bucket": row["battery_bucket"],
+            "refresh_bucket": row["refresh_bucket"],
+            "resolution_class": row["resolution_class"],
+            "panel_flags": row["panel_flags"],
+            "series_flags": row["series_flags"],
+            "use_case_flags": row["use_case_flags"],
+            "port_flags": row["port_flags"],
+        },
+        raw=row,
+    )
+
+
+_CATALOG_META = {"entry": None}
 
 
-def _fetch_hp_products():
+def _fetch_catalog_meta():
+    # Every cache key (pages, suggestions, counts, cards) carries these versions, so reading them is on
+    # every request's path. Other processes' writes (refresh command, sibling workers) show within the TTL.
+    now = time.monotonic()
+    entry = _CATALOG_META["entry"]
+    if entry is not None and entry[0] == HP_DB_PATH and now < entry[1]:
+        return entry[2]
     with _db_connect() as connection:
         rows = connection.execute(
-            """
-            SELECT *
-            FROM products
-            ORDER BY
-                CASE WHEN gpu_model LIKE '%5080%' THEN 0 ELSE 1 END,
-                price_inr DESC,
-                id ASC
-            """
+            "SELECT key, value FROM catalog_meta WHERE key IN ('catalog_version', 'review_stats_version')"
         ).fetchall()
-    return [_row_to_product(row) for row in rows]
+    values = {row["key"]: row["value"] for row in rows}
+    _CATALOG_META["entry"] = (HP_DB_PATH, now + CATALOG_META_TTL_SECONDS, values)
+    return values
+
+
+def _forget_catalog_meta():
+    _CATALOG_META["entry"] = None
+
+
+def _fetch_catalog_version():
+    return _fetch_catalog_meta().get("catalog_version", "")
+
+
+def _fetch_review_stats_version():
+    return _fetch_catalog_meta().get("review_stats_version", "0")
+
+
+def _fetch_finder_version():
+    # Finder arrays and cards carry community ratings, so they turn over with reviews as well as reseeds.
+    values = _fetch_catalog_meta()
+    return f"{values.get('catalog_version', '')}-{values.get('review_stats_version', '0')}"
 
 
 def _fetch_hp_product(product_id):
@@ -5877,7 +7090,7 @@ def _fetch_products_by_ids(product_ids):
     placeholders = ",".join("?" for _ in product_ids)
     with _db_connect() as connection:
         rows = connection.execute(
-            f"SELECT * FROM products WHERE id IN ({placeholders})",
+            f"SELECT {PRODUCT_LIST_COLUMNS} FROM products WHERE id IN ({placeholders})",
             product_ids,
         ).fetchall()
     products_by_id = {row["id"]: _row_to_product(row) for row in rows}
@@ -5907,25 +7120,25 @@ def _extract_price_delta(value):
     return -amount if match.group(1) == "-" else amount
 
 
-def _prepare_native_configuration(product):
-    specs = product.get("specs") or {}
-    product["customization_available"] = _has_native_configuration(specs)
-    configuration = specs.get("configuration")
-    if not isinstance(configuration, dict):
-        return product
+def _configuration_option_price_delta(option):
+    primary_delta = _extract_price_delta(option.get("price_note", ""))
+    fallback_delta = _extract_price_delta(option.get("alt_price_note", ""))
+    return primary_delta if primary_delta else fallback_delta
 
-    categories = configuration.get("categories")
-    if not isinstance(categories, list):
-        return product
 
-    configuration["base_price"] = int(product.get("price") or 0)
+def _precompute_native_configuration(specs, base_price):
+    # Runs at ingest so detail views and the configuration API read option keys, deltas and defaults as stored.
+    configuration = specs.get("configuration") if isinstance(specs, dict) else None
+    if not isinstance(configuration, dict) or not isinstance(configuration.get("categories"), list):
+        return specs
 
-    for category_index, category in enumerate(categories):
+    categories = []
+    for category_index, category in enumerate(configuration["categories"]):
         if not isinstance(category, dict):
+            categories.append(category)
             continue
 
-        category["key"] = f"cfg_{category_index}"
-        options = category.get("options") or []
+        options = [dict(option) if isinstance(option, dict) else option for option in category.get("options") or []]
         selected_index = None
 
         for option_index, option in enumerate(options):
@@ -5934,12 +7147,7 @@ def _prepare_native_configuration(product):
             if option.get("included"):
                 selected_index = option_index
 
-            if option.get("included"):
-                option["price_delta"] = 0
-            else:
-                primary_delta = _extract_price_delta(option.get("price_note", ""))
-                fallback_delta = _extract_price_delta(option.get("alt_price_note", ""))
-                option["price_delta"] = primary_delta if primary_delta else fallback_delta
+            option["price_delta"] = 0 if option.get("included") else _configuration_option_price_delta(option)
 
         if selected_index is None and options:
             selected_index = 0
@@ -5948,42 +7156,633 @@ def _prepare_native_configuration(product):
                 first_option["included"] = True
                 first_option["price_delta"] = 0
 
-        category["selected_option_index"] = selected_index if selected_index is not None else 0
-
-    return product
+        categories.append(
+            dict(
+                category,
+                key=f"cfg_{category_index}",
+                options=options,
+                selected_option_index=selected_index if selected_index is not None else 0,
+            )
+        )
 
+    return dict(specs, configuration=dict(configuration, base_price=int(base_price or 0), categories=categories))
 
-def _fetch_product_reviews(product_id):
-    with _db_connect() as connection:
-        rows = connection.execute(
-            """
-            SELECT id, product_id, name, rating, pros, cons, experience, status, created_at
-            FROM reviews
-            WHERE product_id = ? AND status = 'approved'
-            ORDER BY datetime(created_at) DESC, id DESC
-            """,
-            (product_id,),
-        ).fetchall()
 
-    reviews = []
+def _split_configuration_tree(configuration):
+    # Variants of a series share their option catalog and differ only in the included flags (plus,
+    # once precomputed, the selected index and base price). The shared tree is keyed by its content
+    # hash; the variant keeps a reference with its own selections.
+    if not isinstance(configuration, dict) or "tree" in configuration:
+        return None
+    categories = configuration.get("categories")
+    if not isinstance(categories, list) or not categories:
+        return None
+    for category in categories:
+        if not isinstance(category, dict) or not isinstance(category.get("options"), list):
+            return None
+        if not all(isinstance(option, dict) for option in category["options"]):
+            return None
+
+    tree_categories = []
+    included = []
+    selected = []
+    for category in categories:
+        options = []
+        for option in category["options"]:
+            tree_option = {key: value for key, value in option.items() if key != "included"}
+            # Stored as the not-included delta; an included option reads as 0 when assembled.
+            if "price_delta" in option:
+                tree_option["price_delta"] = _configuration_option_price_delta(option)
+            options.append(tree_option)
+        tree_category = {key: value for key, value in category.items() if key != "selected_option_index"}
+        tree_category["options"] = options
+        tree_categories.append(tree_category)
+        included.append([index for index, option in enumerate(category["options"]) if option.get("included")])
+        if "selected_option_index" in category:
+            selected.append(category["selected_option_index"])
+
+    tree = {key: value for key, value in configuration.items() if key != "base_price"}
+    tree["categories"] = tree_categories
+    tree_hash = hashlib.sha1(_json_dumps(tree).encode("utf-8")).hexdigest()[:16]
+    reference = {"tree": tree_hash, "included": included}
+    if len(selected) == len(categories):
+        reference["selected"] = selected
+    if "base_price" in configuration:
+        reference["base_price"] = configuration["base_price"]
+    return tree_hash, tree, reference
+
+
+def _assemble_configuration(reference, tree):
+    included = reference.get("included") or []
+    selected = reference.get("selected")
+    categories = []
+    for category_index, category in enumerate(tree.get("categories", [])):
+        included_indexes = included[category_index] if category_index < len(included) else []
+        options = []
+        for option_index, option in enumerate(category["options"]):
+            option = dict(option, included=option_index in included_indexes)
+            if option["included"] and "price_delta" in option:
+                option["price_delta"] = 0
+            options.append(option)
+        assembled = dict(category, options=options)
+        if selected is not None and category_index < len(selected):
+            assembled["selected_option_index"] = selected[category_index]
+        categories.append(assembled)
+    configuration = dict(tree, categories=categories)
+    if "base_price" in reference:
+        configuration["base_price"] = reference["base_price"]
+    return configuration
+
+
+def _expand_configuration_reference(specs, tree_lookup):
+    reference = specs.get("configuration") if isinstance(specs, dict) else None
+    if not isinstance(reference, dict) or "tree" not in reference:
+        return specs
+    tree = tree_lookup(reference["tree"])
+    if not isinstance(tree, dict):
+        return dict(specs, configuration={})
+    return dict(specs, configuration=_assemble_configuration(reference, tree))
+
+
+def _compact_configuration(specs, configuration_trees):
+    split = _split_configuration_tree(specs.get("configuration") if isinstance(specs, dict) else None)
+    if split is None:
+        return specs
+    tree_hash, tree, reference = split
+    configuration_trees.setdefault(tree_hash, tree)
+    return dict(specs, configuration=reference)
+
+
+_CONFIGURATION_TREES = {}
+
+
+def _configuration_tree(tree_hash):
+    # Trees are content-addressed, so a cached tree can never go stale; a miss reloads them all.
+    tree = _CONFIGURATION_TREES.get(tree_hash)
+    if tree is None:
+        try:
+            with _db_connect() as connection:
+                rows = connection.execute("SELECT tree_hash, tree_json FROM configuration_trees").fetchall()
+        except sqlite3.OperationalError:
+            return None
+        for row in rows:
+            _CONFIGURATION_TREES[row["tree_hash"]] = _json_loads(row["tree_json"], None)
+        tree = _CONFIGURATION_TREES.get(tree_hash)
+    return tree
+
+
+def _configuration_category_name(raw_name):
+    name = _normalize_lenovo_category(raw_name)
+    if name:
+        return name
+    cleaned = re.sub(r"\s+", " ", _strip_tags(unescape(raw_name or ""))).strip()
+    return CONFIGURATION_CATEGORY_ALIASES.get(cleaned, cleaned)
+
+
+def _configuration_option_facets(category_name, option_name):
+    ram_gb = None
+    gpu_model = None
+    if category_name == "Memory":
+        ram_match = re.search(r"(\d+)\s*GB", option_name, re.I)
+        ram_gb = int(ram_match.group(1)) if ram_match else None
+    elif category_name == "Graphics Card":
+        normalized_gpu = _normalize_gpu_model(option_name)
+        gpu_model = normalized_gpu if normalized_gpu in FINDER_GPU_MODELS else None
+    return _canonical_lenovo_option_key(category_name, option_name), ram_gb, gpu_model
+
+
+def _rebuild_configuration_index(connection):
+    rows = connection.execute(
+        """
+        SELECT id, json_extract(specs_json, '$.configuration') AS configuration_json
+        FROM products
+        WHERE customization_available = 1
+        ORDER BY id
+        """
+    ).fetchall()
+    trees = {
+        row["tree_hash"]: _json_loads(row["tree_json"], None)
+        for row in connection.execute("SELECT tree_hash, tree_json FROM configuration_trees").fetchall()
+    }
+    # Variants repeat the same category and option names, so each is normalized once per rebuild.
+    category_names = {}
+    option_facets = {}
+    category_rows = []
+    option_rows = []
     for row in rows:
-        review = dict(row)
+        specs = _expand_configuration_reference({"configuration": _json_loads(row["configuration_json"], {})}, trees.get)
+        for category_index, category in enumerate(specs["configuration"].get("categories") or []):
+            if not isinstance(category, dict):
+                continue
+            raw_name = str(category.get("name", ""))
+            if raw_name not in category_names:
+                category_names[raw_name] = _configuration_category_name(raw_name)
+            category_name = category_names[raw_name]
+            category_rows.append((row["id"], category_index, category_name, category.get("selected_option_index", 0)))
+            for option_index, option in enumerate(category.get("options") or []):
+                if not isinstance(option, dict):
+                    continue
+                option_name = str(option.get("name", ""))
+                facet_key = (category_name, option_name)
+                if facet_key not in option_facets:
+                    option_facets[facet_key] = _configuration_option_facets(category_name, option_name)
+                option_key, ram_gb, gpu_model = option_facets[facet_key]
+                option_rows.append(
+                    (
+                        row["id"],
+                        category_index,
+                        option_index,
+                        category_name,
+                        option_key,
+                        option_name,
+                        int(option.get("price_delta") or 0),
+                        int(bool(option.get("included"))),
+                        ram_gb,
+                        gpu_model,
+                    )
+                )
+
+    connection.execute("DELETE FROM configuration_options")
+    connection.execute("DELETE FROM configuration_categories")
+    connection.executemany(
+        "INSERT INTO configuration_categories (product_id, category_index, name, selected_option_index) VALUES (?, ?, ?, ?)",
+        category_rows,
+    )
+    connection.executemany(
+        """
+        INSERT INTO configuration_options (
+            product_id, category_index, option_index, category, option_key, name, price_delta, included, ram_gb, gpu_model
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        option_rows,
+    )
+
+
+def _configurable_product_query(filters):
+    # Each selected facet must be offered by some option of the product; values within a facet are alternatives.
+    queries = []
+    params = []
+    if filters["config_ram"]:
+        queries.append("SELECT product_id FROM configuration_options WHERE ram_gb IN (SELECT value FROM json_each(?))")
+        params.append(_json_dumps(filters["config_ram"]))
+    if filters["config_gpu"]:
+        queries.append("SELECT product_id FROM configuration_options WHERE gpu_model IN (SELECT value FROM json_each(?))")
+        params.append(_json_dumps(filters["config_gpu"]))
+    if not queries:
+        return None
+    return " INTERSECT ".join(queries), params
+
+
+def _parse_configuration_selection(values):
+    selection = {}
+    for key, value in values.items():
+        if not key.startswith("cfg_"):
+            continue
+        category_index = _to_int(key[4:])
+        option_index = _to_int(value)
+        if category_index is None or option_index is None:
+            return None
+        selection[category_index] = option_index
+    return tuple(sorted(selection.items()))
+
+
+_CONFIGURE_CACHE = OrderedDict()
+_CONFIGURE_CACHE_LOCK = threading.Lock()
+
+
+def _resolve_configuration_price(product_id, catalog_version, selection):
+    # The catalog version is part of the memo key so a reseed never serves old prices. Only
+    # successful resolutions are kept, so unknown ids and bad selections cannot evict real entries.
+    key = (product_id, catalog_version, selection)
+    with _CONFIGURE_CACHE_LOCK:
+        payload = _CONFIGURE_CACHE.get(key)
+        if payload is not None:
+            _CONFIGURE_CACHE.move_to_end(key)
+            return 200, payload
+    status, payload = _compute_configuration_price(product_id, selection)
+    if status == 200:
+        with _CONFIGURE_CACHE_LOCK:
+            _CONFIGURE_CACHE[key] = payload
+            while len(_CONFIGURE_CACHE) > CONFIGURE_CACHE_SIZE:
+                _CONFIGURE_CACHE.popitem(last=False)
+    return status, payload
+
+
+def _compute_configuration_price(product_id, selection):
+    # Deltas are additive per category, so a selection resolves in one pass over the categories.
+    product = _fetch_hp_product(product_id)
+    if not product:
+        return 404, {"error": "Product not found."}
+    if not _has_native_configuration(product["specs"]):
+        return 404, {"error": "This product has no native configuration."}
+
+    configuration = product["specs"]["configuration"]
+    categories = {category["key"]: category for category in configuration["categories"] if isinstance(category, dict)}
+    chosen = {f"cfg_{category_index}": option_index for category_index, option_index in selection}
+    unknown = sorted(key for key in chosen if key not in categories)
+    if unknown:
+        return 400, {"error": f"Unknown configuration categories: {', '.join(unknown)}.", "valid_categories": list(categories)}
+
+    base_price = int(configuration.get("base_price") or product["price"] or 0)
+    total_delta = 0
+    resolved = {}
+    summary = []
+    for key, category in categories.items():
+        options = category.get("options") or []
+        default_index = category.get("selected_option_index") or 0
+        option_index = chosen.get(key, default_index)
+        if option_index < 0 or option_index >= len(options) or not isinstance(options[option_index], dict):
+            return 400, {"error": f"{key} must be an option index between 0 and {len(options) - 1}."}
+        option = options[option_index]
+        price_delta = int(option.get("price_delta") or 0)
+        total_delta += price_delta
+        resolved[key] = option_index
+        summary.append(
+            {
+                "key": key,
+                "category": category.get("name", ""),
+                "option": option.get("name", ""),
+                "price_delta": price_delta,
+                "is_default": option_index == default_index,
+            }
+        )
+
+    return 200, {
+        "product_id": product_id,
+        "base_price": base_price,
+        "price_delta": total_delta,
+        "price": base_price + total_delta,
+        "selection": resolved,
+        "summary": summary,
+    }
+
+
+def _review_from_row(row):
+    review = dict(row)
+    review["pros_points"] = _json_loads(review.pop("pros_points_json"), None)
+    review["cons_points"] = _json_loads(review.pop("cons_points_json"), None)
+    if review["pros_points"] is None:
         review["pros_points"] = _split_bullet_points(review.get("pros"))
+    if review["cons_points"] is None:
         review["cons_points"] = _split_bullet_points(review.get("cons"))
-        reviews.append(review)
-    return reviews
+    return review
+
+
+def _fetch_product_reviews(product_id, after=None, limit=REVIEWS_PAGE_SIZE):
+    # Keyset pagination over (created_at, id) newest first; `after` is the id of the last review already shown.
+    # CURRENT_TIMESTAMP text sorts chronologically, so the index orders rows without datetime().
+    query = """
+        SELECT id, product_id, name, rating, pros, cons, pros_points_json, cons_points_json, experience, status, created_at
+        FROM reviews
+        WHERE product_id = ? AND status = 'approved'
+    """
+    params = [product_id]
+    if after is not None:
+        query += " AND (created_at, id) < (SELECT created_at, id FROM reviews WHERE id = ?)"
+        params.append(after)
+    query += " ORDER BY created_at DESC, id DESC LIMIT ?"
+    params.append(limit + 1)
+    with _db_connect() as connection:
+        rows = connection.execute(query, params).fetchall()
+
+    reviews = [_review_from_row(row) for row in rows[:limit]]
+    next_after = reviews[-1]["id"] if len(rows) > limit else None
+    return reviews, next_after
 
 
 def _insert_product_review(product_id, name, rating, pros, cons, experience, status):
     with _db_connect() as connection:
         connection.execute(
             """
-            INSERT INTO reviews (product_id, name, rating, pros, cons, experience, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            INSERT INTO reviews (product_id, name, rating, pros, cons, pros_points_json, cons_points_json, experience, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (product_id, name, rating, pros, cons, experience, status),
+            (
+                product_id,
+                name,
+                rating,
+                pros,
+                cons,
+                _json_dumps(_split_bullet_points(pros)),
+                _json_dumps(_split_bullet_points(cons)),
+                experience,
+                status,
+            ),
+        )
+        connection.commit()
+    _forget_catalog_meta()
+    _invalidate_product_pages(product_id)
+
+
+_REVIEW_QUEUE_STATE = {"ready_path": None, "writer_pid": None}
+_REVIEW_QUEUE_LOCK = threading.Lock()
+
+
+def _review_queue_connect():
+    # A separate small WAL database: enqueueing never waits on the catalog database's write lock.
+    connection = sqlite3.connect(REVIEW_QUEUE_PATH, timeout=30)
+    connection.row_factory = sqlite3.Row
+    if _REVIEW_QUEUE_STATE["ready_path"] != REVIEW_QUEUE_PATH:
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pending_reviews (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                submission_id TEXT NOT NULL UNIQUE,
+                product_id INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                rating INTEGER NOT NULL,
+                pros TEXT NOT NULL,
+                cons TEXT NOT NULL,
+                experience TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """
         )
         connection.commit()
+        _REVIEW_QUEUE_STATE["ready_path"] = REVIEW_QUEUE_PATH
+    connection.execute("PRAGMA synchronous = FULL")
+    return connection
+
+
+def _enqueue_product_review(product_id, name, rating, pros, cons, experience, status):
+    with _review_queue_connect() as connection:
+        connection.execute(
+            """
+            INSERT INTO pending_reviews (submission_id, product_id, name, rating, pros, cons, experience, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (os.urandom(16).hex(), product_id, name, rating, pros, cons, experience, status),
+        )
+    _metric_inc("laptop_review_queue_total", (("event", "queued"),))
+    _start_review_writer()
+
+
+def _flush_review_queue(limit=REVIEW_QUEUE_BATCH_SIZE):
+    with _review_queue_connect() as queue:
+        rows = queue.execute("SELECT * FROM pending_reviews ORDER BY id LIMIT ?", (limit,)).fetchall()
+    if not rows:
+        return 0
+
+    # One transaction per batch. submission_id makes the move idempotent, so a batch that was committed
+    # but not yet deleted from the queue (a crash, or two workers flushing at once) is not inserted twice.
+    # Reviews for products dropped by a reseed are discarded rather than failing the foreign key.
+    with _db_connect() as connection:
+        inserted = 0
+        duplicates = 0
+        for row in rows:
+            cursor = connection.execute(
+                """
+                INSERT INTO reviews (
+                    product_id, name, rating, pros, cons, pros_points_json, cons_points_json,
+                    experience, status, created_at, submission_id
+                )
+                SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+                WHERE EXISTS (SELECT 1 FROM products WHERE id = ?)
+                ON CONFLICT(submission_id) DO NOTHING
+                """,
+                (
+                    row["product_id"],
+                    row["name"],
+                    row["rating"],
+                    row["pros"],
+                    row["cons"],
+                    _json_dumps(_split_bullet_points(row["pros"])),
+                    _json_dumps(_split_bullet_points(row["cons"])),
+                    row["experience"],
+                    row["status"],
+                    row["created_at"],
+                    row["submission_id"],
+                    row["product_id"],
+                ),
+            )
+            if cursor.rowcount:
+                inserted += cursor.rowcount
+            elif connection.execute("SELECT 1 FROM reviews WHERE submission_id = ?", (row["submission_id"],)).fetchone():
+                duplicates += 1
+        connection.commit()
+    with _review_queue_connect() as queue:
+        queue.execute(
+            "DELETE FROM pending_reviews WHERE id IN (SELECT value FROM json_each(?))",
+            (_json_dumps([row["id"] for row in rows]),),
+        )
+
+    _metric_inc("laptop_review_queue_total", (("event", "flushed"),), inserted)
+    _metric_inc("laptop_review_queue_total", (("event", "duplicate"),), duplicates)
+    _metric_inc("laptop_review_queue_total", (("event", "dropped"),), len(rows) - inserted - duplicates)
+    _forget_catalog_meta()
+    for product_id in {row["product_id"] for row in rows}:
+        _invalidate_product_pages(product_id)
+    return len(rows)
+
+
+def _drain_review_queue():
+    while _flush_review_queue() == REVIEW_QUEUE_BATCH_SIZE:
+        continue
+
+
+def _review_writer_loop():
+    # Group commit: whatever arrived during the last interval goes into the catalog database together.
+    while True:
+        time.sleep(REVIEW_QUEUE_FLUSH_SECONDS)
+        try:
+            _drain_review_queue()
+        except Exception:
+            # The thread must outlive any failure: writer_pid keeps another one from starting in this process.
+            _metric_inc("laptop_review_queue_total", (("event", "error"),))
+
+
+def _start_review_writer():
+    # Keyed by pid so each forked worker starts its own writer thread.
+    with _REVIEW_QUEUE_LOCK:
+        if _REVIEW_QUEUE_STATE["writer_pid"] == os.getpid():
+            return
+        _REVIEW_QUEUE_STATE["writer_pid"] = os.getpid()
+    threading.Thread(target=_review_writer_loop, name="review-writer", daemon=True).start()
+
+
+def _moderation_authorized():
+    token = request.headers.get("X-Moderation-Token", "")
+    return bool(MODERATION_TOKEN) and hmac.compare_digest(token.encode("utf-8"), MODERATION_TOKEN.encode("utf-8"))
+
+
+def _parse_moderation_actions(payload):
+    # Accepts {"ids": [...], "status": ...} or {"actions": [...]} of the same shape. Instead of ids an action
+    # may select every review in from_status (optionally for one product_id, optionally up to max_id).
+    if not isinstance(payload, dict):
+        return None, "Send a JSON object."
+    raw_actions = payload.get("actions", [payload])
+    if not isinstance(raw_actions, list) or not raw_actions:
+        return None, "actions must be a non-empty list."
+    actions = []
+    total_ids = 0
+    for raw in raw_actions:
+        if not isinstance(raw, dict):
+            return None, "Each action must be an object."
+        status = raw.get("status")
+        from_status = raw.get("from_status", "pending")
+        if status not in REVIEW_STATUSES or from_status not in REVIEW_STATUSES:
+            return None, f"status and from_status must be one of: {', '.join(REVIEW_STATUSES)}."
+        ids = raw.get("ids")
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(value, int) and not isinstance(value, bool) for value in ids):
+                return None, "ids must be a list of integer review ids."
+            total_ids += len(ids)
+        product_id = raw.get("product_id")
+        max_id = raw.get("max_id")
+        if ids is None and raw.get("all") is not True:
+            return None, 'Pass ids, or "all": true to select every review in from_status.'
+        for name, value in (("product_id", product_id), ("max_id", max_id)):
+            if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+                return None, f"{name} must be an integer."
+        actions.append({"ids": ids, "status": status, "from_status": from_status, "product_id": product_id, "max_id": max_id})
+    if total_ids > MODERATION_MAX_IDS:
+        return None, f"At most {MODERATION_MAX_IDS} ids per request."
+    return actions, None
+
+
+def _moderation_where(action):
+    clauses = ["status = ?"]
+    params = [action["from_status"]]
+    if action["ids"] is not None:
+        # One JSON parameter keeps large id batches under SQLite's variable limit.
+        clauses.append("id IN (SELECT value FROM json_each(?))")
+        params.append(_json_dumps(action["ids"]))
+    if action["product_id"] is not None:
+        clauses.append("product_id = ?")
+        params.append(action["product_id"])
+    if action["max_id"] is not None:
+        clauses.append("id <= ?")
+        params.append(action["max_id"])
+    return " AND ".join(clauses), params
+
+
+def _apply_review_moderation(actions):
+    # All actions commit together; the review_stats triggers adjust the aggregates row by row in the
+    # same transaction. Only the distinct affected product ids are read back, never the reviews.
+    results = []
+    product_ids = set()
+    with _db_connect() as connection:
+        for action in actions:
+            where, params = _moderation_where(action)
+            if action["status"] == action["from_status"]:
+                results.append(dict(action, updated=0))
+                continue
+            product_ids.update(
+                row["product_id"] for row in connection.execute(f"SELECT DISTINCT product_id FROM reviews WHERE {where}", params)
+            )
+            cursor = connection.execute(f"UPDATE reviews SET status = ? WHERE {where}", [action["status"]] + params)
+            results.append(dict(action, updated=cursor.rowcount))
+        connection.commit()
+    _forget_catalog_meta()
+    for product_id in product_ids:
+        _invalidate_product_pages(product_id)
+    return results, sorted(product_ids)
+
+
+def _fetch_reviews_for_moderation(status, after=None, limit=MODERATION_PAGE_SIZE):
+    query = """
+        SELECT id, product_id, name, rating, pros, cons, experience, status, created_at
+        FROM reviews
+        WHERE status = ?
+    """
+    params = [status]
+    if after is not None:
+        query += " AND id > ?"
+        params.append(after)
+    query += " ORDER BY id LIMIT ?"
+    params.append(limit + 1)
+    with _db_connect() as connection:
+        rows = connection.execute(query, params).fetchall()
+    reviews = [dict(row) for row in rows[:limit]]
+    return reviews, reviews[-1]["id"] if len(rows) > limit else None
+
+
+def _fetch_review_stats(product_id):
+    with _db_connect() as connection:
+        row = connection.execute("SELECT * FROM review_stats WHERE product_id = ?", (product_id,)).fetchone()
+    count = row["review_count"] if row else 0
+    histogram = []
+    for stars in range(5, 0, -1):
+        stars_count = row[f"rating_{stars}"] if row else 0
+        histogram.append({"stars": stars, "count": stars_count, "percent": round(stars_count * 100 / count) if count else 0})
+    return {"count": count, "average": row["avg_rating"] if row and count else None, "histogram": histogram}
+
+
+def _ensure_reviews_schema(connection):
+    columns = {row["name"] for row in connection.execute("PRAGMA table_info(reviews)").fetchall()}
+    for column in ("pros_points_json", "cons_points_json"):
+        if column not in columns:
+            connection.execute(f"ALTER TABLE reviews ADD COLUMN {column} TEXT")
+    if "submission_id" not in columns:
+        connection.execute("ALTER TABLE reviews ADD COLUMN submission_id TEXT")
+    connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_reviews_submission ON reviews (submission_id)")
+    rows = connection.execute("SELECT id, pros, cons FROM reviews WHERE pros_points_json IS NULL OR cons_points_json IS NULL").fetchall()
+    connection.executemany(
+        "UPDATE reviews SET pros_points_json = ?, cons_points_json = ? WHERE id = ?",
+        [(_json_dumps(_split_bullet_points(row["pros"])), _json_dumps(_split_bullet_points(row["cons"])), row["id"]) for row in rows],
+    )
+
+
+def _ensure_review_stats(connection):
+    # Databases from before review_stats get a one-off backfill; the reviews triggers keep it current afterwards.
+    if connection.execute("SELECT 1 FROM review_stats LIMIT 1").fetchone():
+        return
+    connection.execute(
+        """
+        INSERT INTO review_stats (
+            product_id, review_count, rating_sum, rating_1, rating_2, rating_3, rating_4, rating_5, avg_rating
+        )
+        SELECT
+            product_id, COUNT(*), SUM(rating),
+            SUM(rating = 1), SUM(rating = 2), SUM(rating = 3), SUM(rating = 4), SUM(rating = 5),
+            ROUND(AVG(rating), 2)
+        FROM reviews
+        WHERE status = 'approved'
+        GROUP BY product_id
+        """
+    )
 
 
 def _format_storage(storage_gb):
@@ -5992,7 +7791,12 @@ def _format_storage(storage_gb):
     return f"{storage_gb}GB"
 
 
-_init_hp_database()
+if METRICS_FLUSH_ENABLED:
+    _prune_metrics_files()
+if CATALOG_INIT_ON_IMPORT:
+    _init_hp_database()
+_flush_metrics(force=True)
+atexit.register(_flush_metrics, True)
 
 BENCHMARKS = {
     "cpu": [
@@ -6012,6 +7816,279 @@ BENCHMARKS = {
 }
 
 
+STAGE_TIMINGS = {}
+
+
+@contextmanager
+def _measure_stage(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        g.setdefault("stage_timings", []).append((name, time.perf_counter() - started))
+
+
+def _timed_stage(name):
+    if not STAGE_TIMING_ENABLED:
+        return nullcontext()
+    return _measure_stage(name)
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(ceil(fraction * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def _stage_timing_summary():
+    summary = {}
+    for key, samples in sorted(STAGE_TIMINGS.items()):
+        values = sorted(samples)
+        summary[key] = {
+            "count": len(values),
+            "p50_ms": round(_percentile(values, 0.50) * 1000, 3),
+            "p95_ms": round(_percentile(values, 0.95) * 1000, 3),
+            "p99_ms": round(_percentile(values, 0.99) * 1000, 3),
+        }
+    return summary
+
+
+def _profile_token_valid():
+    token = request.headers.get("X-Profile-Token", "")
+    return bool(PROFILE_HEADER_TOKEN) and hmac.compare_digest(token.encode("utf-8"), PROFILE_HEADER_TOKEN.encode("utf-8"))
+
+
+def _should_profile_request():
+    if _profile_token_valid():
+        return True
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.before_request
+def _start_request_profile():
+    if not _should_profile_request():
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    g.profiler = profiler
+
+
+_PAGE_CACHE = {"generation": None, "pages": OrderedDict(), "bytes": 0, "disk_writes": 0}
+_PAGE_CACHE_LOCK = threading.Lock()
+
+
+def _page_cache_key():
+    if request.endpoint == "laptops":
+        query_map = _finder_query_map_from_filters(_parse_finder_filters(request.args))
+        params = [(key, value) for key, values in query_map.items() for value in values]
+        params.append(("_reviews", _fetch_review_stats_version()))
+    else:
+        params = sorted(request.args.items(multi=True))
+    key = f"{request.path}?{urlencode(params)}"
+    if request.endpoint == "product_detail":
+        # Reviews change the product page without touching the catalog version; the review_stats
+        # triggers bump review_stats_version on every approved change, so no review scan is needed.
+        key += f"#reviews={_fetch_review_stats_version()}"
+    return key
+
+
+def _page_cache_path(generation, key):
+    return os.path.join(PAGE_CACHE_DIR, str(generation), hashlib.sha1(key.encode("utf-8")).hexdigest() + ".html")
+
+
+def _prune_page_cache_dir(generation):
+    try:
+        names = os.listdir(PAGE_CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name != str(generation):
+            shutil.rmtree(os.path.join(PAGE_CACHE_DIR, name), ignore_errors=True)
+
+
+def _sweep_page_cache_dir(generation):
+    # Keys carrying an old review_stats_version are never read again; dropping the least recently
+    # written pages first keeps the store within PAGE_CACHE_DIR_MAX_BYTES.
+    directory = os.path.join(PAGE_CACHE_DIR, str(generation))
+    entries = []
+    try:
+        with os.scandir(directory) as scanned:
+            for entry in scanned:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        return
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_bytes <= PAGE_CACHE_DIR_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_bytes -= size
+
+
+def _page_cache_remember(generation, key, body):
+    with _PAGE_CACHE_LOCK:
+        if _PAGE_CACHE["generation"] != generation:
+            return
+        pages = _PAGE_CACHE["pages"]
+        previous = pages.pop(key, None)
+        if previous is not None:
+            _PAGE_CACHE["bytes"] -= len(previous)
+        pages[key] = body
+        _PAGE_CACHE["bytes"] += len(body)
+        while _PAGE_CACHE["bytes"] > PAGE_CACHE_MAX_BYTES and pages:
+            _, evicted = pages.popitem(last=False)
+            _PAGE_CACHE["bytes"] -= len(evicted)
+
+
+def _page_cache_get(generation, key):
+    with _PAGE_CACHE_LOCK:
+        if _PAGE_CACHE["generation"] != generation:
+            # A reseed invalidates every cached page, in memory and on disk.
+            _PAGE_CACHE["generation"] = generation
+            _PAGE_CACHE["pages"].clear()
+            _PAGE_CACHE["bytes"] = 0
+            if PAGE_CACHE_DIR:
+                _prune_page_cache_dir(generation)
+        body = _PAGE_CACHE["pages"].get(key)
+        if body is not None:
+            _PAGE_CACHE["pages"].move_to_end(key)
+            return body
+
+    if not PAGE_CACHE_DIR:
+        return None
+    path = _page_cache_path(generation, key)
+    try:
+        with open(path, "rb") as page_file:
+            body = page_file.read()
+        # Disk hits count as recent for _sweep_page_cache_dir.
+        os.utime(path)
+    except OSError:
+        return None
+    _page_cache_remember(generation, key, body)
+    return body
+
+
+def _page_cache_put(generation, key, body):
+    _page_cache_remember(generation, key, body)
+    if not PAGE_CACHE_DIR:
+        return
+    path = _page_cache_path(generation, key)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "wb") as page_file:
+            page_file.write(body)
+        os.replace(temp_path, path)
+    except OSError:
+        return
+    with _PAGE_CACHE_LOCK:
+        _PAGE_CACHE["disk_writes"] += 1
+        sweep = _PAGE_CACHE["disk_writes"] % PAGE_CACHE_DIR_SWEEP_EVERY == 0
+    if sweep:
+        _sweep_page_cache_dir(generation)
+
+
+def _invalidate_product_pages(product_id):
+    prefix = f"/product/{product_id}?"
+    with _PAGE_CACHE_LOCK:
+        pages = _PAGE_CACHE["pages"]
+        for key in [key for key in pages if key.startswith(prefix)]:
+            _PAGE_CACHE["bytes"] -= len(pages.pop(key))
+
+
+@app.before_request
+def _serve_cached_page():
+    # Sessions only ever carry flashed messages here, so any visitor without flashes is anonymous.
+    if not PAGE_CACHE_MAX_BYTES or app.debug or request.method != "GET" or request.endpoint not in PAGE_CACHE_ENDPOINTS:
+        return None
+    if g.get("profiler") is not None or session.get("_flashes"):
+        _metric_inc("laptop_page_cache_total", (("result", "bypass"),))
+        return None
+
+    generation = _fetch_catalog_version()
+    key = _page_cache_key()
+    body = _page_cache_get(generation, key)
+    if body is None:
+        _metric_inc("laptop_page_cache_total", (("result", "miss"),))
+        g.page_cache_entry = (generation, key)
+        return None
+    _metric_inc("laptop_page_cache_total", (("result", "hit"),))
+    response = app.response_class(body, mimetype="text/html")
+    response.headers["X-Page-Cache"] = "hit"
+    return response
+
+
+@app.after_request
+def _store_cached_page(response):
+    entry = g.pop("page_cache_entry", None)
+    if entry is None or response.status_code != 200 or response.mimetype != "text/html" or response.direct_passthrough:
+        return response
+    if session.modified or session.get("_flashes"):
+        return response
+    _page_cache_put(entry[0], entry[1], response.get_data())
+    response.headers["X-Page-Cache"] = "miss"
+    return response
+
+
+@app.after_request
+def _finish_request_instrumentation(response):
+    profiler = g.pop("profiler", None)
+    if profiler is not None:
+        profiler.disable()
+        try:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            profile_name = f"{request.endpoint or 'unknown'}-{int(time.time() * 1000)}-{os.getpid()}.pstats"
+            profiler.dump_stats(os.path.join(PROFILE_DIR, profile_name))
+        except OSError:
+            pass
+
+    stage_timings = g.get("stage_timings")
+    if stage_timings:
+        for name, seconds in stage_timings:
+            key = f"{request.endpoint}.{name}"
+            STAGE_TIMINGS.setdefault(key, deque(maxlen=STAGE_TIMING_WINDOW)).append(seconds)
+        response.headers["Server-Timing"] = ", ".join(
+            f"{name};dur={seconds * 1000:.2f}" for name, seconds in stage_timings
+        )
+    return response
+
+
+@app.after_request
+def _record_request_metrics(response):
+    endpoint = request.endpoint or "unmatched"
+    if endpoint != "static":
+        _metric_inc(
+            "laptop_http_requests_total",
+            (("endpoint", endpoint), ("method", request.method), ("status", response.status_code)),
+        )
+        started = g.get("request_started")
+        if started is not None:
+            _metric_observe("laptop_http_request_duration_seconds", time.perf_counter() - started, (("endpoint", endpoint),))
+    _flush_metrics()
+    return response
+
+
+@app.route("/metrics")
+def metrics():
+    # Every worker writes its own snapshot file; the scrape sums them so any worker can answer.
+    _flush_metrics(force=True)
+    counters, histograms = _collect_metrics()
+    return _render_metrics(counters, histograms), 200, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+
+
 @app.route("/")
 def home():
     return render_template("index.html", guide=HOME_GUIDE)
@@ -6039,22 +8116,20 @@ def finder():
 def _render_laptop_finder():
     filters = _parse_finder_filters(request.args)
 
-    catalog = _fetch_hp_products()
-    finder_options = _build_finder_options(catalog, filters)
-    filtered = [item for item in catalog if _matches_finder_filters(item, filters)]
-    ranked = _sort_finder_laptops(filtered, filters["sort"], filters["use_case"])
+    with _timed_stage("fetch"):
+        finder_version = _fetch_finder_version()
+    with _timed_stage("options"):
+        option_summary = _catalog_cached("finder_option_summary", finder_version, _fetch_finder_option_summary)
+        finder_options = _build_finder_options(option_summary, filters)
+    with _timed_stage("filter_sort"):
+        total_results, filters["page"], visible_laptops = _query_finder_page(filters, finder_version)
 
-    total_results = len(ranked)
     total_pages = max(1, ceil(total_results / filters["per_page"])) if total_results else 1
-    if filters["page"] > total_pages:
-        filters["page"] = total_pages
-
     start_index = (filters["page"] - 1) * filters["per_page"]
-    end_index = start_index + filters["per_page"]
-    visible_laptops = ranked[start_index:end_index]
 
-    query_map = _finder_query_map_from_filters(filters, include_page=False)
-    active_chips = _build_active_chips(filters, query_map)
+    with _timed_stage("chips"):
+        query_map = _finder_query_map_from_filters(filters, include_page=False)
+        active_chips = _build_active_chips(filters, query_map)
 
     prev_url = None
     if filters["page"] > 1:
@@ -6086,15 +8161,17 @@ def _render_laptop_finder():
         "next_url": next_url,
     }
 
-    return render_template(
-        "laptops.html",
-        laptops=visible_laptops,
-        filters=filters,
-        counts=counts,
-        active_chips=active_chips,
-        pagination=pagination,
-        options=finder_options,
-    )
+    with _timed_stage("render"):
+        laptop_cards = _render_finder_cards(visible_laptops, finder_version)
+        return render_template(
+            "laptops.html",
+            laptop_cards=laptop_cards,
+            filters=filters,
+            counts=counts,
+            active_chips=active_chips,
+            pagination=pagination,
+            options=finder_options,
+        )
 
 
 @app.route("/laptop/<int:laptop_id>")
@@ -6108,9 +8185,19 @@ def product_detail(product_id):
     if not product:
         return render_template("product_detail.html", product=None, reviews=[], product_id=product_id), 404
 
-    product = _prepare_native_configuration(product)
-    reviews = _fetch_product_reviews(product_id)
-    return render_template("product_detail.html", product=product, reviews=reviews, product_id=product_id)
+    reviews, reviews_next_after = _fetch_product_reviews(product_id, after=_to_int(request.args.get("reviews_after")))
+    review_stats = _fetch_review_stats(product_id)
+    similar_products = [similar for similar, _ in _fetch_similar_products(product_id, limit=4)]
+    return render_template(
+        "product_detail.html",
+        product=product,
+        reviews=reviews,
+        reviews_next_after=reviews_next_after,
+        reviews_paged=bool(request.args.get("reviews_after")),
+        review_stats=review_stats,
+        similar_products=similar_products,
+        product_id=product_id,
+    )
 
 
 @app.route("/product/<int:product_id>/review", methods=["POST"])
@@ -6149,7 +8236,8 @@ def product_review(product_id):
             flash(error, "error")
         return redirect(f"{url_for('product_detail', product_id=product_id)}#review-form")
 
-    _insert_product_review(
+    save_review = _enqueue_product_review if REVIEW_QUEUE_ENABLED else _insert_product_review
+    save_review(
         product_id=product_id,
         name=name,
         rating=rating,
@@ -6161,6 +8249,8 @@ def product_review(product_id):
 
     if DEFAULT_REVIEW_STATUS == "pending":
         flash("Review submitted and sent for moderation.", "success")
+    elif REVIEW_QUEUE_ENABLED:
+        flash("Review submitted successfully. It will appear here within a few seconds.", "success")
     else:
         flash("Review submitted successfully.", "success")
     return redirect(f"{url_for('product_detail', product_id=product_id)}#reviews")
@@ -6169,8 +8259,19 @@ def product_review(product_id):
 @app.route("/compare")
 def compare():
     selected_ids = _parse_compare_ids(request.args)
+    if request.args.get("mode") == "matrix" and selected_ids:
+        matrix = _compare_matrix_for(selected_ids)
+        return render_template("compare.html", laptops=[], matrix=matrix, selected_ids=selected_ids)
     selected_laptops = _fetch_products_by_ids(selected_ids)
-    return render_template("compare.html", laptops=selected_laptops, selected_ids=selected_ids)
+    return render_template("compare.html", laptops=selected_laptops, matrix=None, selected_ids=selected_ids)
+
+
+@app.route("/api/compare")
+def api_compare():
+    selected_ids = _parse_compare_ids(request.args)
+    if not selected_ids:
+        return jsonify({"error": "Pass up to 4 product ids as ids=1,2,3."}), 400
+    return jsonify(_compare_matrix_for(selected_ids))
 
 
 @app.route("/api/benchmarks")
@@ -6188,6 +8289,129 @@ def api_benchmarks():
     return jsonify(BENCHMARKS)
 
 
+@app.route("/api/product/<int:product_id>/configuration")
+def api_product_configuration(product_id):
+    product = _fetch_hp_product(product_id)
+    if not product:
+        return jsonify({"error": "Product not found."}), 404
+    if not _has_native_configuration(product["specs"]):
+        return jsonify({"error": "This product has no native configuration."}), 404
+    return jsonify({"product_id": product_id, "configuration": product["specs"]["configuration"]})
+
+
+@app.route("/api/product/<int:product_id>/configure", methods=["GET", "POST"])
+def api_product_configure(product_id):
+    values = request.values
+    if request.method == "POST" and request.is_json:
+        body = request.get_json(silent=True)
+        if not isinstance(body, dict):
+            return jsonify({"error": "JSON bodies must be an object of cfg_<category>: <option index> pairs."}), 400
+        values = {**request.args.to_dict(), **body}
+    elif request.method == "POST" and not request.form and request.get_data():
+        return jsonify({"error": "Send selections as form fields or a JSON object."}), 400
+    selection = _parse_configuration_selection(values)
+    if selection is None:
+        return jsonify({"error": "Selections must be passed as cfg_<category>=<option index> integers."}), 400
+    status, payload = _resolve_configuration_price(product_id, _fetch_catalog_version(), selection)
+    return jsonify(payload), status
+
+
+@app.route("/api/product/<int:product_id>/reviews")
+def api_product_reviews(product_id):
+    after_raw = request.args.get("after", "")
+    after = _to_int(after_raw)
+    if after_raw and after is None:
+        return jsonify({"error": "after must be a review id."}), 400
+    limit = _to_int(request.args.get("limit")) or REVIEWS_PAGE_SIZE
+    reviews, next_after = _fetch_product_reviews(product_id, after=after, limit=max(1, min(limit, REVIEWS_MAX_PAGE_SIZE)))
+    return jsonify({"product_id": product_id, "reviews": reviews, "next_after": next_after})
+
+
+@app.route("/api/moderation/reviews", methods=["GET", "POST"])
+def api_moderation_reviews():
+    if not MODERATION_TOKEN:
+        return jsonify({"error": "Moderation is disabled; set MODERATION_TOKEN to enable it."}), 404
+    if not _moderation_authorized():
+        return jsonify({"error": "A valid X-Moderation-Token header is required."}), 403
+
+    if request.method == "GET":
+        status = request.args.get("status", "pending")
+        if status not in REVIEW_STATUSES:
+            return jsonify({"error": f"status must be one of: {', '.join(REVIEW_STATUSES)}."}), 400
+        limit = _to_int(request.args.get("limit")) or MODERATION_PAGE_SIZE
+        reviews, next_after = _fetch_reviews_for_moderation(
+            status, after=_to_int(request.args.get("after")), limit=max(1, min(limit, MODERATION_PAGE_SIZE))
+        )
+        return jsonify({"status": status, "reviews": reviews, "next_after": next_after})
+
+    actions, error = _parse_moderation_actions(request.get_json(silent=True))
+    if error:
+        return jsonify({"error": error}), 400
+    results, product_ids = _apply_review_moderation(actions)
+    return jsonify(
+        {
+            "updated": sum(result["updated"] for result in results),
+            "actions": [
+                {"status": result["status"], "from_status": result["from_status"], "updated": result["updated"]} for result in results
+            ],
+            "product_ids": product_ids,
+        }
+    )
+
+
+@app.route("/api/product/<int:product_id>/similar")
+def api_product_similar(product_id):
+    limit = _to_int(request.args.get("limit")) or SIMILAR_TOP_K
+    similar = _fetch_similar_products(product_id, limit=max(1, min(limit, SIMILAR_TOP_K)))
+    if not similar and not _fetch_hp_product(product_id):
+        return jsonify({"error": "Product not found."}), 404
+    return jsonify(
+        {
+            "product_id": product_id,
+            "similar": [
+                {
+                    "id": product["id"],
+                    "name": f"{product['brand']} {product['model']}",
+                    "brand": product["brand"],
+                    "series": product["series"],
+                    "price": product["price"],
+                    "cpu": product["cpu_model"],
+                    "gpu": product["gpu_model"],
+                    "ram_gb": product["ram_gb"],
+                    "storage_gb": product["storage_gb"],
+                    "display": f"{product['screen_size']}\" {product['resolution']} {product['refresh_hz']}Hz",
+                    "weight_kg": product["weight_kg"],
+                    "rating": product["rating"],
+                    "image_url": product["image_url"],
+                    "distance": distance,
+                }
+                for product, distance in similar
+            ],
+        }
+    )
+
+
+@app.route("/api/suggest")
+def api_suggest():
+    query = request.args.get("q", "").strip()
+    limit = _to_int(request.args.get("limit")) or SUGGEST_DEFAULT_LIMIT
+    limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
+
+    index = _catalog_cached("suggestions", _fetch_catalog_version(), _build_suggestion_index)
+    response = jsonify({"query": query, "suggestions": _suggest_from_index(index, query, limit)})
+    response.headers["Cache-Control"] = "public, max-age=300"
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+@app.route("/api/timings")
+def api_timings():
+    # Stage latencies are operator data: only holders of the profile token may read them.
+    if not _profile_token_valid():
+        return jsonify({"error": "Not found."}), 404
+    return jsonify({"enabled": STAGE_TIMING_ENABLED, "stages": _stage_timing_summary()})
+
+
 @app.route("/api/laptops")
 def api_laptops():
     use_case = request.args.get("use_case", "all").strip().lower()
@@ -6208,12 +8432,31 @@ def api_laptops():
         if max_price < 0:
             return jsonify({"error": "max_price must be non-negative."}), 400
 
-    filtered = _fetch_hp_products()
-    if use_case and use_case != "all":
-        filtered = [item for item in filtered if use_case in item["use_cases"]]
-
-    if max_price is not None:
-        filtered = [item for item in filtered if item["price"] <= max_price]
+    # Paging is opt-in: without page or per_page every match is returned, as before.
+    paged = "page" in request.args or "per_page" in request.args
+    if "page" in request.args and (_to_int(request.args["page"]) or 0) < 1:
+        return jsonify({"error": "page must be a positive integer."}), 400
+    if "per_page" in request.args and _to_int(request.args["per_page"]) not in FINDER_PER_PAGE_OPTIONS:
+        return jsonify({"error": f"per_page must be one of: {', '.join(str(value) for value in FINDER_PER_PAGE_OPTIONS)}."}), 400
+
+    # The finder's filter set applies here too. Results keep catalog order unless a sort is given;
+    # a text search ranks by relevance, as on /laptops.
+    args = request.args.copy()
+    args["use_case"] = "" if use_case == "all" else use_case
+    filters = _parse_finder_filters(args)
+    if args["use_case"] and not filters["use_case"]:
+        return jsonify([])
+
+    query = _finder_sql_query(filters, rank_search=True)
+    ranked = "sort" in request.args or bool(filters["q"])
+    order_by = _finder_sql_order(filters, rank_search=True) if ranked else PRODUCT_CATALOG_ORDER
+    if paged:
+        # Pages past the end are empty rather than clamped, so clients can page until no results.
+        total = _count_finder_matches(_finder_sql_query(filters), _fetch_finder_version())
+        filtered = _fetch_finder_matches(query, order_by, filters["per_page"], (filters["page"] - 1) * filters["per_page"])
+    else:
+        filtered = _fetch_finder_matches(query, order_by)
+        total = len(filtered)
 
     payload = []
     for item in filtered:
@@ -6234,10 +8477,14 @@ def api_laptops():
                 "battery_capacity_wh": item.get("battery_capacity_wh"),
                 "battery_type": item.get("battery_type", ""),
                 "use_case": item["use_cases"],
+                "community_rating": item["community_rating"],
+                "community_review_count": item["community_review_count"],
             }
         )
 
-    return jsonify(payload)
+    response = jsonify(payload)
+    response.headers["X-Total-Count"] = str(total)
+    return response
 
 
 if __name__ == "__main__":
@@ -0,0 +1,363 @@
+"""In-memory finder engines, pure Python and numpy, and a comparison across catalog sizes.
+
+Usage: python benchmarks/finder_engine.py [--sizes 10,20,30,50,100,300,1000,3000,10000,30000]
+
+The app filters, sorts and pages the finder in SQL (_query_finder_page). The
+list-based engines it used before live here as reference implementations
+for the benchmark suite: matches_filters and sort_laptops are the Python
+loop, and filter_and_rank dispatches between it and the numpy column arrays
+(ENGINE, from FINDER_ENGINE: auto, python or numpy).
+
+For each size the script times filter + rank for a fixed mix of finder
+queries with both engines and prints the per-query mean. The crossover is
+the smallest size from which numpy wins at every larger size in the sweep;
+VECTOR_MIN_ITEMS is set from it, rounded up past the sizes where repeated
+runs disagree.
+"""
+
+import argparse
+import os
+import time
+
+from werkzeug.datastructures import MultiDict
+
+from synthetic import app, synthetic_catalog
+
+np = app.np
+ENGINE = os.getenv("FINDER_ENGINE", "auto").strip().lower() or "auto"
+if ENGINE not in {"auto", "python", "numpy"}:
+    ENGINE = "auto"
+# numpy first wins at 20-30 items, run to run, and leads by 1.8x or more from 50.
+VECTOR_MIN_ITEMS = 50
+
+QUERIES = [
+    {},
+    {"sort": "price_asc"},
+    {"brand": ["Lenovo", "ASUS"], "sort": "rating_desc"},
+    {"use_case": "creator", "ram": ["32"], "sort": "battery_desc"},
+    {"series": ["OMEN"], "panel": ["OLED"], "refresh": ["240+"]},
+    {"gpu_model": ["RTX 4070", "RTX 4060"], "min_price": "90000", "max_price": "220000"},
+    {"q": "legion", "screen_bucket": ["15-16"], "weight_bucket": [">2.0kg"]},
+    {"port": ["Thunderbolt", "HDMI"], "srgb_100": "1", "sort": "weight_asc"},
+]
+
+
+def matches_filters(laptop, filters, search_ranks=None, configurable_ids=None):
+    if filters["q"]:
+        if search_ranks is not None:
+            if laptop["id"] not in search_ranks:
+                return False
+        else:
+            needle = filters["q"].lower()
+            haystack = f"{laptop['brand']} {laptop['model']}".lower()
+            if needle not in haystack:
+                return False
+
+    if filters["use_case"] and filters["use_case"] not in laptop["use_cases"]:
+        return False
+    if filters["brand"] and laptop["brand"] not in filters["brand"]:
+        return False
+    if filters["series"] and not laptop["series_flags"] & app._flag_bits(filters["series"], app.FINDER_SERIES_OPTIONS):
+        return False
+    if filters["min_price"] is not None and laptop["price"] < filters["min_price"]:
+        return False
+    if filters["max_price"] is not None and laptop["price"] > filters["max_price"]:
+        return False
+    if filters["cpu_brand"] and laptop["cpu_brand"] != filters["cpu_brand"]:
+        return False
+    if filters["cpu_tier"] and laptop["cpu_tier"] not in filters["cpu_tier"]:
+        return False
+    if filters["ram"] and laptop["ram_gb"] not in filters["ram"]:
+        return False
+    if filters["storage_type"] and laptop["storage_type"] not in filters["storage_type"]:
+        return False
+    if filters["storage_min"] is not None and laptop["storage_gb"] < filters["storage_min"]:
+        return False
+    if filters["gpu_type"] and laptop["gpu_type"] != filters["gpu_type"]:
+        return False
+    if filters["gpu_model"] and laptop["gpu_model"] not in filters["gpu_model"]:
+        return False
+    if filters["screen_bucket"] and laptop["screen_bucket"] not in filters["screen_bucket"]:
+        return False
+    if filters["resolution"] and laptop["resolution_class"] not in {app._normalize_resolution(value) for value in filters["resolution"]}:
+        return False
+    if filters["refresh"] and laptop["refresh_bucket"] not in filters["refresh"]:
+        return False
+    if filters["panel"] and not laptop["panel_flags"] & app._flag_bits(filters["panel"], app.FINDER_PANELS):
+        return False
+    if filters["weight_bucket"] and laptop["weight_bucket"] not in filters["weight_bucket"]:
+        return False
+    if filters["battery_bucket"] and laptop["battery_bucket"] not in filters["battery_bucket"]:
+        return False
+    if filters["port"] and not all(port in laptop["ports"] for port in filters["port"]):
+        return False
+    if configurable_ids is not None and laptop["id"] not in configurable_ids:
+        return False
+
+    for extra_key, _ in app.FINDER_EXTRA_OPTIONS:
+        if filters[extra_key] and not laptop.get(extra_key, False):
+            return False
+
+    return True
+
+
+def sort_laptops(laptops, sort_key, use_case, search_ranks=None):
+    if sort_key == "price_asc":
+        return sorted(laptops, key=lambda item: (item["price"], -item["rating"]))
+    if sort_key == "price_desc":
+        return sorted(laptops, key=lambda item: (item["price"], item["rating"]), reverse=True)
+    if sort_key == "rating_desc":
+        return sorted(laptops, key=lambda item: (item["rating"], -item["price"]), reverse=True)
+    if sort_key == "community_desc":
+        return sorted(
+            laptops,
+            key=lambda item: (item["community_rating"] or 0, item["community_review_count"], item["rating"]),
+            reverse=True,
+        )
+    if sort_key == "battery_desc":
+        return sorted(laptops, key=lambda item: (item["battery_hours"], item["rating"]), reverse=True)
+    if sort_key == "weight_asc":
+        return sorted(laptops, key=lambda item: (item["weight_kg"], -item["rating"]))
+
+    if search_ranks:
+        # Text searches rank by relevance first; the recommended order breaks ties.
+        laptops = sort_laptops(laptops, sort_key, use_case)
+        return sorted(laptops, key=lambda item: search_ranks.get(item["id"], float("inf")))
+
+    return sorted(
+        laptops,
+        key=lambda item: (
+            1 if use_case and use_case in item["use_cases"] else 0,
+            item["rating"],
+            item["battery_hours"],
+            -item["price"],
+        ),
+        reverse=True,
+    )
+
+
+def _encode_categories(values):
+    vocabulary = {}
+    codes = np.fromiter((vocabulary.setdefault(value, len(vocabulary)) for value in values), dtype=np.int32, count=len(values))
+    return codes, vocabulary
+
+
+def _category_mask(codes, vocabulary, matches):
+    matching_codes = [code for value, code in vocabulary.items() if matches(value)]
+    return np.isin(codes, np.asarray(matching_codes, dtype=np.int32))
+
+
+def _build_arrays(catalog):
+    count = len(catalog)
+
+    def column(key, dtype, convert):
+        return np.fromiter((convert(item[key]) for item in catalog), dtype=dtype, count=count)
+
+    arrays = {
+        "count": count,
+        "id": np.fromiter((item["id"] for item in catalog), dtype=np.int64, count=count),
+        "haystack": np.array([f"{item['brand']} {item['model']}".lower() for item in catalog], dtype=str),
+        "price": column("price", np.int64, lambda value: int(value or 0)),
+        "ram_gb": column("ram_gb", np.int32, lambda value: int(value or 0)),
+        "storage_gb": column("storage_gb", np.int32, lambda value: int(value or 0)),
+        "refresh_hz": column("refresh_hz", np.int32, lambda value: int(value or 0)),
+        "screen_size": column("screen_size", np.float64, lambda value: float(value or 0)),
+        "weight_kg": column("weight_kg", np.float64, lambda value: float(value or 0)),
+        "battery_hours": column("battery_hours", np.float64, lambda value: float(value or 0)),
+        "rating": column("rating", np.float64, lambda value: float(value or 0)),
+        "community_rating": column("community_rating", np.float64, lambda value: float(value or 0)),
+        "community_review_count": column("community_review_count", np.int64, lambda value: int(value or 0)),
+        "use_case_bits": np.fromiter((item["use_case_flags"] or 0 for item in catalog), dtype=np.int32, count=count),
+        "port_bits": np.fromiter((item["port_flags"] or 0 for item in catalog), dtype=np.int32, count=count),
+        "extra_bits": np.fromiter((item["extra_flags"] for item in catalog), dtype=np.int32, count=count),
+        "panel_flags": np.fromiter((item["panel_flags"] or 0 for item in catalog), dtype=np.int32, count=count),
+        "series_flags": np.fromiter((item["series_flags"] or 0 for item in catalog), dtype=np.int32, count=count),
+    }
+    for key in (
+        "brand",
+        "cpu_brand",
+        "cpu_tier",
+        "storage_type",
+        "gpu_type",
+        "gpu_model",
+        "resolution_class",
+        "screen_bucket",
+        "refresh_bucket",
+        "weight_bucket",
+        "battery_bucket",
+    ):
+        arrays[f"{key}_codes"], arrays[f"{key}_vocab"] = _encode_categories([item[key] for item in catalog])
+    return arrays
+
+
+def _search_rank_array(arrays, search_ranks):
+    # Scatter the per-id relevance scores onto catalog positions; products outside the result set get inf.
+    ranks = np.full(arrays["count"], np.inf)
+    if search_ranks:
+        ids = np.fromiter(search_ranks.keys(), dtype=np.int64, count=len(search_ranks))
+        scores = np.fromiter(search_ranks.values(), dtype=np.float64, count=len(search_ranks))
+        order = np.argsort(arrays["id"], kind="stable")
+        positions = np.searchsorted(arrays["id"], ids, sorter=order)
+        positions = np.clip(positions, 0, max(arrays["count"] - 1, 0))
+        found = arrays["id"][order[positions]] == ids if arrays["count"] else np.zeros(len(ids), dtype=bool)
+        ranks[order[positions[found]]] = scores[found]
+    return ranks
+
+
+def _filter_mask(arrays, filters, search_rank_array=None, configurable_ids=None):
+    mask = np.ones(arrays["count"], dtype=bool)
+
+    def category(key, matches):
+        return _category_mask(arrays[f"{key}_codes"], arrays[f"{key}_vocab"], matches)
+
+    if filters["q"]:
+        if search_rank_array is not None:
+            mask &= np.isfinite(search_rank_array)
+        else:
+            mask &= np.char.find(arrays["haystack"], filters["q"].lower()) >= 0
+    if filters["use_case"]:
+        mask &= (arrays["use_case_bits"] & app._flag_bits([filters["use_case"]], app.FINDER_USE_CASES)) != 0
+    if filters["brand"]:
+        mask &= category("brand", lambda value: value in filters["brand"])
+    if filters["series"]:
+        mask &= (arrays["series_flags"] & app._flag_bits(filters["series"], app.FINDER_SERIES_OPTIONS)) != 0
+    if filters["min_price"] is not None:
+        mask &= arrays["price"] >= filters["min_price"]
+    if filters["max_price"] is not None:
+        mask &= arrays["price"] <= filters["max_price"]
+    if filters["cpu_brand"]:
+        mask &= category("cpu_brand", lambda value: value == filters["cpu_brand"])
+    if filters["cpu_tier"]:
+        mask &= category("cpu_tier", lambda value: value in filters["cpu_tier"])
+    if filters["ram"]:
+        mask &= np.isin(arrays["ram_gb"], filters["ram"])
+    if filters["storage_type"]:
+        mask &= category("storage_type", lambda value: value in filters["storage_type"])
+    if filters["storage_min"] is not None:
+        mask &= arrays["storage_gb"] >= filters["storage_min"]
+    if filters["gpu_type"]:
+        mask &= category("gpu_type", lambda value: value == filters["gpu_type"])
+    if filters["gpu_model"]:
+        mask &= category("gpu_model", lambda value: value in filters["gpu_model"])
+    if filters["screen_bucket"]:
+        mask &= category("screen_bucket", lambda value: value in filters["screen_bucket"])
+    if filters["resolution"]:
+        resolution_classes = {app._normalize_resolution(value) for value in filters["resolution"]}
+        mask &= category("resolution_class", lambda value: value in resolution_classes)
+    if filters["refresh"]:
+        mask &= category("refresh_bucket", lambda value: value in filters["refresh"])
+    if filters["panel"]:
+        mask &= (arrays["panel_flags"] & app._flag_bits(filters["panel"], app.FINDER_PANELS)) != 0
+    if filters["weight_bucket"]:
+        mask &= category("weight_bucket", lambda value: value in filters["weight_bucket"])
+    if filters["battery_bucket"]:
+        mask &= category("battery_bucket", lambda value: value in filters["battery_bucket"])
+    if filters["port"]:
+        required_ports = app._flag_bits(filters["port"], app.FINDER_PORT_OPTIONS)
+        mask &= (arrays["port_bits"] & required_ports) == required_ports
+    if configurable_ids is not None:
+        mask &= np.isin(arrays["id"], np.fromiter(configurable_ids, dtype=np.int64, count=len(configurable_ids)))
+
+    required_extras = app._flag_bits([key for key in app.PRODUCT_EXTRA_KEYS if filters[key]], app.PRODUCT_EXTRA_KEYS)
+    if required_extras:
+        mask &= (arrays["extra_bits"] & required_extras) == required_extras
+    return mask
+
+
+def _rank_indexes(arrays, indexes, sort_key, use_case, search_rank_array=None):
+    # np.lexsort is stable and sorts by its last key first, which reproduces the tie-breaking of
+    # the sorted(..., reverse=True) calls in sort_laptops (equal items keep catalog order).
+    price = arrays["price"][indexes]
+    rating = arrays["rating"][indexes]
+    if sort_key == "price_asc":
+        order = np.lexsort((-rating, price))
+    elif sort_key == "price_desc":
+        order = np.lexsort((-rating, -price))
+    elif sort_key == "rating_desc":
+        order = np.lexsort((price, -rating))
+    elif sort_key == "community_desc":
+        order = np.lexsort((-rating, -arrays["community_review_count"][indexes], -arrays["community_rating"][indexes]))
+    elif sort_key == "battery_desc":
+        order = np.lexsort((-rating, -arrays["battery_hours"][indexes]))
+    elif sort_key == "weight_asc":
+        order = np.lexsort((-rating, arrays["weight_kg"][indexes]))
+    else:
+        use_case_bit = app._flag_bits([use_case], app.FINDER_USE_CASES) if use_case else 0
+        use_case_match = ((arrays["use_case_bits"][indexes] & use_case_bit) != 0).astype(np.int8)
+        keys = (price, -arrays["battery_hours"][indexes], -rating, -use_case_match)
+        if search_rank_array is not None:
+            keys += (search_rank_array[indexes],)
+        order = np.lexsort(keys)
+    return indexes[order]
+
+
+def _arrays_for(catalog, catalog_version):
+    return app._catalog_cached("finder_arrays", (catalog_version, len(catalog)), lambda: _build_arrays(catalog))
+
+
+def _use_numpy(catalog):
+    if np is None or ENGINE == "python":
+        return False
+    return ENGINE == "numpy" or len(catalog) >= VECTOR_MIN_ITEMS
+
+
+def filter_and_rank(catalog, filters, catalog_version=None, search_ranks=None, configurable_ids=None, rank=True):
+    # Pure in-memory: callers resolve the DB-backed inputs (search ranks, and configurable ids for the
+    # config_ram/config_gpu filters) and pass them in. With rank=False the matches keep catalog order.
+    if not filters["q"]:
+        search_ranks = None
+    if catalog_version is None or not _use_numpy(catalog):
+        filtered = [item for item in catalog if matches_filters(item, filters, search_ranks, configurable_ids)]
+        return sort_laptops(filtered, filters["sort"], filters["use_case"], search_ranks) if rank else filtered
+
+    arrays = _arrays_for(catalog, catalog_version)
+    search_rank_array = _search_rank_array(arrays, search_ranks) if search_ranks is not None else None
+    indexes = np.flatnonzero(_filter_mask(arrays, filters, search_rank_array, configurable_ids))
+    if not rank:
+        return [catalog[index] for index in indexes.tolist()]
+    ranked_indexes = _rank_indexes(arrays, indexes, filters["sort"], filters["use_case"], search_rank_array)
+    return [catalog[index] for index in ranked_indexes.tolist()]
+
+
+def _time_engine(catalog, parsed_queries, engine, repeat):
+    global ENGINE
+    ENGINE = engine
+    # Build the typed arrays once up front; they are cached per catalog version.
+    for filters in parsed_queries:
+        filter_and_rank(catalog, filters, catalog_version="bench")
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for filters in parsed_queries:
+            filter_and_rank(catalog, filters, catalog_version="bench")
+    return (time.perf_counter() - started) / (repeat * len(parsed_queries))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10,20,30,50,100,300,1000,3000,10000,30000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if np is None:
+        raise SystemExit("numpy is not installed; only the Python engine is available.")
+
+    parsed_queries = [app._parse_finder_filters(MultiDict(query)) for query in QUERIES]
+    crossover = None
+    print(f"{'items':>8} {'python ms':>10} {'numpy ms':>10} {'speedup':>8}")
+    for size in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        catalog = synthetic_catalog(size)
+        app._CATALOG_CACHES.clear()
+        python_seconds = _time_engine(catalog, parsed_queries, "python", args.repeat)
+        numpy_seconds = _time_engine(catalog, parsed_queries, "numpy", args.repeat)
+        speedup = python_seconds / numpy_seconds if numpy_seconds else 0.0
+        if speedup <= 1.0:
+            crossover = None
+        elif crossover is None:
+            crossover = size
+        print(f"{size:>8} {python_seconds * 1000:>10.3f} {numpy_seconds * 1000:>10.3f} {speedup:>7.2f}x")
+
+    print(f"crossover: {crossover if crossover is not None else 'not reached'} items")
+
+
+if __name__ == "__main__":
+    main()
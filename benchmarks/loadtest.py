@@ -0,0 +1,282 @@
+"""Load scenarios for sizing gunicorn workers and timing the catalog seed.
+
+Usage:
+    python benchmarks/loadtest.py http --base-url http://127.0.0.1:8000 [--duration 30] [--concurrency 8]
+    python benchmarks/loadtest.py seed [--repeat 3] [--fixtures DIR] [--warm-lenovo-cache]
+
+http drives a running instance with a weighted route mix (--mix, defaults
+below): faceted /laptops queries across pages, /product/<id> views,
+/compare?ids=, /api/laptops polling and review POSTs. Review POSTs write to
+the target's database; pass --mix review=0 against anything shared.
+Throughput and latency percentiles are reported per route, and --output
+saves them as JSON. Run it once per worker count (gunicorn -w N) at the
+concurrency you expect and pick the count where throughput stops rising.
+
+seed runs the import-time catalog seed (_init_hp_database) in process
+against the local stand-in (standin.py) instead of the HP and Lenovo sites.
+It uses a scratch database and Lenovo cache and never saves the snapshot,
+so data/ is left untouched. Each stage is reported: the HP listing crawl,
+the curated catalog build (including Lenovo page fetches unless
+--warm-lenovo-cache), the upsert, and the whole init.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import HTTPRedirectHandler, Request, build_opener
+
+DEFAULT_MIX = "laptops=45,product=25,compare=10,api_laptops=15,review=5"
+FACETS = [
+    ("brand", ["HP", "Lenovo", "ASUS", "Acer", "MSI", "Dell"]),
+    ("use_case", ["gaming", "creator", "student"]),
+    ("ram", ["16", "32"]),
+    ("gpu_model", ["RTX 4060", "RTX 4070", "RTX 5060", "RTX 5070"]),
+    ("screen_bucket", ["13-14", "15-16", "17+"]),
+    ("refresh", ["144", "165", "240+"]),
+    ("panel", ["IPS", "OLED"]),
+    ("sort", ["price_asc", "price_desc", "rating_desc", "battery_desc"]),
+    ("q", ["omen", "legion", "rog", "rtx"]),
+]
+
+
+class _NoRedirect(HTTPRedirectHandler):
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _parse_mix(raw_mix):
+    weights = {}
+    for part in raw_mix.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip():
+            weights[name.strip()] = float(weight or 0)
+    return {name: weight for name, weight in weights.items() if weight > 0}
+
+
+def _laptops_request(rng, product_ids):
+    params = []
+    for name, values in rng.sample(FACETS, rng.randint(0, 3)):
+        params.append((name, rng.choice(values)))
+    params.append(("per_page", rng.choice(["12", "24", "48"])))
+    params.append(("page", str(rng.choice([1, 1, 1, 2, 3]))))
+    return "/laptops", f"/laptops?{urlencode(params)}", None
+
+
+def _product_request(rng, product_ids):
+    return "/product/<id>", f"/product/{rng.choice(product_ids)}", None
+
+
+def _compare_request(rng, product_ids):
+    ids = rng.sample(product_ids, min(len(product_ids), rng.randint(2, 4)))
+    return "/compare", f"/compare?ids={','.join(str(value) for value in ids)}", None
+
+
+def _api_laptops_request(rng, product_ids):
+    params = rng.choice([{}, {"use_case": "gaming"}, {"max_price": "150000"}, {"use_case": "creator", "max_price": "250000"}])
+    return "/api/laptops", "/api/laptops" + (f"?{urlencode(params)}" if params else ""), None
+
+
+def _review_request(rng, product_ids):
+    form = {
+        "name": f"Load Test {rng.randint(1, 9999)}",
+        "rating": str(rng.randint(1, 5)),
+        "pros": "Fast\nGood screen",
+        "cons": "Heavy\nLoud fans",
+        "experience": "Synthetic review posted by the load test scenario pack.",
+    }
+    return "POST /product/<id>/review", f"/product/{rng.choice(product_ids)}/review", urlencode(form).encode("utf-8")
+
+
+ROUTES = {
+    "laptops": _laptops_request,
+    "product": _product_request,
+    "compare": _compare_request,
+    "api_laptops": _api_laptops_request,
+    "review": _review_request,
+}
+
+
+def _worker(base_url, mix, product_ids, deadline, seed, samples, lock, timeout):
+    rng = random.Random(seed)
+    opener = build_opener(_NoRedirect)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    local = []
+    while time.perf_counter() < deadline:
+        route, path, body = ROUTES[rng.choices(names, weights)[0]](rng, product_ids)
+        request = Request(base_url + path, data=body)
+        started = time.perf_counter()
+        try:
+            with opener.open(request, timeout=timeout) as response:
+                response.read()
+                status = response.status
+        except HTTPError as error:
+            status = error.code
+        except (URLError, OSError):
+            status = 0
+        local.append((route, status, time.perf_counter() - started))
+    with lock:
+        samples.extend(local)
+
+
+def _summarize(samples, elapsed):
+    by_route = {}
+    for route, status, seconds in samples:
+        by_route.setdefault(route, []).append((status, seconds))
+    summary = []
+    for route, entries in sorted(by_route.items()) + [("all", [(status, seconds) for _, status, seconds in samples])]:
+        latencies = sorted(seconds for _, seconds in entries)
+        errors = sum(1 for status, _ in entries if status == 0 or status >= 400)
+        summary.append(
+            {
+                "route": route,
+                "requests": len(entries),
+                "errors": errors,
+                "rps": len(entries) / elapsed if elapsed else 0.0,
+                "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+                "p50_ms": _percentile(latencies, 0.50) * 1000,
+                "p95_ms": _percentile(latencies, 0.95) * 1000,
+                "p99_ms": _percentile(latencies, 0.99) * 1000,
+                "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+            }
+        )
+    return summary
+
+
+def run_http(args):
+    base_url = args.base_url.rstrip("/")
+    mix = _parse_mix(args.mix)
+    unknown = sorted(set(mix) - set(ROUTES))
+    if unknown:
+        raise SystemExit(f"unknown routes in --mix: {', '.join(unknown)} (known: {', '.join(ROUTES)})")
+    with build_opener().open(f"{base_url}/api/laptops", timeout=args.timeout) as response:
+        product_ids = [item["id"] for item in json.load(response)]
+    if not product_ids:
+        raise SystemExit("the target has no products to request")
+
+    samples = []
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = started + args.duration
+    threads = [
+        threading.Thread(target=_worker, args=(base_url, mix, product_ids, deadline, args.seed + index, samples, lock, args.timeout))
+        for index in range(args.concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    summary = _summarize(samples, elapsed)
+    print(f"{base_url}: {args.concurrency} clients for {elapsed:.1f}s")
+    print(f"{'route':<28} {'reqs':>7} {'errors':>7} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for row in summary:
+        print(
+            f"{row['route']:<28} {row['requests']:>7} {row['errors']:>7} {row['rps']:>8.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}"
+        )
+    if args.output:
+        report = {"base_url": base_url, "concurrency": args.concurrency, "duration": elapsed, "mix": mix, "routes": summary}
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+def run_seed(args):
+    from standin import start_standin
+    from synthetic import app, create_database
+
+    server, site, origin = start_standin(fixtures_dir=args.fixtures)
+    # With the override set the app stops saving the snapshot and Lenovo cache; the cache is also
+    # read from a scratch copy so a recently refreshed data/ cache cannot hide the Lenovo fetches.
+    scratch_dir = tempfile.mkdtemp(prefix="laptop-guide-seed-")
+    lenovo_cache_path = os.path.join(scratch_dir, "lenovo_customization_cache.json")
+    source_lenovo_cache_path = app.LENOVO_CUSTOMIZATION_CACHE_PATH
+    app.SCRAPER_ORIGIN_OVERRIDE = origin
+    app.LENOVO_CUSTOMIZATION_CACHE_PATH = lenovo_cache_path
+
+    stages = {"hp_crawl": [], "curated_build": [], "upsert": [], "init_total": []}
+    try:
+        for _ in range(max(1, args.repeat)):
+            if args.warm_lenovo_cache:
+                with open(source_lenovo_cache_path, "r", encoding="utf-8") as cache_file:
+                    cache = json.load(cache_file)
+                for cache_item in cache.values():
+                    cache_item["fetched_at"] = int(time.time())
+                with open(lenovo_cache_path, "w", encoding="utf-8") as cache_file:
+                    json.dump(cache, cache_file)
+            create_database()
+
+            started = time.perf_counter()
+            snapshot_by_sku = {item["sku"]: item for item in app._load_snapshot_catalog() if item.get("sku")}
+            live_catalog = app._fetch_live_hp_catalog(cached_by_sku=snapshot_by_sku)
+            stages["hp_crawl"].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            curated_catalog = app._build_curated_multibrand_products()
+            stages["curated_build"].append(time.perf_counter() - started)
+
+            seed_items = app._merge_catalog_items(live_catalog, curated_catalog)
+            started = time.perf_counter()
+            with app._db_connect() as connection:
+                app._seed_hp_products(connection, seed_items)
+                connection.commit()
+            stages["upsert"].append(time.perf_counter() - started)
+
+            create_database()
+            started = time.perf_counter()
+            app._init_hp_database()
+            stages["init_total"].append(time.perf_counter() - started)
+    finally:
+        server.shutdown()
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    print(f"stand-in at {origin}: {site.requests} page requests, {len(live_catalog)} HP listing items, {len(seed_items)} seeded")
+    print(f"{'stage':<16} {'median ms':>10} {'min ms':>10}")
+    for name, timings in stages.items():
+        print(f"{name:<16} {statistics.median(timings) * 1000:>10.1f} {min(timings) * 1000:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    http_parser = subparsers.add_parser("http", help="drive a running instance with the route mix")
+    http_parser.add_argument("--base-url", default="http://127.0.0.1:5000")
+    http_parser.add_argument("--duration", type=float, default=30.0)
+    http_parser.add_argument("--concurrency", type=int, default=8)
+    http_parser.add_argument("--mix", default=DEFAULT_MIX, help=f"route weights (default {DEFAULT_MIX})")
+    http_parser.add_argument("--timeout", type=float, default=30.0)
+    http_parser.add_argument("--seed", type=int, default=42)
+    http_parser.add_argument("--output", help="write per-route results as JSON")
+
+    seed_parser = subparsers.add_parser("seed", help="time the catalog seed against the local stand-in")
+    seed_parser.add_argument("--repeat", type=int, default=3)
+    seed_parser.add_argument("--fixtures", help="directory of saved HP/Lenovo HTML for the stand-in")
+    seed_parser.add_argument("--warm-lenovo-cache", action="store_true", help="start from a fresh copy of the Lenovo customization cache")
+
+    args = parser.parse_args()
+    if args.command == "http":
+        run_http(args)
+    else:
+        run_seed(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Compare the memory held by dict products and _ProductRecord products.
+
+Usage: python benchmarks/product_memory.py [--sizes 10000,100000]
+
+Both representations are built from the same list-query rows, read from a
+scratch database seeded with the snapshot catalog. The dict side
+mirrors the old _row_to_product output (every field stored as a key, extras
+as six bools); the record side is the slotted _ProductRecord with lazy JSON
+fields left undecoded, as the finder holds them. Rows are allocated before
+tracing starts, so neither side is charged for them even though records keep
+their row alive for lazy decoding.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from synthetic import app, seed_database, snapshot_items
+
+
+def _list_rows(size):
+    with app._db_connect() as connection:
+        base_rows = connection.execute(f"SELECT {app.PRODUCT_LIST_COLUMNS} FROM products").fetchall()
+    rows = []
+    for index in range(size):
+        row = dict(base_rows[index % len(base_rows)])
+        row["id"] = index + 1
+        row["sku"] = f"{row['sku']}-{index}"
+        rows.append(row)
+    return rows
+
+
+def _row_to_dict(row):
+    record = app._row_to_product(row)
+    product = {name: record[name] for name in app.PRODUCT_RECORD_FIELDS + app.PRODUCT_EXTRA_KEYS}
+    product["battery_type"] = record.battery_type
+    product["customization_options"] = record.customization_options
+    return product
+
+
+def _measure(build, rows):
+    gc.collect()
+    tracemalloc.start()
+    products = [build(row) for row in rows]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del products
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000")
+    args = parser.parse_args()
+    seed_database(snapshot_items())
+
+    print(f"{'items':>8} {'dict MB':>9} {'record MB':>10} {'dict B/item':>12} {'record B/item':>14} {'saving':>7}")
+    for size in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        rows = _list_rows(size)
+        dict_bytes = _measure(_row_to_dict, rows)
+        record_bytes = _measure(app._row_to_product, rows)
+        print(
+            f"{size:>8} {dict_bytes / 2**20:>9.1f} {record_bytes / 2**20:>10.1f} "
+            f"{dict_bytes / size:>12.0f} {record_bytes / size:>14.0f} {1 - record_bytes / dict_bytes:>6.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
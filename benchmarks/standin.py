@@ -0,0 +1,222 @@
+"""Local stand-in for the HP India and Lenovo India sites the catalog seed scrapes.
+
+Usage:
+    python benchmarks/standin.py [--port 8765] [--fixtures DIR] [--record]
+
+then start the app with SCRAPER_ORIGIN_OVERRIDE=http://127.0.0.1:8765, which
+makes _fetch_html request http://127.0.0.1:8765/<host><path> instead of the
+real site. While the override is set the app does not save the catalog
+snapshot or the Lenovo customization cache, so stand-in pages never end up
+in data/.
+
+Pages are answered in this order:
+
+1. Saved HTML from --fixtures, stored as DIR/<host>/<quoted path and query>.html.
+   With --record, a missing page is fetched once from the real site and saved,
+   so a fixture set can be captured while online and replayed offline.
+2. Generated pages: HP OMEN and Victus listings (paginated like the real
+   ones) built from the catalog snapshot, and Lenovo product and variant
+   pages rebuilt from the snapshot and the Lenovo customization cache.
+3. 404, which the scraper treats like any unreachable page.
+"""
+
+import argparse
+import os
+import threading
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, urlsplit
+from urllib.request import Request, urlopen
+
+from synthetic import app, hp_listing_html, snapshot_items
+
+HP_LISTING_PER_PAGE = 24
+# Lenovo spec labels as they appear on product pages, keyed by the category the app normalizes them to.
+LENOVO_SPEC_LABELS = {
+    "Processor": "Processor",
+    "Operating System": "Operating System",
+    "Graphics Card": "Graphic Card",
+    "Memory": "Memory",
+    "Storage": "Storage",
+    "Display": "Display",
+    "Keyboard": "Keyboard",
+    "Color": "Color",
+    "Wireless": "WIFI",
+    "Battery": "Battery",
+    "Power Adapter": "AC Adapter / Power Supply",
+    "Warranty & Protection": "Warranty",
+    "Software": "Software Preload",
+}
+
+
+def _lenovo_page_html(product_code, variant_codes, specs, price):
+    spec_rows = ",".join(f'{{"a":"{escape(label)}","b":"{escape(value)}"}}' for label, value in specs.items())
+    return (
+        "<html><head>"
+        f'<meta name="productcode" content="{escape(product_code)}" />'
+        f'<meta name="productcodeimpressions" content="{escape(",".join(variant_codes))}" />'
+        "</head><body>"
+        f'<script type="application/ld+json">{{"@type":"Product","offers":{{"@type":"Offer","price":{int(price)}}}}}</script>'
+        f"<script>window.specs=[{spec_rows}];</script>"
+        "</body></html>"
+    )
+
+
+def _lenovo_fallback_specs(item):
+    return {
+        "Processor": item["cpu_model"],
+        "Graphic Card": item["gpu_model"],
+        "Memory": f"{item['ram_gb']} GB",
+        "Storage": f"{item['storage_gb']} GB SSD",
+        "Display": f"{item['screen_size']} {item['resolution']} {item['refresh_hz']}Hz {item['panel']}",
+    }
+
+
+def _lenovo_pages(items, customization_cache):
+    pages = {}
+    for item in items:
+        if item["brand"] != "Lenovo":
+            continue
+        product_url = app._normalize_catalog_url(item["product_url"])
+        parts = urlsplit(product_url)
+        prefix, tail = parts.path.rsplit("/", 1)
+        cached = (customization_cache.get(product_url) or {}).get("data") or {}
+        categories = (cached.get("configuration") or {}).get("categories", [])
+        if not categories:
+            code = "" if tail.upper().startswith("LEN") else tail.upper()
+            pages[(parts.netloc, parts.path)] = _lenovo_page_html(code, [code] if code else [], _lenovo_fallback_specs(item), item["price_inr"])
+            continue
+
+        variant_codes = []
+        for category in categories:
+            for option in category.get("options", []):
+                for code in app._extract_lenovo_codes_from_detail(option.get("details", "")):
+                    if code not in variant_codes:
+                        variant_codes.append(code)
+        if not tail.upper().startswith("LEN") and tail.upper() not in variant_codes:
+            variant_codes.insert(0, tail.upper())
+
+        for code in variant_codes or [tail.upper()]:
+            specs = {}
+            price = item["price_inr"]
+            for category in categories:
+                options = category.get("options", [])
+                label = LENOVO_SPEC_LABELS.get(category.get("name"))
+                if not options or not label:
+                    continue
+                chosen = next((option for option in options if code in app._extract_lenovo_codes_from_detail(option.get("details", ""))), None)
+                chosen = chosen or next((option for option in options if option.get("included")), options[0])
+                specs[label] = chosen["name"]
+                if not chosen.get("included"):
+                    price += app._extract_price_delta(chosen.get("price_note"))
+            page_code = "" if code.startswith("LEN") else code
+            pages[(parts.netloc, f"{prefix}/{code.lower()}")] = _lenovo_page_html(page_code, variant_codes, specs, max(price, 1))
+        if tail.upper().startswith("LEN"):
+            pages[(parts.netloc, parts.path)] = _lenovo_page_html("", variant_codes, {}, item["price_inr"])
+    return pages
+
+
+def _hp_listing_pages(items, per_page):
+    pages = {}
+    for source in app.HP_GAMING_LISTING_SOURCES:
+        family = source["family"].upper()
+        family_items = [
+            item for item in items if item["brand"] == "HP" and (item["series"].upper().startswith("VICTUS") == (family == "VICTUS"))
+        ]
+        chunks = [family_items[start : start + per_page] for start in range(0, len(family_items), per_page)] or [[]]
+        page_urls = [f"{source['url']}?p={number}" for number in range(1, len(chunks) + 1)] if len(chunks) > 1 else []
+        parts = urlsplit(source["url"])
+        for number, chunk in enumerate(chunks, start=1):
+            key = (parts.netloc, parts.path if number == 1 else f"{parts.path}?p={number}")
+            pages[key] = hp_listing_html(chunk, page_urls)
+    return pages
+
+
+class StandInSite:
+    def __init__(self, fixtures_dir=None, record=False, items=None, per_page=HP_LISTING_PER_PAGE):
+        self.fixtures_dir = fixtures_dir
+        self.record = record and bool(fixtures_dir)
+        items = items if items is not None else snapshot_items()
+        self.pages = _hp_listing_pages(items, per_page)
+        self.pages.update(_lenovo_pages(items, app._load_lenovo_customization_cache()))
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def _fixture_path(self, host, path):
+        return os.path.join(self.fixtures_dir, host, (quote(path, safe="") or "index") + ".html")
+
+    def page(self, host, path):
+        with self.lock:
+            self.requests += 1
+        if self.fixtures_dir:
+            fixture_path = self._fixture_path(host, path)
+            if os.path.exists(fixture_path):
+                with open(fixture_path, "rb") as fixture_file:
+                    return 200, fixture_file.read()
+            if self.record:
+                body = self._record(host, path, fixture_path)
+                if body is not None:
+                    return 200, body
+        body = self.pages.get((host, path))
+        if body is None:
+            return 404, b"not found"
+        return 200, body.encode("utf-8")
+
+    def _record(self, host, path, fixture_path):
+        request = Request(f"https://{host}{path}", headers={"User-Agent": "Mozilla/5.0 (X11; Linux x86_64)"})
+        try:
+            with urlopen(request, timeout=20) as response:
+                body = response.read()
+        except OSError:
+            return None
+        os.makedirs(os.path.dirname(fixture_path), exist_ok=True)
+        with open(fixture_path, "wb") as fixture_file:
+            fixture_file.write(body)
+        return body
+
+
+def _handler_for(site):
+    class StandInHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            host, _, path = self.path.lstrip("/").partition("/")
+            status, body = site.page(host, "/" + path)
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            return
+
+    return StandInHandler
+
+
+def start_standin(host="127.0.0.1", port=0, **site_options):
+    site = StandInSite(**site_options)
+    server = ThreadingHTTPServer((host, port), _handler_for(site))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, site, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", help="directory of saved HTML to replay")
+    parser.add_argument("--record", action="store_true", help="fetch and save pages missing from --fixtures")
+    parser.add_argument("--per-page", type=int, default=HP_LISTING_PER_PAGE, help="cards per generated HP listing page")
+    args = parser.parse_args()
+
+    server, site, origin = start_standin(args.host, args.port, fixtures_dir=args.fixtures, record=args.record, per_page=args.per_page)
+    print(f"stand-in serving {len(site.pages)} generated pages at {origin}")
+    print(f"run the app with SCRAPER_ORIGIN_OVERRIDE={origin}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""Reproducible benchmark suite for the finder, catalog decode and ingestion paths.
+
+Usage:
+    python benchmarks/suite.py [--sizes 200,2000,20000,200000] [--repeat 3] [--output bench.json]
+    python benchmarks/suite.py --compare baseline.json [--input current.json] [--threshold 0.10]
+
+Each case runs against synthetic catalogs of every requested size (see
+synthetic.py; nothing touches the network or the real database):
+
+    finder          _parse_finder_filters + the Python reference engine in finder_engine.py, per query
+    finder_engine   _parse_finder_filters + finder_engine.filter_and_rank (numpy from VECTOR_MIN_ITEMS), per query
+    finder_options  _build_finder_options over the whole catalog, per call
+    decode_list     _row_to_product over the finder's list-column rows, per row
+    decode_full     _row_to_product over SELECT * rows with specs decoded, per row
+    finder_page     _query_finder_page (the route's SQL search, filter, count and page), per query
+    seed_upsert     _seed_hp_products into an empty database, per item
+    seed_reupsert   _seed_hp_products over an already seeded database, per item
+    similar_rebuild _rebuild_similar_products (the top-k similar-laptops table), per item
+    listing_parse   _extract_hp_products_from_listing over a synthetic HP listing, per card
+
+Every case is timed --repeat times and the median is reported, alongside the
+minimum. Results are written as JSON. With --compare, the current results
+(freshly measured, or read from --input) are compared case by case against a
+baseline file and the script exits non-zero when any case got slower by more
+than --threshold.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from werkzeug.datastructures import MultiDict
+
+import finder_engine
+from synthetic import app, create_database, hp_listing_html, seed_database, synthetic_catalog, synthetic_seed_items
+
+DEFAULT_SIZES = "200,2000,20000,200000"
+QUERIES = [
+    {},
+    {"sort": "price_asc"},
+    {"brand": ["Lenovo", "ASUS"], "sort": "rating_desc"},
+    {"use_case": "creator", "ram": ["32"], "sort": "battery_desc"},
+    {"series": ["OMEN"], "panel": ["OLED"], "refresh": ["240+"]},
+    {"gpu_model": ["RTX 4070", "RTX 4060"], "min_price": "90000", "max_price": "220000"},
+    {"q": "legion", "screen_bucket": ["15-16"], "weight_bucket": [">2.0kg"]},
+    {"port": ["Thunderbolt", "HDMI"], "srgb_100": "1", "sort": "weight_asc"},
+]
+
+
+def _time_runs(run, repeat, setup=None):
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _result(case, size, unit, operations, timings):
+    median = statistics.median(timings)
+    return {
+        "case": case,
+        "size": size,
+        "unit": unit,
+        "operations": operations,
+        "repeat": len(timings),
+        "min_seconds": min(timings),
+        "median_seconds": median,
+        "per_op_us": median / operations * 1e6,
+        "ops_per_second": operations / median if median else 0.0,
+    }
+
+
+def _finder_cases(size, repeat):
+    catalog = synthetic_catalog(size)
+    # Queries with q use the substring fallback: FTS5 ranks come from the database, which is timed separately.
+    query_args = [MultiDict(query) for query in QUERIES]
+
+    def run_finder():
+        for args in query_args:
+            filters = app._parse_finder_filters(args)
+            matched = [laptop for laptop in catalog if finder_engine.matches_filters(laptop, filters)]
+            finder_engine.sort_laptops(matched, filters["sort"], filters["use_case"])
+
+    def run_engine():
+        for args in query_args:
+            filters = app._parse_finder_filters(args)
+            finder_engine.filter_and_rank(catalog, filters, catalog_version="bench")
+
+    default_filters = app._parse_finder_filters(MultiDict())
+    app._CATALOG_CACHES.clear()
+    run_engine()
+    return [
+        _result("finder", size, "query", len(query_args), _time_runs(run_finder, repeat)),
+        _result("finder_engine", size, "query", len(query_args), _time_runs(run_engine, repeat)),
+        _result("finder_options", size, "call", 1, _time_runs(lambda: app._build_finder_options(catalog, default_filters), repeat)),
+    ]
+
+
+def _ingest_cases(size, repeat):
+    seed_items = synthetic_seed_items(size)
+    results = [
+        _result("seed_upsert", size, "item", size, _time_runs(lambda: seed_database(seed_items), repeat, setup=create_database)),
+    ]
+
+    def reupsert():
+        with app._db_connect() as connection:
+            app._seed_hp_products(connection, seed_items)
+            connection.commit()
+
+    results.append(_result("seed_reupsert", size, "item", size, _time_runs(reupsert, repeat)))
+
+    def rebuild_similar():
+        with app._db_connect() as connection:
+            app._rebuild_similar_products(connection)
+            connection.commit()
+
+    results.append(_result("similar_rebuild", size, "item", size, _time_runs(rebuild_similar, repeat)))
+
+    with app._db_connect() as connection:
+        list_rows = connection.execute(f"SELECT {app.PRODUCT_LIST_COLUMNS} FROM products").fetchall()
+        full_rows = connection.execute("SELECT * FROM products").fetchall()
+    results.append(_result("decode_list", size, "row", len(list_rows), _time_runs(lambda: [app._row_to_product(row) for row in list_rows], repeat)))
+    results.append(
+        _result("decode_full", size, "row", len(full_rows), _time_runs(lambda: [app._row_to_product(row).specs for row in full_rows], repeat))
+    )
+
+    query_filters = [app._parse_finder_filters(MultiDict(query)) for query in QUERIES]
+
+    def run_pages():
+        for filters in query_filters:
+            app._query_finder_page(filters)
+
+    results.append(_result("finder_page", size, "query", len(query_filters), _time_runs(run_pages, repeat)))
+
+    listing_html = hp_listing_html(seed_items)
+    # Cached battery data keeps the parser from fetching product pages.
+    cached_by_sku = {item["sku"]: item for item in seed_items}
+    source = app.HP_GAMING_LISTING_SOURCES[0]
+    card_count = len(app._extract_hp_products_from_listing(listing_html, source, cached_by_sku=cached_by_sku))
+    results.append(
+        _result(
+            "listing_parse",
+            size,
+            "card",
+            card_count,
+            _time_runs(lambda: app._extract_hp_products_from_listing(listing_html, source, cached_by_sku=cached_by_sku), repeat),
+        )
+    )
+    return results
+
+
+def _git_revision():
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=app.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    return output.stdout.strip()
+
+
+def run_suite(sizes, repeat, seed_cases=True):
+    results = []
+    for size in sizes:
+        print(f"size {size}: finder", file=sys.stderr)
+        results.extend(_finder_cases(size, repeat))
+        if seed_cases:
+            print(f"size {size}: ingest", file=sys.stderr)
+            results.extend(_ingest_cases(size, repeat))
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": app.np.__version__ if app.np is not None else None,
+            "finder_engine": finder_engine.ENGINE,
+            "sizes": sizes,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _print_results(report):
+    print(f"{'case':<16} {'size':>8} {'per op us':>12} {'ops/s':>12} {'median s':>10}")
+    for result in report["results"]:
+        print(
+            f"{result['case']:<16} {result['size']:>8} {result['per_op_us']:>12.2f} "
+            f"{result['ops_per_second']:>12.0f} {result['median_seconds']:>10.4f}"
+        )
+
+
+def compare_reports(baseline, current, threshold):
+    baseline_by_key = {(result["case"], result["size"]): result for result in baseline["results"]}
+    regressions = []
+    print(f"{'case':<16} {'size':>8} {'base us':>12} {'current us':>12} {'change':>8}")
+    for result in current["results"]:
+        key = (result["case"], result["size"])
+        base = baseline_by_key.get(key)
+        if base is None:
+            print(f"{result['case']:<16} {result['size']:>8} {'-':>12} {result['per_op_us']:>12.2f} {'new':>8}")
+            continue
+        change = result["per_op_us"] / base["per_op_us"] - 1 if base["per_op_us"] else 0.0
+        marker = ""
+        if change > threshold:
+            regressions.append(key)
+            marker = "  SLOWER"
+        elif change < -threshold:
+            marker = "  faster"
+        print(f"{result['case']:<16} {result['size']:>8} {base['per_op_us']:>12.2f} {result['per_op_us']:>12.2f} {change:>+8.1%}{marker}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="bench_results.json", help="where to write the JSON results")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare against a previous results file")
+    parser.add_argument("--input", metavar="CURRENT", help="with --compare, read current results instead of measuring")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown treated as a regression")
+    parser.add_argument("--skip-ingest", action="store_true", help="only run the in-memory finder cases")
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, "r", encoding="utf-8") as input_file:
+            report = json.load(input_file)
+    else:
+        sizes = [int(value) for value in args.sizes.split(",") if value.strip()]
+        report = run_suite(sizes, max(1, args.repeat), seed_cases=not args.skip_ingest)
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+        _print_results(report)
+        print(f"results written to {os.path.abspath(args.output)}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        print(f"baseline {baseline['meta'].get('git_revision') or '?'} vs current {report['meta'].get('git_revision') or '?'}")
+        regressions = compare_reports(baseline, report, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
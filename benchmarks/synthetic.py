@@ -0,0 +1,158 @@
+"""Synthetic catalog generation shared by the benchmark scripts.
+
+Everything here runs offline. Importing this module points the app at a
+scratch SQLite database (HP_DB_PATH), turns off the import-time catalog
+crawl (CATALOG_INIT_ON_IMPORT=0) and keeps benchmark counters out of the
+served /metrics totals (METRICS_FLUSH=0), so the real data/ database, metrics
+and the HP and Lenovo sites are never touched.
+
+Catalogs are grown from the snapshot in data/ (the same items the app seeds
+from when the live crawl is unavailable), with prices, ratings, battery life
+and weights jittered so sorting and range filters have realistic spread.
+"""
+
+import os
+import random
+import re
+import sys
+import tempfile
+from html import escape
+
+os.environ.setdefault("CATALOG_INIT_ON_IMPORT", "0")
+os.environ.setdefault("METRICS_FLUSH", "0")
+os.environ.setdefault("HP_DB_PATH", os.path.join(tempfile.gettempdir(), "laptop-guide-bench.db"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+_TEMPLATE_PRODUCTS = []
+FACET_SOURCE_KEYS = ("screen_size", "weight_kg", "battery_hours", "refresh_hz", "resolution", "panel", "series", "use_cases", "ports")
+
+
+def snapshot_items():
+    return app._load_snapshot_catalog() or app.HP_PRODUCTS_SEED
+
+
+def _jitter(rng, price, rating, battery_hours, weight_kg):
+    return {
+        "price": max(20000, int(price * rng.uniform(0.8, 1.2)) // 10 * 10),
+        "rating": round(min(5.0, max(3.0, rating + rng.uniform(-0.4, 0.4))), 1),
+        "battery_hours": round(max(2.0, (battery_hours or 6.0) + rng.uniform(-1.5, 3.5)), 1),
+        "weight_kg": round(max(1.1, (weight_kg or 2.2) + rng.uniform(-0.6, 0.3)), 2),
+    }
+
+
+def synthetic_seed_items(size, seed=42, templates=None):
+    templates = templates or snapshot_items()
+    rng = random.Random(seed)
+    items = []
+    for index in range(size):
+        template = templates[index % len(templates)]
+        jittered = _jitter(rng, template["price_inr"], template["rating"], template.get("battery_hours"), template.get("weight_kg"))
+        # SKUs stay upper-case alphanumeric so the HP listing parser accepts them.
+        sku = f"{template['sku']}X{index:06d}"
+        items.append(
+            dict(
+                template,
+                sku=sku,
+                model=f"{template['model']} #{index}",
+                product_url=template["product_url"].replace(".html", f"-{sku.lower()}.html"),
+                price_inr=jittered["price"],
+                rating=jittered["rating"],
+                battery_hours=jittered["battery_hours"],
+                weight_kg=jittered["weight_kg"],
+            )
+        )
+    return items
+
+
+def create_database(path=None):
+    path = path or app.HP_DB_PATH
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    app.HP_DB_PATH = path
+    with open(app.HP_SCHEMA_PATH, "r", encoding="utf-8") as schema_file:
+        schema_sql = schema_file.read()
+    with app._db_connect() as connection:
+        connection.executescript(schema_sql)
+        app._ensure_products_schema(connection)
+        app._ensure_products_search_index(connection)
+        connection.commit()
+    return path
+
+
+def seed_database(seed_items, path=None):
+    create_database(path)
+    with app._db_connect() as connection:
+        app._seed_hp_products(connection, seed_items)
+        connection.commit()
+
+
+def template_products():
+    if not _TEMPLATE_PRODUCTS:
+        seed_database(snapshot_items())
+        with app._db_connect() as connection:
+            rows = connection.execute(
+                f"SELECT {app.PRODUCT_LIST_COLUMNS} FROM products ORDER BY {app.PRODUCT_CATALOG_ORDER}"
+            ).fetchall()
+        _TEMPLATE_PRODUCTS.extend(app._row_to_product(row) for row in rows)
+    return _TEMPLATE_PRODUCTS
+
+
+def synthetic_catalog(size, seed=42):
+    templates = template_products()
+    rng = random.Random(seed)
+    catalog = []
+    for index in range(size):
+        template = templates[index % len(templates)]
+        jittered = _jitter(rng, template["price"], template["rating"], template["battery_hours"], template["weight_kg"])
+        changes = {
+            "id": index + 1,
+            "sku": f"{template['sku']}-{index}",
+            "model": f"{template['model']} #{index}",
+            "price": jittered["price"],
+            "rating": jittered["rating"],
+            "battery_hours": jittered["battery_hours"],
+            "weight_kg": jittered["weight_kg"],
+        }
+        # The facet buckets are derived at ingest, so the jittered fields need theirs recomputed.
+        changes.update(app._product_facet_columns({**{key: template[key] for key in FACET_SOURCE_KEYS}, **changes}))
+        catalog.append(template.replace(**changes))
+    return catalog
+
+
+def _hp_card_html(item):
+    size_label = f"{item['screen_size']:.1f}".rstrip("0").rstrip(".")
+    config_match = re.search(r"\((\d{2}-[A-Za-z]{2}\d{4}[A-Za-z]{2})\)", item["model"])
+    config_label = config_match.group(1) if config_match else item["sku"]
+    storage_label = f"{item['storage_gb'] // 1024}TB" if item["storage_gb"] >= 1024 else f"{item['storage_gb']}GB"
+    title = (
+        f"HP {item['series']} Gaming Laptop {config_label} ({size_label}), {item['cpu_model']}, "
+        f"{item['gpu_model']}, {item['ram_gb']}GB RAM, {storage_label} SSD"
+    )
+    features = [
+        f"{item['cpu_model']} processor",
+        f"{item['gpu_model']} graphics",
+        f"{item['ram_gb']} GB DDR5 RAM",
+        f"{item['storage_gb']} GB PCIe NVMe SSD",
+        f"({size_label}) {item['resolution']} {item['refresh_hz']}Hz {item['panel']} display",
+    ]
+    feature_html = "".join(f"<li>{escape(row)}</li>" for row in features)
+    return (
+        '<li class="item product product-item"><div class="product-item-info">'
+        f'<a href="{escape(item["product_url"])}" class="product-item-link" data-sku="{item["sku"]}">'
+        f'<img class="product-image-photo" src="{escape(item.get("image_url", ""))}" alt="" /></a>'
+        f'<h2 class="plp-h2-title">{escape(title)}</h2>'
+        f'<span class="price-wrapper" data-price-amount="{item["price_inr"]}"></span>'
+        f'<div class="product-desc-features"><ul>{feature_html}</ul></div>'
+        f'<div data-bv-average-overall-rating="{item["rating"]}"></div>'
+        "</div>"
+    )
+
+
+def hp_listing_html(items, page_urls=()):
+    hp_items = [item for item in items if item["brand"] == "HP" and item["product_url"].startswith("https://www.hp.com/in-en/shop/")]
+    cards = "</li>".join(_hp_card_html(item) for item in hp_items)
+    pager = "".join(f'<a class="page" href="{escape(url)}">{index}</a>' for index, url in enumerate(page_urls, start=1))
+    return f'<html><body><ol class="products list items product-items">{cards}</li></ol><div class="pages">{pager}</div></body></html>'
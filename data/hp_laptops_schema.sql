@@ -37,13 +37,72 @@ CREATE TABLE IF NOT EXISTS products (
     ram_upgradable INTEGER NOT NULL DEFAULT 0,
     extra_ssd_slot INTEGER NOT NULL DEFAULT 0,
     backlit_keyboard INTEGER NOT NULL DEFAULT 0,
+    customization_available INTEGER NOT NULL DEFAULT 0,
+    -- Finder facets derived at ingest (_product_facet_columns).
+    screen_bucket TEXT,
+    weight_bucket TEXT,
+    battery_bucket TEXT,
+    refresh_bucket TEXT,
+    resolution_class TEXT,
+    panel_flags INTEGER NOT NULL DEFAULT 0,
+    series_flags INTEGER NOT NULL DEFAULT 0,
+    use_case_flags INTEGER NOT NULL DEFAULT 0,
+    port_flags INTEGER NOT NULL DEFAULT 0,
     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
+DROP INDEX IF EXISTS idx_products_price;
 CREATE INDEX IF NOT EXISTS idx_products_brand ON products (brand);
 CREATE INDEX IF NOT EXISTS idx_products_gpu_model ON products (gpu_model);
-CREATE INDEX IF NOT EXISTS idx_products_price ON products (price_inr);
+-- One index per finder sort (FINDER_SQL_ORDER_BY), matching its ORDER BY column for column with the
+-- rowid as the last key, so a page is read in index order and stops at its LIMIT. community_desc
+-- orders by review_stats and still sorts its matches.
+CREATE INDEX IF NOT EXISTS idx_products_order_recommended ON products (rating DESC, battery_hours DESC, price_inr);
+CREATE INDEX IF NOT EXISTS idx_products_order_price_asc ON products (price_inr, rating DESC);
+CREATE INDEX IF NOT EXISTS idx_products_order_price_desc ON products (price_inr DESC, rating DESC);
+CREATE INDEX IF NOT EXISTS idx_products_order_rating ON products (rating DESC, price_inr);
+CREATE INDEX IF NOT EXISTS idx_products_order_battery ON products (battery_hours DESC, rating DESC);
+CREATE INDEX IF NOT EXISTS idx_products_order_weight ON products (weight_kg, rating DESC);
+
+-- Configuration option catalogs shared by the variants of a series, keyed by a hash of their content.
+-- products.specs_json refers to a tree and carries only that variant's included options.
+CREATE TABLE IF NOT EXISTS configuration_trees (
+    tree_hash TEXT PRIMARY KEY,
+    tree_json TEXT NOT NULL
+) WITHOUT ROWID;
+
+-- One row per category and option of every configurable product, rebuilt from specs_json at seed time
+-- so "configurable to" filters are an indexed lookup instead of a JSON decode per product.
+CREATE TABLE IF NOT EXISTS configuration_categories (
+    product_id INTEGER NOT NULL,
+    category_index INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    selected_option_index INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (product_id, category_index),
+    FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_configuration_categories_name ON configuration_categories (name, product_id);
+
+CREATE TABLE IF NOT EXISTS configuration_options (
+    product_id INTEGER NOT NULL,
+    category_index INTEGER NOT NULL,
+    option_index INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    option_key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    price_delta INTEGER NOT NULL DEFAULT 0,
+    included INTEGER NOT NULL DEFAULT 0,
+    ram_gb INTEGER,
+    gpu_model TEXT,
+    PRIMARY KEY (product_id, category_index, option_index),
+    FOREIGN KEY (product_id, category_index) REFERENCES configuration_categories(product_id, category_index) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_configuration_options_key ON configuration_options (category, option_key, product_id);
+CREATE INDEX IF NOT EXISTS idx_configuration_options_ram ON configuration_options (ram_gb, product_id) WHERE ram_gb IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_configuration_options_gpu ON configuration_options (gpu_model, product_id) WHERE gpu_model IS NOT NULL;
 
 CREATE TABLE IF NOT EXISTS reviews (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -53,10 +112,107 @@ CREATE TABLE IF NOT EXISTS reviews (
     pros TEXT NOT NULL,
     cons TEXT NOT NULL,
     experience TEXT NOT NULL,
+    pros_points_json TEXT,
+    cons_points_json TEXT,
     status TEXT NOT NULL DEFAULT 'approved',
     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    submission_id TEXT,
     FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE
 );
 
-CREATE INDEX IF NOT EXISTS idx_reviews_product_created ON reviews (product_id, created_at DESC);
+-- Serves the approved-reviews filter and the newest-first keyset order without a sort step.
+DROP INDEX IF EXISTS idx_reviews_product_created;
+CREATE INDEX IF NOT EXISTS idx_reviews_product_status_created ON reviews (product_id, status, created_at, id);
 CREATE INDEX IF NOT EXISTS idx_reviews_status ON reviews (status);
+
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS product_similar (
+    product_id INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    similar_id INTEGER NOT NULL,
+    distance REAL NOT NULL,
+    PRIMARY KEY (product_id, rank)
+) WITHOUT ROWID;
+
+-- Per-product aggregates over approved reviews, kept current by the triggers below so pages and
+-- the finder never scan reviews. review_stats_version changes whenever any aggregate does.
+CREATE TABLE IF NOT EXISTS review_stats (
+    product_id INTEGER PRIMARY KEY,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_1 INTEGER NOT NULL DEFAULT 0,
+    rating_2 INTEGER NOT NULL DEFAULT 0,
+    rating_3 INTEGER NOT NULL DEFAULT 0,
+    rating_4 INTEGER NOT NULL DEFAULT 0,
+    rating_5 INTEGER NOT NULL DEFAULT 0,
+    avg_rating REAL
+);
+
+INSERT OR IGNORE INTO catalog_meta (key, value) VALUES ('review_stats_version', '0');
+
+CREATE TRIGGER IF NOT EXISTS reviews_stats_insert AFTER INSERT ON reviews WHEN NEW.status = 'approved'
+BEGIN
+    INSERT OR IGNORE INTO review_stats (product_id) VALUES (NEW.product_id);
+    UPDATE review_stats SET
+        review_count = review_count + 1,
+        rating_sum = rating_sum + NEW.rating,
+        rating_1 = rating_1 + (NEW.rating = 1),
+        rating_2 = rating_2 + (NEW.rating = 2),
+        rating_3 = rating_3 + (NEW.rating = 3),
+        rating_4 = rating_4 + (NEW.rating = 4),
+        rating_5 = rating_5 + (NEW.rating = 5),
+        avg_rating = ROUND((rating_sum + NEW.rating) * 1.0 / (review_count + 1), 2)
+    WHERE product_id = NEW.product_id;
+    UPDATE catalog_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'review_stats_version';
+END;
+
+CREATE TRIGGER IF NOT EXISTS reviews_stats_delete AFTER DELETE ON reviews WHEN OLD.status = 'approved'
+BEGIN
+    UPDATE review_stats SET
+        review_count = review_count - 1,
+        rating_sum = rating_sum - OLD.rating,
+        rating_1 = rating_1 - (OLD.rating = 1),
+        rating_2 = rating_2 - (OLD.rating = 2),
+        rating_3 = rating_3 - (OLD.rating = 3),
+        rating_4 = rating_4 - (OLD.rating = 4),
+        rating_5 = rating_5 - (OLD.rating = 5),
+        avg_rating = CASE WHEN review_count > 1 THEN ROUND((rating_sum - OLD.rating) * 1.0 / (review_count - 1), 2) END
+    WHERE product_id = OLD.product_id;
+    UPDATE catalog_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'review_stats_version';
+END;
+
+CREATE TRIGGER IF NOT EXISTS reviews_stats_update_old AFTER UPDATE OF product_id, rating, status ON reviews WHEN OLD.status = 'approved'
+BEGIN
+    UPDATE review_stats SET
+        review_count = review_count - 1,
+        rating_sum = rating_sum - OLD.rating,
+        rating_1 = rating_1 - (OLD.rating = 1),
+        rating_2 = rating_2 - (OLD.rating = 2),
+        rating_3 = rating_3 - (OLD.rating = 3),
+        rating_4 = rating_4 - (OLD.rating = 4),
+        rating_5 = rating_5 - (OLD.rating = 5),
+        avg_rating = CASE WHEN review_count > 1 THEN ROUND((rating_sum - OLD.rating) * 1.0 / (review_count - 1), 2) END
+    WHERE product_id = OLD.product_id;
+    UPDATE catalog_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'review_stats_version';
+END;
+
+CREATE TRIGGER IF NOT EXISTS reviews_stats_update_new AFTER UPDATE OF product_id, rating, status ON reviews WHEN NEW.status = 'approved'
+BEGIN
+    INSERT OR IGNORE INTO review_stats (product_id) VALUES (NEW.product_id);
+    UPDATE review_stats SET
+        review_count = review_count + 1,
+        rating_sum = rating_sum + NEW.rating,
+        rating_1 = rating_1 + (NEW.rating = 1),
+        rating_2 = rating_2 + (NEW.rating = 2),
+        rating_3 = rating_3 + (NEW.rating = 3),
+        rating_4 = rating_4 + (NEW.rating = 4),
+        rating_5 = rating_5 + (NEW.rating = 5),
+        avg_rating = ROUND((rating_sum + NEW.rating) * 1.0 / (review_count + 1), 2)
+    WHERE product_id = NEW.product_id;
+    UPDATE catalog_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'review_stats_version';
+END;
@@ -0,0 +1,172 @@
+"""Refresh the laptop catalog database without starting the web app.
+
+Usage:
+    python refresh_catalog.py [--stages crawl,curated,lenovo,upsert] [--dry-run] [--report report.json]
+
+Stages, in pipeline order:
+
+    crawl    HP OMEN and Victus listing crawl (_fetch_live_hp_catalog)
+    curated  curated Dell, Lenovo, MSI, Acer and ASUS variants (_build_curated_catalog_items)
+    lenovo   Lenovo configurator enrichment, through the customization cache
+    upsert   write the merged catalog (_seed_hp_products) and save the snapshot
+
+Each selected stage is timed. Skipped stages fall back the way the app does
+offline: without crawl the saved snapshot stands in for the HP listing, and
+without lenovo the curated Lenovo items keep their built-in configuration.
+lenovo and upsert need curated; without curated, the diff covers HP SKUs only.
+
+Before anything is written, the merged catalog is diffed against the
+database and the added, changed and removed SKUs are reported. --dry-run
+stops there: no database write, no snapshot save, no Lenovo cache save.
+Exits 0 on success and 2 on an invalid stage selection.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+
+os.environ.setdefault("CATALOG_INIT_ON_IMPORT", "0")
+os.environ.setdefault("METRICS_FLUSH", "0")
+
+import app  # noqa: E402
+
+STAGES = ["crawl", "curated", "lenovo", "upsert"]
+
+
+def _parse_stages(raw_stages):
+    stages = [stage.strip() for stage in raw_stages.split(",") if stage.strip()]
+    unknown = sorted(set(stages) - set(STAGES))
+    if unknown:
+        print(f"unknown stages: {', '.join(unknown)} (known: {', '.join(STAGES)})", file=sys.stderr)
+        sys.exit(2)
+    if "curated" not in stages and ({"lenovo", "upsert"} & set(stages)):
+        print("lenovo and upsert need the curated stage; add curated to --stages", file=sys.stderr)
+        sys.exit(2)
+    return [stage for stage in STAGES if stage in stages]
+
+
+def _prepare_database(connection):
+    with open(app.HP_SCHEMA_PATH, "r", encoding="utf-8") as schema_file:
+        connection.executescript(schema_file.read())
+    app._ensure_products_schema(connection)
+    app._ensure_products_search_index(connection)
+    app._ensure_reviews_schema(connection)
+    app._ensure_review_stats(connection)
+
+
+def catalog_diff(connection, seed_items, brands=None):
+    try:
+        existing = {row["sku"]: row for row in connection.execute("SELECT * FROM products").fetchall()}
+    except sqlite3.OperationalError:
+        existing = {}
+    if brands is not None:
+        existing = {sku: row for sku, row in existing.items() if row["brand"] in brands}
+    added, changed = [], []
+    seen = set()
+    for item in seed_items:
+        sku = item["sku"]
+        seen.add(sku)
+        row = existing.get(sku)
+        if row is None:
+            added.append(sku)
+            continue
+        # A database from before a schema change lacks the newer columns until the upsert adds them.
+        columns = set(row.keys())
+        fields = sorted(key for key, value in app._seed_product_row(item).items() if key not in columns or row[key] != value)
+        if fields:
+            changed.append({"sku": sku, "fields": fields})
+    removed = sorted(sku for sku in existing if sku not in seen)
+    return {"added": added, "changed": changed, "removed": removed}
+
+
+def refresh(stages, dry_run=False):
+    timings = {}
+
+    def timed(stage, run):
+        started = time.perf_counter()
+        result = run()
+        timings[stage] = time.perf_counter() - started
+        return result
+
+    # The same live-or-snapshot fallback as an app boot, so both seed the same HP set offline.
+    if "crawl" in stages:
+        hp_items, hp_source = timed("crawl", app._collect_hp_listing_items)
+    else:
+        hp_items, hp_source = app._collect_hp_listing_items(crawl=False)
+    curated_products = []
+    if "curated" in stages:
+        curated_items = timed("curated", app._build_curated_catalog_items)
+        if "lenovo" in stages:
+            curated_items = timed("lenovo", lambda: app._apply_lenovo_official_customization(curated_items, save_cache=not dry_run))
+        curated_products = app._build_curated_multibrand_products(curated_items, enrich_lenovo=False)
+    seed_items = app._merge_catalog_items(hp_items, curated_products)
+
+    with app._db_connect() as connection:
+        if not dry_run:
+            _prepare_database(connection)
+            connection.commit()
+        diff = catalog_diff(connection, seed_items, brands=None if "curated" in stages else {"HP"})
+        if "upsert" in stages and not dry_run:
+
+            def upsert():
+                app._seed_hp_products(connection, seed_items)
+                connection.commit()
+                app._save_snapshot_catalog(seed_items)
+
+            timed("upsert", upsert)
+
+    try:
+        catalog_version = app._fetch_catalog_version()
+    except sqlite3.OperationalError:
+        # A dry run against a database from before catalog_meta existed.
+        catalog_version = ""
+    return {
+        "stages": stages,
+        "dry_run": dry_run,
+        "items": len(seed_items),
+        "hp_listing": hp_source,
+        "timings": timings,
+        "diff": diff,
+        "catalog_version": catalog_version,
+    }
+
+
+def _print_report(report):
+    mode = "dry run" if report["dry_run"] else "refresh"
+    print(
+        f"{mode}: stages {', '.join(report['stages']) or 'none'}; {report['items']} items "
+        f"(HP listing from {report['hp_listing']}); catalog version {report['catalog_version'] or '-'}"
+    )
+    print(f"{'stage':<10} {'seconds':>10}")
+    for stage in STAGES:
+        if stage in report["timings"]:
+            print(f"{stage:<10} {report['timings'][stage]:>10.3f}")
+    diff = report["diff"]
+    print(f"added {len(diff['added'])}, changed {len(diff['changed'])}, removed {len(diff['removed'])}")
+    for sku in diff["added"]:
+        print(f"  + {sku}")
+    for change in diff["changed"]:
+        print(f"  ~ {change['sku']} ({', '.join(change['fields'])})")
+    for sku in diff["removed"]:
+        print(f"  - {sku}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stages", default=",".join(STAGES), help=f"comma-separated stages to run (default {','.join(STAGES)})")
+    parser.add_argument("--dry-run", action="store_true", help="report the diff without writing the database, snapshot or Lenovo cache")
+    parser.add_argument("--report", help="also write the timings and diff as JSON")
+    args = parser.parse_args()
+
+    report = refresh(_parse_stages(args.stages), dry_run=args.dry_run)
+    _print_report(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()